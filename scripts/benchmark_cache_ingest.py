@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark a full rebuild of the local SQLite cache.
+
+Compares the previous ingestion path (to_dicts() and one execute() per row against
+the default rollback journal) with DataCache's bulk path (executemany() over row
+tuples in one transaction, WAL, synchronous=NORMAL, indexes built after the load).
+
+Usage:
+    python scripts/benchmark_cache_ingest.py [--rows 1000000]
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+import polars as pl
+
+from ll2cz.cache import DataCache
+
+
+def make_usage_frame(rows: int) -> pl.DataFrame:
+    """Build a synthetic frame shaped like LiteLLMDatabase.get_usage_data()."""
+    models = ['gpt-4o', 'gpt-4o-mini', 'claude-3-5-sonnet', 'claude-3-haiku', 'gemini-1.5-pro']
+    providers = ['openai', 'openai', 'anthropic', 'anthropic', 'vertex_ai']
+    i = pl.col('i')
+    return pl.DataFrame({'i': pl.int_range(0, rows, eager=True)}).select(
+        id=i.cast(pl.Utf8).str.zfill(12),
+        date=(pl.date(2025, 1, 1) + pl.duration(days=i % 365)).cast(pl.Utf8),
+        entity_id=pl.lit('user-') + (i % 500).cast(pl.Utf8),
+        entity_type=pl.lit('user'),
+        api_key=pl.lit('sk-') + (i % 200).cast(pl.Utf8),
+        model=(i % len(models)).replace_strict(list(range(len(models))), models),
+        model_group=pl.lit('default'),
+        custom_llm_provider=(i % len(providers)).replace_strict(list(range(len(providers))), providers),
+        prompt_tokens=i % 5000,
+        completion_tokens=i % 2000,
+        spend=(i % 1000) / 997.0,
+        api_requests=i % 50,
+        successful_requests=i % 50,
+        failed_requests=i % 2,
+        cache_creation_input_tokens=i % 3,
+        cache_read_input_tokens=i % 5,
+        created_at=pl.lit('2025-06-01 12:00:00'),
+        updated_at=pl.lit('2025-06-01 12:00:00'),
+    )
+
+
+def ingest_per_row(cache_file: Path, data: pl.DataFrame) -> None:
+    """Previous ingestion path: one execute() per record with indexes in place."""
+    conn = sqlite3.connect(cache_file)
+    try:
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.execute("DELETE FROM consolidated_spend")
+        records = data.to_dicts()
+        columns = list(records[0].keys())
+        insert_sql = (f"INSERT INTO consolidated_spend ({', '.join(columns)}) "
+                      f"VALUES ({', '.join('?' for _ in columns)})")
+        for record in records:
+            conn.execute(insert_sql, [record.get(col) for col in columns])
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def ingest_bulk(cache: DataCache, data: pl.DataFrame) -> None:
+    """Current ingestion path, as used by DataCache._update_cache() for a full reload."""
+    conn = sqlite3.connect(cache.cache_file)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        cache._drop_indexes(conn)
+        conn.execute("DELETE FROM consolidated_spend")
+        cache._write_records(conn, data, upsert=False)
+        cache._create_indexes(conn)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows to ingest (default: 1,000,000)')
+    args = parser.parse_args()
+
+    data = make_usage_frame(args.rows)
+    print(f"Rebuilding cache with {args.rows:,} rows")
+
+    results = {}
+    for name in ('per-row', 'bulk'):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = DataCache(Path(tmp_dir))
+            start = time.perf_counter()
+            if name == 'per-row':
+                ingest_per_row(cache.cache_file, data)
+            else:
+                ingest_bulk(cache, data)
+            elapsed = time.perf_counter() - start
+            results[name] = elapsed
+            print(f"  {name:8} {elapsed:8.2f}s  {args.rows / elapsed:>12,.0f} rows/sec")
+
+    print(f"  speedup  {results['per-row'] / results['bulk']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark building a billing_drops request body for one day of CBF rows.
+
+Compares the previous per-row conversion (iter_rows, Python string formatting, httpx's
+json encoder) with the columnar serializer in ll2cz.payload.
+
+Usage:
+    python scripts/benchmark_payload.py [--rows 500000]
+"""
+
+import argparse
+import json
+import time
+
+import polars as pl
+
+from ll2cz.output import CloudZeroStreamer
+from ll2cz.payload import serialize_billing_drop
+
+
+def make_cbf_day(rows: int) -> pl.DataFrame:
+    """Build a day of CBF rows with hourly timestamps."""
+    return pl.DataFrame({
+        'time/usage_start': [f'2025-01-15T{i % 24:02d}:00:00Z' for i in range(rows)],
+        'cost/cost': [0.0001 * (i % 97) for i in range(rows)],
+        'usage/amount': [i % 4096 for i in range(rows)],
+        'usage/units': ['tokens'] * rows,
+        'resource/service': ['openai'] * rows,
+        'resource/id': [f'czrn:litellm:openai:cross-region:team-{i % 50}:llm-usage:gpt-4o' for i in range(rows)],
+        'resource/tag:team_id': [f'team-{i % 50}' for i in range(rows)],
+        'lineitem/type': ['Usage'] * rows,
+    })
+
+
+def per_row_payload(streamer: CloudZeroStreamer, batch_data: pl.DataFrame) -> bytes:
+    """The previous implementation: one dict per row, encoded the way httpx encodes json=."""
+    data_records = []
+    for row in batch_data.iter_rows(named=True):
+        record = {}
+        for key, value in row.items():
+            if value is None:
+                continue
+            if isinstance(value, float):
+                record[key] = f"{value:.10f}".rstrip('0').rstrip('.')
+            elif isinstance(value, int):
+                record[key] = str(value)
+            else:
+                record[key] = value
+        timestamp = streamer._parse_and_convert_timestamp(record['time/usage_start'])
+        record['time/usage_start'] = timestamp.isoformat().replace('+00:00', 'Z')
+        data_records.append(record)
+    payload = {'month': '2025-01', 'operation': 'replace_hourly', 'data': data_records}
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), allow_nan=False).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=500_000, help='CBF rows in the day (default: 500000)')
+    args = parser.parse_args()
+
+    streamer = CloudZeroStreamer('benchmark-key', 'benchmark-connection')
+    data = make_cbf_day(args.rows)
+    print(f"Building a billing drop for {len(data):,} rows")
+
+    start = time.perf_counter()
+    expected = json.loads(per_row_payload(streamer, data))
+    per_row = time.perf_counter() - start
+
+    start = time.perf_counter()
+    month, encoded = streamer._encode_batch('2025-01-15', data)
+    body = serialize_billing_drop(month, 'replace_hourly', encoded['record'])
+    columnar = time.perf_counter() - start
+
+    assert json.loads(body) == expected, "columnar payload differs from the per-row payload"
+    print(f"  per-row   {per_row:8.3f}s")
+    print(f"  columnar  {columnar:8.3f}s  ({per_row / columnar:.0f}x, {len(body) / 1e6:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark CBF generation: DataProcessor row path vs the columnar transform_frame().
+
+Both paths run over the same synthetic user-table frame and their records are compared
+before timings are reported.
+
+Usage:
+    python scripts/benchmark_transform.py [--rows 1000000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_cache_ingest import make_usage_frame  # noqa: E402
+
+from ll2cz.data_processor import DataProcessor  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows to transform (default: 1,000,000)')
+    args = parser.parse_args()
+
+    data = make_usage_frame(args.rows)
+    print(f"Transforming {args.rows:,} rows")
+
+    start = time.perf_counter()
+    _, row_records, _ = DataProcessor(source='usertable').process_dataframe(data)
+    row_elapsed = time.perf_counter() - start
+    print(f"  {'row path':16}{row_elapsed:8.2f}s  {args.rows / row_elapsed:>12,.0f} rows/sec")
+
+    start = time.perf_counter()
+    frame = DataProcessor(source='usertable').transform_frame(data)
+    frame_elapsed = time.perf_counter() - start
+    print(f"  {'transform_frame':16}{frame_elapsed:8.2f}s  {args.rows / frame_elapsed:>12,.0f} rows/sec")
+
+    if DataProcessor.records_from_frame(frame) != row_records:
+        raise SystemExit("transform_frame() output differs from the row path")
+    print(f"  {'speedup':16}{row_elapsed / frame_elapsed:8.2f}x (outputs identical)")
+
+
+if __name__ == "__main__":
+    main()
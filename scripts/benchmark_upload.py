@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark CloudZeroStreamer uploads against a local stub of the AnyCost billing_drops API.
+
+The stub server accepts every drop after a fixed delay (simulating API latency), so the
+run measures how well daily batches overlap at each upload concurrency. Gzip-compressed
+bodies are decompressed by the stub, and the bytes received are reported.
+
+Usage:
+    python scripts/benchmark_upload.py [--days 30] [--rows-per-day 2000] [--latency 0.2] [--compression gzip]
+"""
+
+import argparse
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import polars as pl
+
+from ll2cz.output import CloudZeroStreamer
+
+
+def make_stub_server(latency: float) -> ThreadingHTTPServer:
+    """Start a threaded HTTP server on a free local port that answers POSTs with 200.
+
+    The server's bytes_received attribute counts request body bytes as sent on the wire.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            self.server.bytes_received += len(body)
+            if self.headers.get('Content-Encoding') == 'gzip':
+                gzip.decompress(body)
+            time.sleep(latency)
+            body = b'{"status": "success"}'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.bytes_received = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_cbf_frame(days: int, rows_per_day: int) -> pl.DataFrame:
+    """Build CBF rows spread evenly over the first `days` days of January 2025."""
+    rows = days * rows_per_day
+    return pl.DataFrame({
+        'time/usage_start': [f'2025-01-{i // rows_per_day + 1:02d}T00:00:00Z' for i in range(rows)],
+        'cost/cost': [0.0001 * (i % 97) for i in range(rows)],
+        'usage/amount': [i % 4096 for i in range(rows)],
+        'usage/units': ['tokens'] * rows,
+        'resource/service': ['openai'] * rows,
+        'resource/id': ['openai/gpt-4o'] * rows,
+        'lineitem/type': ['Usage'] * rows,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--days', type=int, default=30, help='Daily batches to upload (default: 30, max 31)')
+    parser.add_argument('--rows-per-day', type=int, default=2000, help='CBF rows per day (default: 2000)')
+    parser.add_argument('--latency', type=float, default=0.2, help='Stub server delay per drop in seconds (default: 0.2)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8],
+                        help='Upload concurrency levels to compare (default: 1 4 8)')
+    parser.add_argument('--compression', choices=['gzip'], help='Compress request bodies (default: none)')
+    args = parser.parse_args()
+
+    server = make_stub_server(args.latency)
+    data = make_cbf_frame(min(args.days, 31), args.rows_per_day)
+    print(f"Uploading {len(data):,} rows in {min(args.days, 31)} daily batches "
+          f"({args.latency:.2f}s stub latency per drop)")
+
+    try:
+        for concurrency in args.concurrency:
+            server.bytes_received = 0
+            with CloudZeroStreamer('benchmark-key', 'benchmark-connection', upload_concurrency=concurrency,
+                                   compression=args.compression) as streamer:
+                streamer.base_url = f"http://127.0.0.1:{server.server_port}"
+                streamer.console.quiet = True
+
+                start = time.perf_counter()
+                results = streamer.send_batched(data)
+                elapsed = time.perf_counter() - start
+
+            print(f"  concurrency {concurrency:<3}{elapsed:8.2f}s  {len(results) / elapsed:8.1f} batches/sec  "
+                  f"{server.bytes_received / 1e6:8.1f} MB sent")
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
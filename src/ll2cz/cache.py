@@ -5,9 +5,9 @@
 
 import hashlib
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import polars as pl
 from rich.console import Console
@@ -18,6 +18,20 @@ from .database import LiteLLMDatabase
 class DataCache:
     """SQLite-based cache for LiteLLM data with freshness checking."""
 
+    # Rows per executemany() call when ingesting into the cache
+    INGEST_BATCH_SIZE = 50000
+
+    # How far before the SpendLogs watermark each incremental sync re-reads
+    SPEND_LOGS_LOOKBACK = timedelta(hours=1)
+
+    # Secondary indexes on consolidated_spend as (index name, column)
+    CACHE_INDEXES = [
+        ('idx_entity_type', 'entity_type'),
+        ('idx_date', 'date'),
+        ('idx_model', 'model'),
+        ('idx_provider', 'custom_llm_provider'),
+    ]
+
     def __init__(self, cache_dir: Optional[Path] = None):
         """Initialize cache with specified directory."""
         self.console = Console()
@@ -35,6 +49,9 @@ class DataCache:
         """Initialize SQLite cache database with tables."""
         conn = sqlite3.connect(self.cache_file)
         try:
+            # WAL lets readers proceed during a refresh and makes bulk writes cheaper; it persists in the file
+            conn.execute("PRAGMA journal_mode=WAL")
+
             # Cache metadata table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache_metadata (
@@ -70,15 +87,24 @@ class DataCache:
             """)
 
             # Create indexes for performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_entity_type ON consolidated_spend(entity_type)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_date ON consolidated_spend(date)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_model ON consolidated_spend(model)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_provider ON consolidated_spend(custom_llm_provider)")
+            self._create_indexes(conn)
 
             conn.commit()
         finally:
             conn.close()
 
+    def _create_indexes(self, conn: sqlite3.Connection) -> None:
+        """Create the secondary indexes for the columns present in consolidated_spend."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(consolidated_spend)").fetchall()}
+        for index_name, column in self.CACHE_INDEXES:
+            if column in columns:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON consolidated_spend({column})")
+
+    def _drop_indexes(self, conn: sqlite3.Connection) -> None:
+        """Drop the secondary indexes so a bulk load doesn't maintain them row by row."""
+        for index_name, _ in self.CACHE_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+
     def _get_connection_hash(self, connection_string: str) -> str:
         """Generate a hash for the database connection for cache key."""
         return hashlib.sha256(connection_string.encode()).hexdigest()[:16]
@@ -105,13 +131,126 @@ class DataCache:
         finally:
             conn.close()
 
-    def _is_cache_empty(self) -> bool:
+    def _is_cache_empty(self, connection_string: Optional[str] = None) -> bool:
         """Check if the cache has any data."""
+        return self._count_cached_records(connection_string) == 0
+
+    def _count_cached_records(self, connection_string: Optional[str] = None) -> int:
+        """Count the records held in the cache."""
         conn = sqlite3.connect(self.cache_file)
         try:
             cursor = conn.execute("SELECT COUNT(*) FROM consolidated_spend")
-            count = cursor.fetchone()[0]
-            return count == 0
+            return cursor.fetchone()[0]
+        finally:
+            conn.close()
+
+    def _get_cached_columns(self, connection_string: str) -> set:
+        """Get the column names the cache can hold."""
+        conn = sqlite3.connect(self.cache_file)
+        try:
+            cursor = conn.execute("PRAGMA table_info(consolidated_spend)")
+            return {row[1] for row in cursor.fetchall()}
+        finally:
+            conn.close()
+
+    def _store_records(self, connection_string: str, data: pl.DataFrame, replace: bool) -> int:
+        """Store fetched records, either replacing the cached data or upserting into it."""
+        conn = sqlite3.connect(self.cache_file)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+            # Everything below runs in a single transaction
+            if not replace:
+                record_count = self._write_records(conn, data, upsert=True)
+            else:
+                # Full reload: build the secondary indexes once at the end instead of per row
+                self._drop_indexes(conn)
+                conn.execute("DELETE FROM consolidated_spend")
+                record_count = self._write_records(conn, data, upsert=False)
+                self._create_indexes(conn)
+            conn.commit()
+            return record_count
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _cached_records_query(limit: Optional[int] = None, start_date: Optional[str] = None,
+                              end_date: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """Build the query reading cached records, filtering by date range before applying the limit."""
+        conditions = []
+        params = []
+        if start_date:
+            conditions.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            conditions.append("date <= ?")
+            params.append(end_date)
+
+        query = "SELECT * FROM consolidated_spend"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY date DESC, created_at DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        return query, params
+
+    def _read_cached_records(self, connection_string: str, limit: Optional[int] = None,
+                             start_date: Optional[str] = None, end_date: Optional[str] = None) -> pl.DataFrame:
+        """Read cached records, filtering by date range before applying the limit."""
+        query, params = self._cached_records_query(limit, start_date, end_date)
+        conn = sqlite3.connect(self.cache_file)
+        try:
+            # Use polars to read from SQLite
+            if params:
+                return pl.read_database(query, conn, execute_options={"parameters": params})
+            return pl.read_database(query, conn)
+        finally:
+            conn.close()
+
+    def _iter_cached_records(self, connection_string: str, batch_size: int, limit: Optional[int] = None,
+                             start_date: Optional[str] = None,
+                             end_date: Optional[str] = None) -> Iterator[pl.DataFrame]:
+        """Stream cached records in the order _read_cached_records returns them, batch_size rows at a time."""
+        query, params = self._cached_records_query(limit, start_date, end_date)
+        yield from self._iter_query(query, params, batch_size)
+
+    def _iter_query(self, query: str, params: List[Any], batch_size: int) -> Iterator[pl.DataFrame]:
+        """Stream a query against the cache database with fetchmany, batch_size rows at a time."""
+        conn = sqlite3.connect(self.cache_file)
+        try:
+            cursor = conn.cursor()
+            try:
+                yield from pl.read_database(
+                    query,
+                    cursor,
+                    iter_batches=True,
+                    batch_size=batch_size,
+                    execute_options={"parameters": params} if params else None
+                )
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    def _get_cached_breakdown(self, connection_string: str) -> Dict[str, int]:
+        """Get cached record counts by entity type."""
+        conn = sqlite3.connect(self.cache_file)
+        try:
+            cursor = conn.execute("""
+                SELECT entity_type, COUNT(*)
+                FROM consolidated_spend
+                GROUP BY entity_type
+            """)
+            return dict(cursor.fetchall())
+        finally:
+            conn.close()
+
+    def _clear_cached_records(self, connection_string: Optional[str] = None) -> None:
+        """Remove cached records."""
+        conn = sqlite3.connect(self.cache_file)
+        try:
+            conn.execute("DELETE FROM consolidated_spend")
+            conn.commit()
         finally:
             conn.close()
 
@@ -132,22 +271,28 @@ class DataCache:
             try:
                 conn = database.connect()
 
-                # Get latest created_at from each table
+                # Get latest created_at/updated_at from each table; daily spend rows are
+                # updated in place, so new inserts alone don't reveal every change
                 latest_timestamps = {}
+                latest_updates = {}
                 for table_type in ['user', 'team', 'tag']:
                     table_name = f"LiteLLM_Daily{table_type.title()}Spend"
                     try:
                         cursor = conn.cursor()
-                        cursor.execute(f'SELECT MAX(created_at) FROM "{table_name}"')
+                        cursor.execute(f'SELECT MAX(created_at), MAX(updated_at) FROM "{table_name}"')
                         result = cursor.fetchone()
                         if result and result[0]:
                             latest_timestamps[table_type] = str(result[0])
+                        if result and result[1]:
+                            latest_updates[table_type] = str(result[1])
                     except Exception:
                         # Table might be empty or not exist
                         latest_timestamps[table_type] = None
+                        latest_updates[table_type] = None
 
                 server_stats['latest_timestamps'] = latest_timestamps
-                conn.close()
+                server_stats['latest_updates'] = latest_updates
+                database._close_connection(conn)
 
             except Exception:
                 # Fallback if detailed timestamp query fails
@@ -197,119 +342,169 @@ class DataCache:
             if cached_timestamps != server_timestamps:
                 return False
 
+            if cached_stats.get('latest_updates', {}) != server_stats.get('latest_updates', {}):
+                return False
+
             return True
 
         except (json.JSONDecodeError, KeyError):
             return False
 
-    def _update_cache(self, database: LiteLLMDatabase, connection_string: str) -> None:
-        """Update cache with fresh data from server."""
-        self.console.print("[blue]Updating local cache with fresh data...[/blue]")
+    @staticmethod
+    def _get_change_watermark(data: pl.DataFrame) -> Optional[str]:
+        """Get the latest updated_at (falling back to created_at) in a frame as a timestamp string."""
+        columns = [pl.col(col).cast(pl.Utf8) for col in ('updated_at', 'created_at') if col in data.columns]
+        if not columns or data.is_empty():
+            return None
+        return data.select(pl.coalesce(columns).max()).item()
+
+    def _write_records(self, conn: sqlite3.Connection, data: pl.DataFrame, upsert: bool = True) -> int:
+        """Write records into the cache, optionally upserting on (id, entity_type).
+
+        Rows are bound as tuples straight from the frame with executemany() in batches of
+        INGEST_BATCH_SIZE; the caller owns the transaction. Plain inserts are used after the
+        table has been emptied, where there is nothing to conflict with.
+        """
+        if data.is_empty():
+            return 0
+
+        columns = data.columns
+        placeholders = ', '.join(['?' for _ in columns])
+        column_names = ', '.join(columns)
+
+        insert_sql = f"INSERT INTO consolidated_spend ({column_names}) VALUES ({placeholders})"
+        if upsert:
+            updates = ', '.join(f"{col} = excluded.{col}" for col in columns if col not in ('id', 'entity_type'))
+            insert_sql += f" ON CONFLICT(id, entity_type) DO UPDATE SET {updates}"
+
+        for batch in data.iter_slices(n_rows=self.INGEST_BATCH_SIZE):
+            conn.executemany(insert_sql, batch.iter_rows())
+
+        return len(data)
+
+    def _update_cache(self, database: LiteLLMDatabase, connection_string: str, full_refresh: bool = False) -> None:
+        """Update cache with fresh data from server.
+
+        When a change watermark from a previous sync exists, only rows inserted or updated since
+        then are fetched and upserted. A full reload is done on the first sync, when full_refresh
+        is set, or when the cached row count no longer matches the server (rows were deleted).
+        """
+        conn_hash = self._get_connection_hash(connection_string)
+        watermark_key = f"sync_watermark_{conn_hash}"
+        watermark = (None if full_refresh or self._is_cache_empty(connection_string)
+                     else self._get_cache_metadata(watermark_key))
+
+        if watermark:
+            self.console.print(f"[blue]Syncing local cache with changes since {watermark}...[/blue]")
+        else:
+            self.console.print("[blue]Updating local cache with fresh data...[/blue]")
 
-        # Get all data from server
         try:
-            data = database.get_usage_data()
+            data = database.get_usage_data(updated_since=watermark) if watermark else database.get_usage_data()
             self.console.print(f"[dim]Fetched {len(data):,} records from server[/dim]")
         except Exception as e:
             self.console.print(f"[red]Error fetching data from server: {e}[/red]")
             return
 
-        if data.is_empty():
+        if data.is_empty() and not watermark:
             self.console.print("[yellow]No data found on server[/yellow]")
             return
 
-        # Clear existing cache data
-        conn = sqlite3.connect(self.cache_file)
-        try:
-            conn.execute("DELETE FROM consolidated_spend")
-
-            # Insert new data with dynamic column handling
-            records = data.to_dicts()
-            if records:
-                # Get column names from actual data
-                columns = list(records[0].keys())
-                placeholders = ', '.join(['?' for _ in columns])
-                column_names = ', '.join(columns)
-
-                insert_sql = f"INSERT INTO consolidated_spend ({column_names}) VALUES ({placeholders})"
-
-                for record in records:
-                    values = [record.get(col) for col in columns]
-                    conn.execute(insert_sql, values)
-
-            conn.commit()
-
-            # Update cache metadata
-            server_stats = self._check_server_freshness(database)
-            conn_hash = self._get_connection_hash(connection_string)
-            cache_key = f"server_stats_{conn_hash}"
-
-            import json
-            self._set_cache_metadata(cache_key, json.dumps(server_stats))
-            self._set_cache_metadata(f"last_update_{conn_hash}", datetime.now().isoformat())
+        record_count = self._store_records(connection_string, data, replace=not watermark)
+        cache_count = self._count_cached_records(connection_string)
 
-            self.console.print(f"[green]Cache updated with {len(records):,} records[/green]")
+        server_stats = self._check_server_freshness(database)
+        if watermark and server_stats.get('server_available', True) is not False:
+            server_count = server_stats.get('table_breakdown', {}).get('user_spend')
+            if server_count is not None and server_count != cache_count:
+                # Deletions can't be seen through the watermark
+                self.console.print("[dim]Cached row count differs from server - performing full refresh[/dim]")
+                self._update_cache(database, connection_string, full_refresh=True)
+                return
 
-        finally:
-            conn.close()
+        # Update cache metadata
+        import json
+        self._set_cache_metadata(f"server_stats_{conn_hash}", json.dumps(server_stats))
+        self._set_cache_metadata(f"last_update_{conn_hash}", datetime.now().isoformat())
+        new_watermark = self._get_change_watermark(data)
+        if new_watermark and (not watermark or new_watermark > watermark):
+            self._set_cache_metadata(watermark_key, new_watermark)
 
-    def _check_schema_mismatch(self, database: LiteLLMDatabase, connection_string: str) -> bool:
-        """Check if the database schema has changed compared to cached schema."""
+        if watermark:
+            self.console.print(f"[green]Cache synced: {record_count:,} new or updated records[/green]")
+        else:
+            self.console.print(f"[green]Cache updated with {record_count:,} records[/green]")
+
+    @staticmethod
+    def _sqlite_type(polars_dtype: pl.DataType) -> str:
+        """Map a polars dtype to the SQLite column type used in the cache."""
+        if polars_dtype in [pl.Int32, pl.Int64]:
+            return "INTEGER"
+        if polars_dtype in [pl.Float32, pl.Float64] or isinstance(polars_dtype, pl.Decimal):
+            return "REAL"
+        if polars_dtype == pl.Boolean:
+            return "INTEGER"  # SQLite stores booleans as integers
+        return "TEXT"
+
+    @staticmethod
+    def _get_schema_fingerprint(schema: Dict[str, pl.DataType]) -> str:
+        """Hash column names and dtypes into a short fingerprint."""
+        import json
+        description = json.dumps([[name, str(dtype)] for name, dtype in schema.items()])
+        return hashlib.sha256(description.encode()).hexdigest()[:16]
+
+    def _check_schema_mismatch(self, database: LiteLLMDatabase, connection_string: str,
+                               server_schema: Optional[Dict[str, pl.DataType]] = None) -> bool:
+        """Check if the database schema has changed compared to cached schema.
+
+        The server schema comes from a LIMIT 0 probe. Its fingerprint is remembered in
+        cache_metadata once the cache table is known to cover it, so the common case is a
+        single string comparison.
+        """
         try:
-            # Get current database columns from fresh data sample
-            fresh_data = database.get_usage_data()
-            if fresh_data.is_empty():
-                return False
+            if server_schema is None:
+                server_schema = database.get_usage_data_schema()
 
-            database_columns = set(fresh_data.columns)
+            fingerprint = self._get_schema_fingerprint(server_schema)
+            fingerprint_key = f"schema_fingerprint_{self._get_connection_hash(connection_string)}"
+            if self._get_cache_metadata(fingerprint_key) == fingerprint:
+                return False
 
             # Get cached table columns
-            conn = sqlite3.connect(self.cache_file)
-            try:
-                cursor = conn.execute("PRAGMA table_info(consolidated_spend)")
-                cache_columns = {row[1] for row in cursor.fetchall()}
-            finally:
-                conn.close()
+            cache_columns = self._get_cached_columns(connection_string)
 
             # Check if database has columns that cache doesn't have
-            missing_columns = database_columns - cache_columns
+            missing_columns = set(server_schema) - cache_columns
             if missing_columns:
                 self.console.print(f"[dim]Cache missing columns: {', '.join(sorted(missing_columns))}[/dim]")
                 return True
 
+            self._set_cache_metadata(fingerprint_key, fingerprint)
             return False
 
         except Exception:
             # If we can't check schema, assume no mismatch
             return False
 
-    def _recreate_cache_schema(self, database: LiteLLMDatabase) -> None:
+    def _recreate_cache_schema(self, database: LiteLLMDatabase,
+                               server_schema: Optional[Dict[str, pl.DataType]] = None) -> None:
         """Recreate cache table schema to match current database schema."""
         try:
-            # Get fresh data to determine all columns and their types
-            fresh_data = database.get_usage_data()
-            if fresh_data.is_empty():
-                return
+            # Determine all columns and their types without fetching any rows
+            if server_schema is None:
+                server_schema = database.get_usage_data_schema()
 
             conn = sqlite3.connect(self.cache_file)
             try:
                 # Drop existing table
                 conn.execute("DROP TABLE IF EXISTS consolidated_spend")
 
-                # Create new table with dynamic schema based on actual data
+                # Create new table with dynamic schema based on the probed query schema
                 # Use polars schema info to determine SQLite column types
                 column_definitions = []
 
-                for col_name, polars_dtype in fresh_data.schema.items():
-                    # Map polars types to SQLite types
-                    if polars_dtype in [pl.Int32, pl.Int64]:
-                        sql_type = "INTEGER"
-                    elif polars_dtype in [pl.Float32, pl.Float64]:
-                        sql_type = "REAL"
-                    elif polars_dtype == pl.Boolean:
-                        sql_type = "INTEGER"  # SQLite stores booleans as integers
-                    else:
-                        sql_type = "TEXT"
+                for col_name, polars_dtype in server_schema.items():
+                    sql_type = self._sqlite_type(polars_dtype)
 
                     # Handle special columns
                     if col_name in ['id', 'entity_type']:
@@ -327,12 +522,7 @@ class DataCache:
                 conn.execute(create_sql)
 
                 # Recreate indexes for performance
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_entity_type ON consolidated_spend(entity_type)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_date ON consolidated_spend(date)")
-                if 'model' in fresh_data.columns:
-                    conn.execute("CREATE INDEX IF NOT EXISTS idx_model ON consolidated_spend(model)")
-                if 'custom_llm_provider' in fresh_data.columns:
-                    conn.execute("CREATE INDEX IF NOT EXISTS idx_provider ON consolidated_spend(custom_llm_provider)")
+                self._create_indexes(conn)
 
                 conn.commit()
                 self.console.print("[blue]Cache schema updated to match database[/blue]")
@@ -344,14 +534,38 @@ class DataCache:
             self.console.print(f"[red]Failed to recreate cache schema: {e}[/red]")
 
     def get_cached_data(self, database: Optional[LiteLLMDatabase], connection_string: str,
-                       limit: Optional[int] = None, force_refresh: bool = False) -> pl.DataFrame:
+                       limit: Optional[int] = None, force_refresh: bool = False,
+                       start_date: Optional[str] = None, end_date: Optional[str] = None) -> pl.DataFrame:
         """Get data from cache, refreshing if necessary.
 
+        start_date/end_date restrict the cached rows to an inclusive date range before limit is applied.
+
         Note: force_refresh is kept for internal use by the refresh_cache command.
         Users should use 'cache refresh' command to update cache."""
+        self._refresh_if_needed(database, connection_string, force_refresh)
 
+        # Load data from cache, filtering by date range before applying the limit
+        result = self._read_cached_records(connection_string, limit=limit, start_date=start_date, end_date=end_date)
+        if result.is_empty():
+            self.console.print("[dim]Cache is empty - no data available[/dim]")
+        return result
+
+    def iter_cached_data(self, database: Optional[LiteLLMDatabase], connection_string: str,
+                         batch_size: int = LiteLLMDatabase.DEFAULT_BATCH_SIZE, limit: Optional[int] = None,
+                         start_date: Optional[str] = None, end_date: Optional[str] = None) -> Iterator[pl.DataFrame]:
+        """Stream data from cache in batches of at most batch_size rows, refreshing first if necessary.
+
+        Rows come in the same order and with the same filters as get_cached_data().
+        """
+        self._refresh_if_needed(database, connection_string)
+        yield from self._iter_cached_records(connection_string, batch_size, limit=limit,
+                                             start_date=start_date, end_date=end_date)
+
+    def _refresh_if_needed(self, database: Optional[LiteLLMDatabase], connection_string: str,
+                           force_refresh: bool = False) -> None:
+        """Sync the cache from the server when it is empty, stale or its schema changed."""
         # First check if cache is empty and force refresh if so
-        cache_empty = self._is_cache_empty()
+        cache_empty = self._is_cache_empty(connection_string)
         if cache_empty and database is not None:
             self.console.print("[blue]Cache is empty - forcing initial refresh...[/blue]")
             force_refresh = True
@@ -359,7 +573,13 @@ class DataCache:
         # Check if we should use server or cache
         if database is not None:
             # Check for schema mismatch and force refresh if needed
-            schema_mismatch = self._check_schema_mismatch(database, connection_string)
+            try:
+                server_schema = database.get_usage_data_schema()
+            except Exception:
+                server_schema = None
+            schema_mismatch = server_schema is not None and self._check_schema_mismatch(
+                database, connection_string, server_schema
+            )
             if schema_mismatch:
                 self.console.print("[blue]Schema change detected - forcing cache refresh...[/blue]")
                 force_refresh = True
@@ -370,8 +590,10 @@ class DataCache:
             if server_available:
                 if force_refresh or not self._is_cache_fresh(connection_string, server_stats):
                     if schema_mismatch:
-                        self._recreate_cache_schema(database)
-                    self._update_cache(database, connection_string)
+                        self._recreate_cache_schema(database, server_schema)
+                        # Records the fingerprint of the schema the cache now covers
+                        self._check_schema_mismatch(database, connection_string, server_schema)
+                    self._update_cache(database, connection_string, full_refresh=schema_mismatch)
                 else:
                     self.console.print("[dim]Using cached data (fresh)[/dim]")
             else:
@@ -379,21 +601,177 @@ class DataCache:
         else:
             self.console.print("[yellow]⚠️  No server connection - using cached data (may be out of date)[/yellow]")
 
-        # Load data from cache
-        query = "SELECT * FROM consolidated_spend ORDER BY date DESC, created_at DESC"
-        if limit:
-            query += f" LIMIT {limit}"
+    def _get_spend_logs_table(self, connection_string: str) -> str:
+        """Get the name of the SpendLogs table holding rows for one connection."""
+        return f"spend_logs_{self._get_connection_hash(connection_string)}"
+
+    def _get_spend_logs_columns(self, conn: sqlite3.Connection, table: str) -> List[str]:
+        """Get the columns of a cached SpendLogs table (empty when it doesn't exist yet)."""
+        return [row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()]
+
+    @staticmethod
+    def _prepare_spend_logs(data: pl.DataFrame) -> pl.DataFrame:
+        """Convert a SpendLogs batch to SQLite-friendly values.
+
+        Timestamps and dates become sortable text and decimals become floats, so rows read
+        back from the cache look like rows read from a SQLite LiteLLM database.
+        """
+        conversions = []
+        for column, dtype in data.schema.items():
+            if column == 'date' and dtype == pl.Utf8:
+                # SQLite sources return the full startTime for the date column
+                conversions.append(pl.col(column).str.slice(0, 10))
+            elif isinstance(dtype, pl.Datetime):
+                conversions.append(pl.col(column).dt.strftime('%Y-%m-%d %H:%M:%S%.6f'))
+            elif dtype == pl.Date:
+                conversions.append(pl.col(column).dt.strftime('%Y-%m-%d'))
+            elif isinstance(dtype, pl.Decimal):
+                conversions.append(pl.col(column).cast(pl.Float64))
+        return data.with_columns(conversions) if conversions else data
+
+    def _append_spend_logs(self, conn: sqlite3.Connection, table: str, data: pl.DataFrame) -> int:
+        """Append a SpendLogs batch, ignoring request_ids that are already cached."""
+        if data.is_empty():
+            return 0
+
+        data = self._prepare_spend_logs(data)
+        existing_columns = self._get_spend_logs_columns(conn, table)
+        if not existing_columns:
+            column_definitions = [f"{col} {self._sqlite_type(dtype)}" for col, dtype in data.schema.items()
+                                  if col != 'request_id']
+            conn.execute(f"""
+                CREATE TABLE {table} (
+                    request_id TEXT PRIMARY KEY,
+                    {', '.join(column_definitions)}
+                )
+            """)
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_start_time ON {table}(start_time)")
+        else:
+            # New columns on the server are added rather than forcing a re-download
+            for col, dtype in data.schema.items():
+                if col not in existing_columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} {self._sqlite_type(dtype)}")
+
+        columns = data.columns
+        insert_sql = (f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) "
+                      f"VALUES ({', '.join(['?' for _ in columns])})")
+        before = conn.total_changes
+        for batch in data.iter_slices(n_rows=self.INGEST_BATCH_SIZE):
+            conn.executemany(insert_sql, batch.iter_rows())
+        return conn.total_changes - before
+
+    def _sync_spend_logs(self, database: LiteLLMDatabase, connection_string: str) -> None:
+        """Append SpendLogs rows that started since the last sync.
+
+        SpendLogs rows are immutable once written, so the cache is append-only keyed by
+        request_id, in a table of its own per connection. Each sync re-reads SPEND_LOGS_LOOKBACK before the stored startTime
+        watermark to pick up rows the proxy flushed late; already-cached ids are ignored.
+        """
+        table = self._get_spend_logs_table(connection_string)
+        watermark_key = f"spend_logs_watermark_{self._get_connection_hash(connection_string)}"
+        watermark = self._get_cache_metadata(watermark_key)
+        started_since = None
+        if watermark:
+            lookback_start = datetime.fromisoformat(watermark) - self.SPEND_LOGS_LOOKBACK
+            started_since = lookback_start.strftime('%Y-%m-%d %H:%M:%S.%f')
+            self.console.print(f"[dim]Syncing SpendLogs cache with rows since {started_since}...[/dim]")
+        else:
+            self.console.print("[blue]Populating local SpendLogs cache...[/blue]")
 
         conn = sqlite3.connect(self.cache_file)
         try:
-            # Use polars to read from SQLite
-            result = pl.read_database(query, conn)
-            if result.is_empty():
-                self.console.print("[dim]Cache is empty - no data available[/dim]")
-            return result
+            conn.execute("PRAGMA synchronous=NORMAL")
+            added = 0
+            new_watermark = watermark
+            for batch in database.iter_spend_logs_for_analysis(started_since=started_since):
+                added += self._append_spend_logs(conn, table, batch)
+                batch_max = self._prepare_spend_logs(batch.select('start_time'))['start_time'].max()
+                if batch_max and (new_watermark is None or batch_max > new_watermark):
+                    new_watermark = batch_max
+            conn.commit()
+        finally:
+            conn.close()
+
+        if new_watermark and new_watermark != watermark:
+            self._set_cache_metadata(watermark_key, new_watermark)
+        self.console.print(f"[dim]Cached {added:,} new SpendLogs records[/dim]")
+
+    def get_cached_spend_logs(self, database: Optional[LiteLLMDatabase], connection_string: str,
+                              start_date: Optional[str] = None, end_date: Optional[str] = None,
+                              limit: Optional[int] = None) -> pl.DataFrame:
+        """Get enriched SpendLogs rows from the local cache, syncing new rows first when online.
+
+        start_date/end_date are inclusive YYYY-MM-DD bounds on the startTime day; limit is applied
+        after the date filter, newest first.
+        """
+        self._sync_spend_logs_if_connected(database, connection_string)
+
+        table = self._get_spend_logs_table(connection_string)
+        conn = sqlite3.connect(self.cache_file)
+        try:
+            if not self._get_spend_logs_columns(conn, table):
+                return pl.DataFrame()
+
+            query, params = self._cached_spend_logs_query(table, limit, start_date, end_date)
+            if params:
+                return pl.read_database(query, conn, execute_options={"parameters": params})
+            return pl.read_database(query, conn)
         finally:
             conn.close()
 
+    def iter_cached_spend_logs(self, database: Optional[LiteLLMDatabase], connection_string: str,
+                               batch_size: int = LiteLLMDatabase.DEFAULT_BATCH_SIZE,
+                               start_date: Optional[str] = None, end_date: Optional[str] = None,
+                               limit: Optional[int] = None) -> Iterator[pl.DataFrame]:
+        """Stream cached SpendLogs rows in batches of at most batch_size rows (see get_cached_spend_logs)."""
+        self._sync_spend_logs_if_connected(database, connection_string)
+
+        table = self._get_spend_logs_table(connection_string)
+        conn = sqlite3.connect(self.cache_file)
+        try:
+            if not self._get_spend_logs_columns(conn, table):
+                return
+        finally:
+            conn.close()
+
+        query, params = self._cached_spend_logs_query(table, limit, start_date, end_date)
+        yield from self._iter_query(query, params, batch_size)
+
+    def _sync_spend_logs_if_connected(self, database: Optional[LiteLLMDatabase], connection_string: str) -> None:
+        """Sync new SpendLogs rows when a server connection is available, warning otherwise."""
+        if database is not None:
+            try:
+                self._sync_spend_logs(database, connection_string)
+            except Exception as e:
+                self.console.print(f"[yellow]⚠️  SpendLogs sync failed - using cached data (may be out of date): "
+                                   f"{e}[/yellow]")
+        else:
+            self.console.print("[yellow]⚠️  No server connection - using cached SpendLogs (may be out of date)[/yellow]")
+
+    @staticmethod
+    def _cached_spend_logs_query(table: str, limit: Optional[int] = None, start_date: Optional[str] = None,
+                                 end_date: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """Build the query reading cached SpendLogs, newest first."""
+        # Half-open [start_date, end_date + 1 day) range on the sortable start_time text,
+        # which keeps the whole end_date day whatever the time format
+        conditions = []
+        params = []
+        if start_date:
+            conditions.append("start_time >= ?")
+            params.append(start_date)
+        if end_date:
+            next_day = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
+            conditions.append("start_time < ?")
+            params.append(next_day.strftime('%Y-%m-%d'))
+
+        query = f"SELECT * FROM {table}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY start_time DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        return query, params
+
     def get_cache_info(self, connection_string: str) -> Dict[str, Any]:
         """Get information about cached data."""
         conn_hash = self._get_connection_hash(connection_string)
@@ -402,20 +780,15 @@ class DataCache:
         last_update = self._get_cache_metadata(f"last_update_{conn_hash}")
         server_stats_str = self._get_cache_metadata(f"server_stats_{conn_hash}")
 
-        # Get cache record count
+        # Get cache record count and breakdown by entity type
+        cache_count = self._count_cached_records(connection_string)
+        breakdown = self._get_cached_breakdown(connection_string)
+
+        spend_logs_table = self._get_spend_logs_table(connection_string)
         conn = sqlite3.connect(self.cache_file)
         try:
-            cursor = conn.execute("SELECT COUNT(*) FROM consolidated_spend")
-            cache_count = cursor.fetchone()[0]
-
-            # Get cache breakdown by entity type
-            cursor = conn.execute("""
-                SELECT entity_type, COUNT(*)
-                FROM consolidated_spend
-                GROUP BY entity_type
-            """)
-            breakdown = dict(cursor.fetchall())
-
+            spend_logs_count = (conn.execute(f"SELECT COUNT(*) FROM {spend_logs_table}").fetchone()[0]
+                                if self._get_spend_logs_columns(conn, spend_logs_table) else 0)
         finally:
             conn.close()
 
@@ -423,6 +796,7 @@ class DataCache:
             'cache_file': str(self.cache_file),
             'record_count': cache_count,
             'breakdown': breakdown,
+            'spend_logs_count': spend_logs_count,
             'last_update': last_update
         }
 
@@ -437,16 +811,22 @@ class DataCache:
 
     def clear_cache(self, connection_string: Optional[str] = None) -> None:
         """Clear cached data."""
+        self._clear_cached_records(connection_string)
+
         conn = sqlite3.connect(self.cache_file)
         try:
-            conn.execute("DELETE FROM consolidated_spend")
-
             if connection_string:
-                # Clear specific connection metadata
+                # Clear specific connection SpendLogs and metadata
                 conn_hash = self._get_connection_hash(connection_string)
+                conn.execute(f"DROP TABLE IF EXISTS {self._get_spend_logs_table(connection_string)}")
                 conn.execute("DELETE FROM cache_metadata WHERE key LIKE ?", (f"%{conn_hash}%",))
             else:
-                # Clear all metadata
+                # Clear all SpendLogs tables and metadata
+                tables = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'spend_logs%'"
+                ).fetchall()
+                for (table,) in tables:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
                 conn.execute("DELETE FROM cache_metadata")
 
             conn.commit()
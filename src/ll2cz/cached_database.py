@@ -3,38 +3,59 @@
 
 """Cached database wrapper that provides offline support and data freshness management."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import polars as pl
 from rich.console import Console
 
 from .cache import DataCache
 from .database import LiteLLMDatabase
+from .parquet_cache import ParquetDataCache
 
 
 class CachedLiteLLMDatabase:
     """Cached wrapper for LiteLLM database with offline support."""
 
-    def __init__(self, connection_string: Optional[str] = None, cache_dir: Optional[str] = None):
-        """Initialize cached database wrapper."""
+    CACHE_BACKENDS = ('sqlite', 'parquet')
+
+    def __init__(self, connection_string: Optional[str] = None, cache_dir: Optional[str] = None,
+                 engine: str = 'psycopg', cache_backend: str = 'sqlite',
+                 partitions: int = LiteLLMDatabase.DEFAULT_PARTITIONS):
+        """Initialize cached database wrapper.
+
+        Args:
+            connection_string: LiteLLM database connection URL
+            cache_dir: Optional cache directory (defaults to ~/.ll2cz/cache)
+            engine: Server extraction engine passed to LiteLLMDatabase ('psycopg' or 'connectorx')
+            cache_backend: Local storage for cached spend: 'sqlite' (single table) or
+                'parquet' (date-partitioned files read with predicate pushdown)
+            partitions: Parallel date-range partitions passed to LiteLLMDatabase for connectorx reads
+        """
+        if cache_backend not in self.CACHE_BACKENDS:
+            raise ValueError(f"Invalid cache backend: {cache_backend}. "
+                             f"Must be one of: {', '.join(self.CACHE_BACKENDS)}")
+
         self.connection_string = connection_string
-        self.cache = DataCache(cache_dir)
+        self.engine = engine
+        self.partitions = partitions
+        self.cache = ParquetDataCache(cache_dir) if cache_backend == 'parquet' else DataCache(cache_dir)
         self.console = Console()
 
         # Only create database connection if connection string provided
         self.database: Optional[LiteLLMDatabase] = None
         if connection_string:
             try:
-                self.database = LiteLLMDatabase(connection_string)
+                self.database = LiteLLMDatabase(connection_string, engine=engine, partitions=partitions)
                 # Test connection
                 conn = self.database.connect()
-                conn.close()
+                self.database._close_connection(conn)
             except Exception:
                 # Server unavailable, will use cache only
                 self.database = None
 
-    def get_usage_data(self, limit: Optional[int] = None) -> pl.DataFrame:
-        """Get usage data from cache."""
+    def get_usage_data(self, limit: Optional[int] = None, start_date: Optional[str] = None,
+                       end_date: Optional[str] = None) -> pl.DataFrame:
+        """Get usage data from cache, optionally restricted to an inclusive date range."""
         if not self.connection_string:
             raise ValueError("No database connection string provided")
 
@@ -42,7 +63,24 @@ class CachedLiteLLMDatabase:
             self.database,
             self.connection_string,
             limit=limit,
-            force_refresh=False
+            force_refresh=False,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+    def iter_usage_data(self, batch_size: int = LiteLLMDatabase.DEFAULT_BATCH_SIZE, limit: Optional[int] = None,
+                        start_date: Optional[str] = None, end_date: Optional[str] = None) -> Iterator[pl.DataFrame]:
+        """Stream usage data from cache in batches of at most batch_size rows (see get_usage_data)."""
+        if not self.connection_string:
+            raise ValueError("No database connection string provided")
+
+        yield from self.cache.iter_cached_data(
+            self.database,
+            self.connection_string,
+            batch_size=batch_size,
+            limit=limit,
+            start_date=start_date,
+            end_date=end_date
         )
 
     def get_spend_analysis_data(self, limit: Optional[int] = None) -> pl.DataFrame:
@@ -52,14 +90,14 @@ class CachedLiteLLMDatabase:
 
         # For spend analysis, get fresh data directly from database to include both user and team data
         if not self.database:
-            self.database = LiteLLMDatabase(self.connection_string)
+            self.database = LiteLLMDatabase(self.connection_string, engine=self.engine)
 
         return self.database.get_spend_analysis_data(limit=limit)
 
     def get_table_info(self) -> Dict[str, Any]:
         """Get table information from cache."""
         # Force a cache refresh if empty, then get fresh cache info
-        if self.cache._is_cache_empty() and self.database:
+        if self.cache._is_cache_empty(self.connection_string) and self.database:
             try:
                 self.cache.get_cached_data(self.database, self.connection_string or "", limit=1)
             except Exception:
@@ -203,9 +241,46 @@ class CachedLiteLLMDatabase:
 
         return self.database.get_spend_logs_data(limit=limit)
 
-    def get_spend_logs_for_analysis(self, limit: Optional[int] = None) -> pl.DataFrame:
-        """Get enriched SpendLogs data for CZRN/CBF analysis (no caching for transaction-level data)."""
-        if not self.database:
-            raise ConnectionError("SpendLogs analysis data requires active server connection")
+    def get_spend_logs(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                       limit: Optional[int] = None) -> pl.DataFrame:
+        """Get enriched SpendLogs data from the local append-only cache.
 
-        return self.database.get_spend_logs_for_analysis(limit=limit)
+        New rows are ingested from the server by startTime watermark before reading; offline,
+        previously cached rows are returned.
+
+        Args:
+            start_date: Optional first day (YYYY-MM-DD) of startTime to include
+            end_date: Optional last day (YYYY-MM-DD) of startTime to include
+            limit: Optional maximum number of records, applied after the date filter
+        """
+        if not self.connection_string:
+            raise ValueError("No database connection string provided")
+
+        return self.cache.get_cached_spend_logs(
+            self.database,
+            self.connection_string,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit
+        )
+
+    def get_spend_logs_for_analysis(self, limit: Optional[int] = None, start_date: Optional[str] = None,
+                                    end_date: Optional[str] = None) -> pl.DataFrame:
+        """Get enriched SpendLogs data for CZRN/CBF analysis (served from the SpendLogs cache)."""
+        return self.get_spend_logs(start_date=start_date, end_date=end_date, limit=limit)
+
+    def iter_spend_logs_for_analysis(self, batch_size: int = LiteLLMDatabase.DEFAULT_BATCH_SIZE,
+                                     limit: Optional[int] = None, start_date: Optional[str] = None,
+                                     end_date: Optional[str] = None) -> Iterator[pl.DataFrame]:
+        """Stream enriched SpendLogs data from the SpendLogs cache in batches of at most batch_size rows."""
+        if not self.connection_string:
+            raise ValueError("No database connection string provided")
+
+        yield from self.cache.iter_cached_spend_logs(
+            self.database,
+            self.connection_string,
+            batch_size=batch_size,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit
+        )
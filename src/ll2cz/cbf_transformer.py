@@ -5,7 +5,6 @@
 
 from typing import Any, Dict, List, Tuple, Union
 
-import polars as pl
 from rich.console import Console
 
 from .cached_database import CachedLiteLLMDatabase
@@ -13,20 +12,29 @@ from .chunked_processor import ChunkedDataProcessor
 from .data_processor import DataProcessor
 from .data_source_strategy import DataSourceFactory
 from .database import LiteLLMDatabase
+from .rollup import rollup_spend_logs
 
 
 class CBFTransformer:
     """Transform LiteLLM data to CloudZero Billing Format with database integration."""
 
-    def __init__(self, database: Union[LiteLLMDatabase, CachedLiteLLMDatabase], timezone: str = 'UTC'):
+    def __init__(self, database: Union[LiteLLMDatabase, CachedLiteLLMDatabase], timezone: str = 'UTC',
+                 workers: int = 1, rollup: bool = False):
         """Initialize transformer with database connection.
 
         Args:
             database: LiteLLM database connection
             timezone: Timezone for date operations
+            workers: Number of worker processes for chunked processing of large datasets
+            rollup: Aggregate SpendLogs rows per hour before transforming (source 'logs' only)
         """
+        if workers < 1:
+            raise ValueError(f"Invalid workers: {workers}. Must be at least 1")
+
         self.database = database
         self.timezone = timezone
+        self.workers = workers
+        self.rollup = rollup
         self.console = Console()
 
     def transform(self, limit: int = 10000, source: str = 'usertable') -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
@@ -42,6 +50,8 @@ class CBFTransformer:
         # Load data using strategy pattern
         strategy = DataSourceFactory.create_strategy(source)
         data = strategy.get_data(self.database, date_filter=None, limit=limit)
+        if self.rollup and source == 'logs':
+            data = rollup_spend_logs(data)
 
         if data.is_empty():
             return [], {
@@ -56,23 +66,15 @@ class CBFTransformer:
         if len(data) > 50000:
             self.console.print("[dim]Using chunked processing for large dataset...[/dim]")
             processor = DataProcessor(source=source)
-            chunked_processor = ChunkedDataProcessor(chunk_size=10000, show_progress=True)
-
-            all_cbf_records = []
-            def collect_results(cbf_records, error_summary):
-                all_cbf_records.extend(cbf_records)
-
-            total_records, successful_records, error_summary = chunked_processor.process_dataframe_chunked(
-                data, processor, callback=collect_results
-            )
-            cbf_records = all_cbf_records
+            chunked_processor = ChunkedDataProcessor(chunk_size=10000, show_progress=True, workers=self.workers)
+            cbf_df = chunked_processor.transform_dataframe(data, processor)
         else:
             processor = DataProcessor(source=source)
-            _, cbf_records, error_summary = processor.process_dataframe(data)
+            cbf_df = DataProcessor.drop_null_tags(processor.transform_frame(data))
+        cbf_records = DataProcessor.records_from_frame(cbf_df)
 
         # Calculate summary
         if cbf_records:
-            cbf_df = pl.DataFrame(cbf_records)
             summary = {
                 'records_transformed': len(cbf_records),
                 'date_range': {
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Persistent journal of billing drops acknowledged by the CloudZero AnyCost API."""
+
+import hashlib
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+
+
+@dataclass(frozen=True)
+class CheckpointKey:
+    """Identifies one billing drop: where it went, which day, how, and with what content."""
+
+    connection_id: str
+    month: str
+    batch_date: str
+    operation: str
+    content_hash: str
+
+
+def payload_content_hash(records: pl.Series) -> str:
+    """Hash the encoded records of a billing drop (see payload.api_records) independently of row order."""
+    if records.is_empty():
+        return hashlib.sha256().hexdigest()
+    return hashlib.sha256((records.sort().str.join('\n').item() + '\n').encode()).hexdigest()
+
+
+class CheckpointJournal:
+    """SQLite journal of acknowledged daily batches, used to resume interrupted transmits.
+
+    A batch is recorded after the API accepts it. On resume, a batch whose key (connection,
+    month, date, operation and content hash) is already in the journal is skipped; a day
+    whose data changed since it was sent has a different hash and is sent again.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize the journal, by default next to the data cache in ~/.ll2cz/cache."""
+        if path is None:
+            path = Path.home() / '.ll2cz' / 'cache' / 'transmit_journal.db'
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent uploads record acknowledgements from several threads
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30.0)
+
+    def _init_db(self) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS transmit_journal (
+                    connection_id TEXT NOT NULL,
+                    month TEXT NOT NULL,
+                    batch_date TEXT NOT NULL,
+                    operation TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    records INTEGER NOT NULL,
+                    acknowledged_at TEXT NOT NULL,
+                    PRIMARY KEY (connection_id, month, batch_date, operation, content_hash)
+                )
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def is_acknowledged(self, key: CheckpointKey) -> bool:
+        """Whether this exact batch has already been accepted by the API."""
+        conn = self._connect()
+        try:
+            row = conn.execute("""
+                SELECT 1 FROM transmit_journal
+                WHERE connection_id = ? AND month = ? AND batch_date = ? AND operation = ? AND content_hash = ?
+            """, (key.connection_id, key.month, key.batch_date, key.operation, key.content_hash)).fetchone()
+            return row is not None
+        finally:
+            conn.close()
+
+    def record(self, key: CheckpointKey, records: int) -> None:
+        """Record that a batch was accepted by the API."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("""
+                    INSERT OR REPLACE INTO transmit_journal
+                    (connection_id, month, batch_date, operation, content_hash, records, acknowledged_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (key.connection_id, key.month, key.batch_date, key.operation, key.content_hash,
+                      records, datetime.now(timezone.utc).isoformat()))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def clear(self, connection_id: Optional[str] = None) -> int:
+        """Forget acknowledged batches, for one connection or all of them.
+
+        Returns:
+            Number of journal entries removed
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                if connection_id is None:
+                    cursor = conn.execute("DELETE FROM transmit_journal")
+                else:
+                    cursor = conn.execute("DELETE FROM transmit_journal WHERE connection_id = ?", (connection_id,))
+                conn.commit()
+                return cursor.rowcount
+            finally:
+                conn.close()
@@ -3,7 +3,11 @@
 
 """Chunked processing for memory-efficient data transformation."""
 
-from typing import Any, Callable, Dict, Iterator, List, Optional
+import io
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import polars as pl
 from rich.console import Console
@@ -12,18 +16,43 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from .data_processor import DataProcessor
 
 
+def _transform_chunk(source: str, chunk_ipc: bytes) -> Tuple[bytes, List[Any], int, int]:
+    """Transform one Arrow IPC-encoded chunk in a worker process.
+
+    Returns:
+        Tuple of (CBF frame as Arrow IPC, error records, successful operations, total operations)
+    """
+    processor = DataProcessor(source=source)
+    frame = processor.transform_frame(pl.read_ipc(io.BytesIO(chunk_ipc)))
+    tracker = processor.error_tracker
+    return _to_ipc(frame), tracker.errors, tracker.successful_operations, tracker.total_operations
+
+
+def _to_ipc(df: pl.DataFrame) -> bytes:
+    """Serialize a DataFrame as an Arrow IPC buffer."""
+    buffer = io.BytesIO()
+    df.write_ipc(buffer)
+    return buffer.getvalue()
+
+
 class ChunkedDataProcessor:
     """Process large datasets in chunks to avoid memory issues."""
 
-    def __init__(self, chunk_size: int = 10000, show_progress: bool = True):
+    def __init__(self, chunk_size: int = 10000, show_progress: bool = True, workers: int = 1):
         """Initialize chunked processor.
 
         Args:
             chunk_size: Number of records to process per chunk
             show_progress: Whether to show progress during processing
+            workers: Number of worker processes; with more than one, chunks are sent as
+                Arrow IPC buffers to a process pool and their results merged in order
         """
+        if workers < 1:
+            raise ValueError(f"Invalid workers: {workers}. Must be at least 1")
+
         self.chunk_size = chunk_size
         self.show_progress = show_progress
+        self.workers = workers
         self.console = Console()
 
     def process_dataframe_chunked(
@@ -57,13 +86,8 @@ class ChunkedDataProcessor:
             progress.start()
 
         try:
-            # Process in chunks
-            for chunk_start in range(0, total_records, self.chunk_size):
-                chunk_end = min(chunk_start + self.chunk_size, total_records)
-                chunk = df.slice(chunk_start, chunk_end - chunk_start)
-
-                # Process the chunk
-                czrns, cbf_records, error_summary = processor.process_dataframe(chunk)
+            # Process in chunks (in order, also when spread over worker processes)
+            for czrns, cbf_records, error_summary in self._process_chunks(self._iter_chunks(df), processor):
                 successful_records += len(cbf_records)
 
                 # Call the callback if provided
@@ -72,10 +96,10 @@ class ChunkedDataProcessor:
 
                 # Update progress
                 if self.show_progress:
-                    progress.update(task, completed=chunk_end)
+                    progress.update(task, completed=successful_records)
 
             # Get overall error summary
-            overall_error_summary = processor.error_tracker.get_summary()
+            overall_error_summary = processor.error_tracker.get_error_summary()
 
             return total_records, successful_records, overall_error_summary
 
@@ -83,6 +107,43 @@ class ChunkedDataProcessor:
             if self.show_progress:
                 progress.stop()
 
+    def transform_dataframe(self, df: pl.DataFrame, processor: DataProcessor) -> pl.DataFrame:
+        """Transform a DataFrame chunk by chunk into one CBF frame.
+
+        The transform_frame() results of the chunks are concatenated as they are, without
+        building record dicts; use DataProcessor.records_from_frame() where dicts are needed.
+
+        Args:
+            df: Input DataFrame to process
+            processor: DataProcessor instance to use
+
+        Returns:
+            CBF DataFrame, without tag columns that no row has a value for
+        """
+        if self.show_progress:
+            progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=self.console,
+                transient=True
+            )
+            task = progress.add_task(f"Processing {len(df):,} records...", total=len(df))
+            progress.start()
+
+        try:
+            frames = []
+            for frame in self._transform_chunks(self._iter_chunks(df), processor):
+                frames.append(frame)
+                if self.show_progress:
+                    progress.advance(task, len(frame))
+        finally:
+            if self.show_progress:
+                progress.stop()
+
+        if not frames:
+            return pl.DataFrame()
+        return DataProcessor.drop_null_tags(pl.concat(frames))
+
     def process_dataframe_as_generator(
         self,
         df: pl.DataFrame,
@@ -100,15 +161,77 @@ class ChunkedDataProcessor:
         Yields:
             Tuple of (czrns, cbf_records, error_summary) for each chunk
         """
-        total_records = len(df)
+        yield from self._process_chunks(self._iter_chunks(df), processor)
+
+    def process_batches(
+        self,
+        batches: Iterable[pl.DataFrame],
+        processor: DataProcessor
+    ) -> Iterator[tuple[List[str], List[Dict[str, Any]], Dict[str, Any]]]:
+        """Process a stream of DataFrames (e.g. LiteLLMDatabase.iter_usage_data) chunk by chunk.
 
-        # Process in chunks
-        for chunk_start in range(0, total_records, self.chunk_size):
-            chunk_end = min(chunk_start + self.chunk_size, total_records)
-            chunk = df.slice(chunk_start, chunk_end - chunk_start)
+        Only one input batch is held at a time, so memory stays bounded by the batch
+        and chunk sizes rather than the total result size. Batches larger than
+        chunk_size are split further.
 
-            # Process and yield the chunk results
-            yield processor.process_dataframe(chunk)
+        Args:
+            batches: Iterable of input DataFrames
+            processor: DataProcessor instance to use
+
+        Yields:
+            Tuple of (czrns, cbf_records, error_summary) for each chunk
+        """
+        chunks = (chunk for batch in batches for chunk in self._iter_chunks(batch))
+        yield from self._process_chunks(chunks, processor)
+
+    def _iter_chunks(self, df: pl.DataFrame) -> Iterator[pl.DataFrame]:
+        """Split a DataFrame into chunk_size slices."""
+        for chunk_start in range(0, len(df), self.chunk_size):
+            yield df.slice(chunk_start, self.chunk_size)
+
+    def _process_chunks(
+        self,
+        chunks: Iterable[pl.DataFrame],
+        processor: DataProcessor
+    ) -> Iterator[tuple[List[str], List[Dict[str, Any]], Dict[str, Any]]]:
+        """Transform chunks in order into (czrns, cbf_records, error_summary) chunk results."""
+        for frame in self._transform_chunks(chunks, processor):
+            yield self._chunk_result(frame, processor)
+
+    def _transform_chunks(self, chunks: Iterable[pl.DataFrame], processor: DataProcessor) -> Iterator[pl.DataFrame]:
+        """Transform chunks in order with transform_frame(), in this process or across worker processes."""
+        if self.workers == 1:
+            for chunk in chunks:
+                yield processor.transform_frame(chunk)
+            return
+
+        # Spawned workers avoid forking a process that already runs Polars threads. Only
+        # workers * 2 chunks are in flight, so memory stays bounded for streamed batches.
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_transform_chunk, processor.source, _to_ipc(chunk)))
+                if len(pending) >= self.workers * 2:
+                    yield self._merge_chunk_frame(pending.popleft().result(), processor)
+            while pending:
+                yield self._merge_chunk_frame(pending.popleft().result(), processor)
+
+    @staticmethod
+    def _merge_chunk_frame(result: Tuple[bytes, List[Any], int, int], processor: DataProcessor) -> pl.DataFrame:
+        """Merge a worker's errors into the parent processor and return its CBF frame."""
+        frame_ipc, errors, successful_operations, total_operations = result
+        processor.error_tracker.merge(errors, successful_operations, total_operations)
+        return pl.read_ipc(io.BytesIO(frame_ipc))
+
+    @staticmethod
+    def _chunk_result(
+        frame: pl.DataFrame,
+        processor: DataProcessor
+    ) -> tuple[List[str], List[Dict[str, Any]], Dict[str, Any]]:
+        """Convert a transform_frame() result to the (czrns, cbf_records, error_summary) chunk result."""
+        czrns = frame['resource/tag:czrn'].drop_nulls().to_list() if 'resource/tag:czrn' in frame.columns else []
+        return czrns, DataProcessor.records_from_frame(frame), processor.error_tracker.get_error_summary()
 
     def process_with_memory_limit(
         self,
@@ -148,7 +271,8 @@ class ChunkedDataProcessor:
 
         chunked_processor = ChunkedDataProcessor(
             chunk_size=adaptive_chunk_size,
-            show_progress=self.show_progress
+            show_progress=self.show_progress,
+            workers=self.workers
         )
 
         def accumulate_results(cbf_records: List[Dict[str, Any]], error_summary: Dict[str, Any]):
@@ -170,7 +294,8 @@ def process_large_dataset(
     df: pl.DataFrame,
     source: str = "usertable",
     chunk_size: int = 10000,
-    show_progress: bool = True
+    show_progress: bool = True,
+    workers: int = 1
 ) -> Iterator[tuple[List[str], List[Dict[str, Any]], Dict[str, Any]]]:
     """Convenience function to process large datasets in chunks.
 
@@ -179,11 +304,12 @@ def process_large_dataset(
         source: Data source type ("usertable" or "logs")
         chunk_size: Number of records per chunk
         show_progress: Whether to show progress
+        workers: Number of worker processes to spread chunks over
 
     Yields:
         Tuple of (czrns, cbf_records, error_summary) for each chunk
     """
     processor = DataProcessor(source=source)
-    chunked_processor = ChunkedDataProcessor(chunk_size=chunk_size, show_progress=show_progress)
+    chunked_processor = ChunkedDataProcessor(chunk_size=chunk_size, show_progress=show_progress, workers=workers)
 
     yield from chunked_processor.process_dataframe_as_generator(df, processor)
@@ -15,9 +15,11 @@ from . import __version__
 from .analysis import DataAnalyzer
 from .cached_database import CachedLiteLLMDatabase
 from .cbf_transformer import CBFTransformer
+from .checkpoint import CheckpointJournal
 from .config import Config
 from .database import LiteLLMDatabase
-from .output import CSVWriter
+from .output import CSVWriter, CloudZeroStreamer
+from .retry import RetryPolicy
 from .transmit_refactored import DataTransmitterV2 as DataTransmitter
 
 console = Console()
@@ -38,6 +40,70 @@ def add_common_database_args(parser):
     )
 
 
+def add_engine_args(parser):
+    """Add database extraction engine arguments to a parser."""
+    parser.add_argument(
+        '--engine',
+        default='psycopg',
+        choices=['psycopg', 'connectorx'],
+        help="PostgreSQL extraction engine: 'psycopg' (default) or 'connectorx' for parallel "
+             "partitioned Arrow reads (SQLite always uses the built-in driver)"
+    )
+    parser.add_argument(
+        '--partitions',
+        type=positive_int,
+        default=LiteLLMDatabase.DEFAULT_PARTITIONS,
+        help='Parallel date-range queries per read with --engine connectorx '
+             f'(default: {LiteLLMDatabase.DEFAULT_PARTITIONS})'
+    )
+
+
+def positive_int(value: str) -> int:
+    """Parse a command line integer that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """Parse a command line integer that must be at least 0."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
+
+
+def add_workers_args(parser):
+    """Add multi-process transformation arguments to a parser."""
+    parser.add_argument(
+        '--workers',
+        type=positive_int,
+        default=1,
+        help='Worker processes for transforming large datasets in parallel chunks (default: 1)'
+    )
+
+
+def add_rollup_args(parser):
+    """Add SpendLogs rollup arguments to a parser."""
+    parser.add_argument(
+        '--rollup',
+        action='store_true',
+        help='With --source logs, aggregate transactions per hour and dimension before generating CBF '
+             '(one line item per hour instead of per request)'
+    )
+
+
+def add_cache_backend_args(parser):
+    """Add local cache backend arguments to a parser."""
+    parser.add_argument(
+        '--cache-backend',
+        choices=['sqlite', 'parquet'],
+        help="Local cache storage: 'sqlite' (default) or 'parquet' for date-partitioned files "
+             "(can also be set as cache_backend in ~/.ll2cz/config.yml)"
+    )
+
+
 def add_cloudzero_auth_args(parser):
     """Add CloudZero authentication arguments to a parser."""
     parser.add_argument(
@@ -52,6 +118,11 @@ def add_cloudzero_auth_args(parser):
     )
 
 
+def handle_cache_backend(args):
+    """Resolve the local cache backend from CLI arguments or configuration."""
+    return Config().get_cache_backend(getattr(args, 'cache_backend', None))
+
+
 def handle_database_config(args):
     """Handle database configuration loading."""
     config = Config()
@@ -116,10 +187,11 @@ def analyze_data(args):
 
     # Choose database implementation based on cache setting
     if args.disable_cache:
-        database = LiteLLMDatabase(db_connection)
+        database = LiteLLMDatabase(db_connection, engine=args.engine, partitions=args.partitions)
         console.print("[dim]Cache disabled - using direct database connection[/dim]")
     else:
-        database = CachedLiteLLMDatabase(db_connection)
+        database = CachedLiteLLMDatabase(db_connection, engine=args.engine, partitions=args.partitions,
+                                         cache_backend=handle_cache_backend(args))
         if database.is_offline_mode():
             console.print("[yellow]⚠️  Operating in offline mode - using cached data[/yellow]")
 
@@ -162,10 +234,11 @@ def analyze_spend(args):
 
     # Choose database implementation
     if args.disable_cache:
-        database = LiteLLMDatabase(db_connection)
+        database = LiteLLMDatabase(db_connection, engine=args.engine, partitions=args.partitions)
         console.print("[dim]Cache disabled - using direct database connection[/dim]")
     else:
-        database = CachedLiteLLMDatabase(db_connection)
+        database = CachedLiteLLMDatabase(db_connection, engine=args.engine, partitions=args.partitions,
+                                         cache_backend=handle_cache_backend(args))
         if database.is_offline_mode():
             console.print("[yellow]⚠️  Operating in offline mode - using cached data[/yellow]")
 
@@ -253,10 +326,11 @@ def transform(args):
 
     # Choose database implementation
     if args.disable_cache:
-        database = LiteLLMDatabase(db_connection)
+        database = LiteLLMDatabase(db_connection, engine=args.engine, partitions=args.partitions)
         console.print("[dim]Cache disabled - using direct database connection[/dim]")
     else:
-        database = CachedLiteLLMDatabase(db_connection)
+        database = CachedLiteLLMDatabase(db_connection, engine=args.engine, partitions=args.partitions,
+                                         cache_backend=handle_cache_backend(args))
         if database.is_offline_mode():
             console.print("[yellow]⚠️  Operating in offline mode - using cached data[/yellow]")
 
@@ -264,7 +338,7 @@ def transform(args):
     console.print(f"[blue]Transforming {args.limit:,} records from {source_desc} to CBF format...[/blue]")
 
     try:
-        transformer = CBFTransformer(database, timezone=args.timezone)
+        transformer = CBFTransformer(database, timezone=args.timezone, workers=args.workers, rollup=args.rollup)
         cbf_data, summary = transformer.transform(
             limit=args.limit,
             source=args.source
@@ -305,10 +379,11 @@ def transmit(args):
 
     # Choose database implementation
     if args.disable_cache:
-        database = LiteLLMDatabase(db_connection)
+        database = LiteLLMDatabase(db_connection, engine=args.engine, partitions=args.partitions)
         console.print("[dim]Cache disabled - using direct database connection[/dim]")
     else:
-        database = CachedLiteLLMDatabase(db_connection)
+        database = CachedLiteLLMDatabase(db_connection, engine=args.engine, partitions=args.partitions,
+                                         cache_backend=handle_cache_backend(args))
         if database.is_offline_mode():
             console.print("[yellow]⚠️  Operating in offline mode - using cached data[/yellow]")
 
@@ -317,7 +392,20 @@ def transmit(args):
             database=database,
             cz_api_key=cz_api_key,
             cz_connection_id=cz_connection_id,
-            timezone=args.timezone or 'UTC'
+            timezone=args.timezone or 'UTC',
+            workers=args.workers,
+            stream=args.stream,
+            batch_size=args.batch_size,
+            upload_concurrency=args.upload_concurrency,
+            retry_policy=RetryPolicy(max_attempts=args.max_retries + 1),
+            requests_per_second=args.requests_per_second,
+            journal=CheckpointJournal(),
+            resume=args.resume,
+            compression=args.compression,
+            # 0 disables size-based splitting
+            max_drop_bytes=None if args.max_drop_bytes == 0 else args.max_drop_bytes,
+            max_drop_records=args.max_drop_records,
+            rollup=args.rollup
         )
 
         # Map CLI modes to transmit modes
@@ -370,7 +458,7 @@ def cache_status(args):
     db_connection = handle_database_config(args)
 
     try:
-        database = CachedLiteLLMDatabase(db_connection)
+        database = CachedLiteLLMDatabase(db_connection, cache_backend=handle_cache_backend(args))
 
         if args.remote_check:
             console.print("[blue]Checking cache status with remote server verification...[/blue]")
@@ -379,7 +467,7 @@ def cache_status(args):
             if database.database:
                 try:
                     conn = database.database.connect()
-                    conn.close()
+                    database.database._close_connection(conn)
                     server_status = "[green]✓ Online[/green]"
                 except Exception as e:
                     server_status = f"[red]✗ Offline ({str(e)})[/red]"
@@ -413,6 +501,7 @@ def cache_status(args):
 
         console.print(f"  Cache file: {cache_status.get('cache_file', 'Unknown')}")
         console.print(f"  Records cached: {cache_status.get('record_count', 0):,}")
+        console.print(f"  SpendLogs records cached: {cache_status.get('spend_logs_count', 0):,}")
         console.print(f"  Server available: {'Yes' if cache_status.get('server_available') else 'No'}")
         console.print(f"  Operating mode: {'Online' if cache_status.get('server_available') else 'Offline'}")
 
@@ -437,8 +526,14 @@ def cache_clear(args):
     db_connection = handle_database_config(args)
 
     try:
-        database = CachedLiteLLMDatabase(db_connection)
+        database = CachedLiteLLMDatabase(db_connection, cache_backend=handle_cache_backend(args))
         database.clear_cache()
+
+        if args.journal:
+            cz_connection_id = Config().get_cz_connection_id(args.cz_connection_id)
+            removed = CheckpointJournal().clear(cz_connection_id)
+            target = f"connection {cz_connection_id}" if cz_connection_id else "all connections"
+            console.print(f"[green]Cleared {removed:,} transmit journal entries for {target}[/green]")
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
@@ -449,7 +544,8 @@ def cache_refresh(args):
     db_connection = handle_database_config(args)
 
     try:
-        database = CachedLiteLLMDatabase(db_connection)
+        database = CachedLiteLLMDatabase(db_connection, engine=args.engine, partitions=args.partitions,
+                                         cache_backend=handle_cache_backend(args))
 
         console.print("[blue]Refreshing cache from server...[/blue]")
         database.refresh_cache()
@@ -459,6 +555,7 @@ def cache_refresh(args):
         cache_status = database.get_cache_status()
         console.print("\n[bold]Updated Cache Status[/bold]")
         console.print(f"  Records cached: {cache_status.get('record_count', 0):,}")
+        console.print(f"  SpendLogs records cached: {cache_status.get('spend_logs_count', 0):,}")
 
         breakdown = cache_status.get('breakdown', {})
         if breakdown:
@@ -626,6 +723,8 @@ def create_parser():
         help='Comprehensive analysis of LiteLLM data including source data summary, CZRN generation, and CBF transformation'
     )
     add_common_database_args(analyze_data_parser)
+    add_cache_backend_args(analyze_data_parser)
+    add_engine_args(analyze_data_parser)
     analyze_data_parser.add_argument(
         '--limit',
         type=int,
@@ -677,6 +776,8 @@ def create_parser():
         help='Analyze spending patterns based on LiteLLM team and user data'
     )
     add_common_database_args(analyze_spend_parser)
+    add_cache_backend_args(analyze_spend_parser)
+    add_engine_args(analyze_spend_parser)
     analyze_spend_parser.add_argument(
         '--limit',
         type=int,
@@ -708,6 +809,10 @@ def create_parser():
         help='Transform LiteLLM data to CloudZero AnyCost CBF format'
     )
     add_common_database_args(transform_parser)
+    add_cache_backend_args(transform_parser)
+    add_engine_args(transform_parser)
+    add_workers_args(transform_parser)
+    add_rollup_args(transform_parser)
     transform_parser.add_argument(
         '--output',
         default='cbf_output.jsonl',
@@ -749,6 +854,10 @@ def create_parser():
         help='Transmit transformed data to CloudZero'
     )
     add_common_database_args(transmit_parser)
+    add_cache_backend_args(transmit_parser)
+    add_engine_args(transmit_parser)
+    add_workers_args(transmit_parser)
+    add_rollup_args(transmit_parser)
     add_cloudzero_auth_args(transmit_parser)
     transmit_parser.add_argument(
         '--mode',
@@ -781,6 +890,59 @@ def create_parser():
         type=int,
         help='Number of records to send or show (if using --test)'
     )
+    transmit_parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream extraction, transformation and upload day by day instead of loading '
+             'the whole date range first'
+    )
+    transmit_parser.add_argument(
+        '--batch-size',
+        type=positive_int,
+        default=LiteLLMDatabase.DEFAULT_BATCH_SIZE,
+        help=f'Rows per database batch with --stream (default: {LiteLLMDatabase.DEFAULT_BATCH_SIZE})'
+    )
+    transmit_parser.add_argument(
+        '--upload-concurrency',
+        type=positive_int,
+        default=1,
+        help='Daily batches to upload to CloudZero at the same time (default: 1)'
+    )
+    transmit_parser.add_argument(
+        '--max-retries',
+        type=non_negative_int,
+        default=RetryPolicy.max_attempts - 1,
+        help='Retries per daily batch after transient upload failures, with exponential backoff '
+             f'(default: {RetryPolicy.max_attempts - 1})'
+    )
+    transmit_parser.add_argument(
+        '--requests-per-second',
+        type=float,
+        help='Limit upload requests to CloudZero across all concurrent uploads (default: unlimited)'
+    )
+    transmit_parser.add_argument(
+        '--compression',
+        choices=['gzip'],
+        help='Compress upload request bodies (Content-Encoding: gzip) in the upload threads (default: none)'
+    )
+    transmit_parser.add_argument(
+        '--max-drop-bytes',
+        type=non_negative_int,
+        default=CloudZeroStreamer.DEFAULT_MAX_DROP_BYTES,
+        help='Split daily batches into several uploads once their serialized records exceed this many '
+             f'bytes; 0 disables the limit (default: {CloudZeroStreamer.DEFAULT_MAX_DROP_BYTES})'
+    )
+    transmit_parser.add_argument(
+        '--max-drop-records',
+        type=positive_int,
+        help='Split daily batches into several uploads of at most this many records (default: no limit)'
+    )
+    transmit_parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip daily batches that an earlier run already sent with identical content '
+             '(tracked in ~/.ll2cz/cache/transmit_journal.db)'
+    )
     transmit_parser.add_argument(
         '--timezone',
         help='Timezone for date operations (e.g., America/New_York)'
@@ -810,6 +972,7 @@ def create_parser():
         help='Show cache status and information'
     )
     add_common_database_args(cache_status_parser)
+    add_cache_backend_args(cache_status_parser)
     cache_status_parser.add_argument(
         '--remote-check',
         action='store_true',
@@ -823,6 +986,18 @@ def create_parser():
         help='Clear the local cache'
     )
     add_common_database_args(cache_clear_parser)
+    add_cache_backend_args(cache_clear_parser)
+    cache_clear_parser.add_argument(
+        '--journal',
+        action='store_true',
+        help='Also forget the batches transmit --resume would skip, for --cz-connection-id '
+             '(or all connections if none is configured)'
+    )
+    cache_clear_parser.add_argument(
+        '--cz-connection-id',
+        dest='cz_connection_id',
+        help='CloudZero connection whose transmit journal --journal clears'
+    )
     cache_clear_parser.set_defaults(func=cache_clear)
 
     # cache refresh
@@ -831,6 +1006,8 @@ def create_parser():
         help='Force refresh the cache from server'
     )
     add_common_database_args(cache_refresh_parser)
+    add_cache_backend_args(cache_refresh_parser)
+    add_engine_args(cache_refresh_parser)
     cache_refresh_parser.set_defaults(func=cache_refresh)
 
     return parser
@@ -58,6 +58,12 @@ class Config:
         config_value = config_value if config_value and config_value.strip() else None
         return cli_value or config_value
 
+    def get_cache_backend(self, cli_value: Optional[str] = None) -> str:
+        """Get local cache backend ('sqlite' or 'parquet'), prioritizing CLI over config."""
+        config_value = self.config_data.get('cache_backend')
+        config_value = config_value if config_value and str(config_value).strip() else None
+        return cli_value or config_value or 'sqlite'
+
     def create_example_config(self) -> None:
         """Create an example configuration file."""
         self.config_dir.mkdir(exist_ok=True)
@@ -90,6 +96,8 @@ class Config:
             configured_items.append("cz_api_key")
         if self.config_data.get('cz_connection_id'):
             configured_items.append("cz_connection_id")
+        if self.config_data.get('cache_backend'):
+            configured_items.append("cache_backend")
 
         if configured_items:
             self.console.print(f"[green]Configured: {', '.join(configured_items)}[/green]")
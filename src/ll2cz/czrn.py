@@ -7,7 +7,7 @@ import re
 from typing import Any, Dict, Optional, Tuple
 
 from .model_name_strategies import extract_model_name
-from .transformations import generate_resource_id, normalize_component, normalize_service
+from .transformations import generate_resource_id, normalize_component_cached, normalize_service
 
 
 class CZRNGenerator:
@@ -209,7 +209,7 @@ class CZRNGenerator:
     def _normalize_component(self, component: str, allow_uppercase: bool = False) -> str:
         """Normalize a CZRN component to meet format requirements.
 
-        Delegates to the transformations.normalize_component function for maximum
+        Delegates to the memoized transformations.normalize_component_cached function for maximum
         reusability across the codebase.
 
         Args:
@@ -219,5 +219,5 @@ class CZRNGenerator:
         Returns:
             Normalized component string safe for CZRN usage
         """
-        return normalize_component(component, allow_uppercase)
+        return normalize_component_cached(component, allow_uppercase)
 
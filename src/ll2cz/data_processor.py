@@ -8,7 +8,7 @@ CloudZero Resource Names (CZRNs) and CloudZero Bill Format (CBF) records,
 eliminating duplication and ensuring consistent transformations across the codebase.
 """
 
-from datetime import datetime
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 import polars as pl
@@ -18,12 +18,26 @@ from .model_name_strategies import extract_model_name
 from .transformations import (
     generate_resource_id,
     get_field_mappings,
-    normalize_component,
+    normalize_component_cached,
+    normalize_component_expr,
+    normalize_date,
+    normalize_dates,
     normalize_service,
-    parse_date,
 )
 
 
+@dataclass
+class RecordComponents:
+    """Derived components of one record, shared by its CZRN and its CBF record."""
+    service: Optional[str]
+    account: Optional[str]
+    resource_type: Optional[str]
+    usage_family: str
+    cloud_local_id: str
+    model_family: Optional[str]
+    czrn: Optional[str] = None
+
+
 class DataProcessor:
     """Centralized processor for CZRN and CBF generation from LiteLLM data.
 
@@ -31,6 +45,10 @@ class DataProcessor:
     eliminating duplication across CZRN generation, CBF transformation, and analysis.
     """
 
+    # Record fields every CZRN/CBF component is derived from (plus the source's resource type field)
+    DIMENSION_FIELDS = ("custom_llm_provider", "model", "key_alias", "api_key")
+    COMPONENT_FIELDS = ["service", "account", "resource_type", "usage_family", "cloud_local_id", "model_family", "czrn"]
+
     def __init__(self, source: str = "usertable"):
         """Initialize data processor for specific data source.
 
@@ -58,63 +76,100 @@ class DataProcessor:
             self.resource_type_field = "model"
             self.usage_family_field = "model"
 
-    def create_czrn(self, record: Dict[str, Any]) -> Optional[str]:
-        """Create a CloudZero Resource Name from a data record.
+    def resolve_components(self, record: Dict[str, Any]) -> RecordComponents:
+        """Derive every CZRN/CBF component of a record once.
+
+        Missing CZRN components are reported to the error tracker here, once per record.
 
         Args:
             record: Dictionary containing record data
 
         Returns:
-            Generated CZRN string or None if generation fails
+            RecordComponents with czrn set to None if CZRN generation fails
         """
-        try:
-            # Extract and normalize service type
-            service_type = self._extract_and_transform_field(
-                record, "custom_llm_provider", normalize_service
-            )
+        components = self._derive_components(record, self._get_owner_account(record))
+        if not components.czrn:
+            self._track_czrn_error(record, components.service, components.account, components.resource_type)
+        return components
 
-            # Extract and normalize owner account
-            owner_account = self._get_owner_account(record)
+    def resolve_dimensions(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Resolve components once per distinct dimension tuple and align them with the rows.
 
-            # Extract and normalize resource type
-            resource_type = self._get_resource_type(record)
+        Daily spend repeats a small set of (custom_llm_provider, model, key_alias, api_key)
+        combinations, so the normalizers run per distinct tuple and the results are joined
+        back; the cost scales with dimension cardinality rather than row count. No errors
+        are tracked here.
 
-            # Validate required fields
-            if not service_type or not owner_account or not resource_type:
-                self._track_czrn_error(record, service_type, owner_account, resource_type)
-                return None
+        Args:
+            df: Input DataFrame with LiteLLM data
 
-            # Build CZRN components
-            provider = "litellm"
-            region = "cross-region"
-            # Use consistent cloud-local-id construction (always use extracted model name)
-            cloud_local_id = self._get_cloud_local_id(record)
+        Returns:
+            DataFrame with one column per RecordComponents field, one row per input row
+        """
+        fields = [field for field in self._get_dimension_fields() if field in df.columns]
+        if not fields:
+            components = self._derive_components({}, None)
+            return pl.DataFrame([pl.Series(name, [getattr(components, name)] * len(df), dtype=pl.Utf8)
+                                 for name in self.COMPONENT_FIELDS])
+
+        distinct = df.unique(subset=fields, maintain_order=True).select(fields)
+        records = [dict(zip(fields, values)) for values in distinct.iter_rows()]
+
+        # Owner accounts are normalized for the whole key_alias/api_key columns at once
+        account = self._owner_account_expr(distinct.schema)
+        if account is not None:
+            accounts = distinct.select(account).to_series().to_list()
+        else:
+            accounts = [self._get_owner_account(record) for record in records]
+
+        resolved = [self._derive_components(record, owner_account)
+                    for record, owner_account in zip(records, accounts)]
+        lookup = distinct.with_columns([
+            pl.Series(name, [getattr(components, name) for components in resolved], dtype=pl.Utf8)
+            for name in self.COMPONENT_FIELDS
+        ])
+        return df.select(fields).join(
+            lookup, on=fields, how="left", nulls_equal=True, maintain_order="left"
+        ).select(self.COMPONENT_FIELDS)
 
-            # Construct CZRN
-            czrn = f"czrn:{provider}:{service_type}:{region}:{owner_account}:{resource_type}:{cloud_local_id}"
+    def create_czrn(self, record: Dict[str, Any]) -> Optional[str]:
+        """Create a CloudZero Resource Name from a data record.
 
-            return czrn
+        Args:
+            record: Dictionary containing record data
 
+        Returns:
+            Generated CZRN string or None if generation fails
+        """
+        try:
+            return self.resolve_components(record).czrn
         except Exception as e:
             self.error_tracker.add_error("CZRN_GENERATION_FAILED", str(e), record, "CZRN")
             return None
 
-    def create_cbf_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def create_cbf_record(self, record: Dict[str, Any], components: Optional[RecordComponents] = None,
+                          usage_start: Optional[str] = None) -> Dict[str, Any]:
         """Create a CloudZero Bill Format record from a data record.
 
         Args:
             record: Dictionary containing record data
+            components: Components already resolved for this record by resolve_components();
+                resolved here when omitted
+            usage_start: time/usage_start already normalized for this record; derived from
+                the record when omitted
 
         Returns:
             CBF-formatted record dictionary
         """
-        # Generate CZRN for this record
-        czrn = self.create_czrn(record)
+        if components is None:
+            components = self.resolve_components(record)
+        if usage_start is None:
+            usage_start = self._get_usage_start_time(record)
 
         # Extract core CBF fields
         cbf_record = {
             # Time and cost
-            "time/usage_start": self._get_usage_start_time(record),
+            "time/usage_start": usage_start,
             "cost/cost": self._extract_field(record, "spend", 0.0),
 
             # Usage information
@@ -122,20 +177,18 @@ class DataProcessor:
             "usage/units": "tokens",
 
             # Resource information
-            "resource/service": self._extract_and_transform_field(
-                record, "custom_llm_provider", normalize_service
-            ),
-            "resource/account": self._get_owner_account(record),
+            "resource/service": components.service,
+            "resource/account": components.account,
             "resource/region": "cross-region",
-            "resource/usage_family": self._get_usage_family(record),
-            "resource/id": self._get_cloud_local_id(record),
+            "resource/usage_family": components.usage_family,
+            "resource/id": components.cloud_local_id,
 
             # Line item information
             "lineitem/type": "Usage",
         }
 
         # Add resource tags
-        resource_tags = self._build_resource_tags(record, czrn)
+        resource_tags = self._build_resource_tags(record, components)
         cbf_record.update(resource_tags)
 
         return cbf_record
@@ -155,21 +208,110 @@ class DataProcessor:
         # Convert to list of dictionaries for processing
         records = df.to_dicts()
 
-        for record in records:
-            # Generate CZRN
-            czrn = self.create_czrn(record)
-            if czrn:
-                czrns.append(czrn)
+        # Components are resolved per distinct dimension tuple and shared by the CZRN and CBF record
+        dimensions = self.resolve_dimensions(df)
+
+        # Dates are parsed for the whole column in one pass
+        usage_starts = self._usage_start_time_column(df)
 
-            # Generate CBF record
-            cbf_record = self.create_cbf_record(record)
-            cbf_records.append(cbf_record)
+        for record, values, usage_start in zip(records, dimensions.iter_rows(named=True), usage_starts):
+            components = RecordComponents(**values)
+            if components.czrn:
+                czrns.append(components.czrn)
+            else:
+                self._track_czrn_error(record, components.service, components.account, components.resource_type)
+
+            cbf_records.append(self.create_cbf_record(record, components, usage_start))
 
         # Get error summary
         error_summary = self.error_tracker.get_error_summary()
 
         return czrns, cbf_records, error_summary
 
+    def transform_frame(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Generate CBF records for a whole DataFrame with columnar Polars operations.
+
+        Produces the same values as create_cbf_record() for every row, one column per CBF
+        field in the same order. Tags that the row path omits (None values, missing CZRN or
+        model) are null here; records_from_frame() turns the result into identical dicts.
+
+        CZRN components come from resolve_dimensions() and usage start times from
+        normalize_dates(); everything else is a Polars expression over the frame. Rows without
+        a CZRN are reported to the error tracker as in the row path.
+
+        Args:
+            df: Input DataFrame with LiteLLM data
+
+        Returns:
+            DataFrame of CBF fields, one row per input row
+        """
+        if df.is_empty():
+            return pl.DataFrame()
+
+        # CZRN components per distinct dimension tuple, joined back to the rows
+        dims = self.resolve_dimensions(df)
+        dims = dims.rename({name: f"__{name}" for name in dims.columns}).with_columns(
+            self._usage_start_time_column(df).alias("__usage_start")
+        )
+
+        # Track errors as the row path does, for the (usually few) rows without a CZRN
+        missing = dims["__czrn"].is_null()
+        for record, values in zip(df.filter(missing).to_dicts(), dims.filter(missing).iter_rows(named=True)):
+            self._track_czrn_error(record, values["__service"], values["__account"], values["__resource_type"])
+
+        def column_or(name: str, default: Any) -> pl.Expr:
+            return pl.col(name) if name in df.columns else pl.lit(default)
+
+        def tokens(name: str) -> pl.Expr:
+            return column_or(name, 0).fill_null(0).cast(pl.Int64)
+
+        outputs = [
+            pl.col("__usage_start").alias("time/usage_start"),
+            column_or("spend", 0.0).alias("cost/cost"),
+            (tokens("prompt_tokens") + tokens("completion_tokens")).alias("usage/amount"),
+            pl.lit("tokens").alias("usage/units"),
+            pl.col("__service").alias("resource/service"),
+            pl.col("__account").alias("resource/account"),
+            pl.lit("cross-region").alias("resource/region"),
+            pl.col("__usage_family").alias("resource/usage_family"),
+            pl.col("__cloud_local_id").alias("resource/id"),
+            pl.lit("Usage").alias("lineitem/type"),
+            pl.col("__czrn").alias("resource/tag:czrn"),
+            pl.col("__model_family").alias("resource/tag:model_family"),
+        ]
+
+        # CBF-mapped fields become tags; a later field mapped to the same tag wins, as in the row path
+        tag_sources: Dict[str, str] = {}
+        for field, mapping in self.cbf_mappings.items():
+            if mapping.startswith("resource/tag:") and field in df.columns:
+                tag_sources[mapping] = field
+        for tag_name, field in tag_sources.items():
+            outputs.append(self._stringify(pl.col(field), df.schema[field]).alias(tag_name))
+
+        frame = pl.concat([df, dims], how="horizontal")
+        return frame.select(outputs)
+
+    @staticmethod
+    def drop_null_tags(frame: pl.DataFrame) -> pl.DataFrame:
+        """Drop tag columns of a transform_frame() result that no row has a value for.
+
+        A DataFrame built from create_cbf_record() dicts only has the tags some record carries.
+        """
+        empty = [col for col in frame.columns
+                 if col.startswith("resource/tag:") and frame[col].null_count() == len(frame)]
+        return frame.drop(empty)
+
+    @staticmethod
+    def records_from_frame(frame: pl.DataFrame) -> List[Dict[str, Any]]:
+        """Convert a transform_frame() result to CBF record dicts, dropping null tags."""
+        tag_columns = [col for col in frame.columns if col.startswith("resource/tag:")]
+        records = frame.to_dicts()
+        for record in records:
+            for col in tag_columns:
+                if record[col] is None:
+                    del record[col]
+        return records
+
     def get_field_mappings(self) -> Dict[str, Dict[str, str]]:
         """Get field mappings for current data source.
 
@@ -245,33 +387,102 @@ class DataProcessor:
             return default
         return transform_func(value)
 
+    def _get_dimension_fields(self) -> List[str]:
+        """Get the record fields that CZRN/CBF components are derived from."""
+        fields = list(self.DIMENSION_FIELDS)
+        for field in (self.resource_type_field, self.usage_family_field):
+            if field not in fields:
+                fields.append(field)
+        return fields
+
+    def _derive_components(self, record: Dict[str, Any], owner_account: Optional[str]) -> RecordComponents:
+        """Derive CZRN/CBF components from a record's dimension fields, without tracking errors.
+
+        The owner account is resolved by the caller, per record (_get_owner_account()) or per
+        column (_owner_account_expr()).
+        """
+        service_type = self._extract_and_transform_field(record, "custom_llm_provider", normalize_service)
+        resource_type = self._get_resource_type(record)
+
+        # Usage family and model family come from the same field as the resource type by default
+        if self.usage_family_field == self.resource_type_field:
+            usage_family = resource_type or "unknown"
+        else:
+            usage_family = self._get_usage_family(record)
+        if self.resource_type_field == "model":
+            model_family = resource_type
+        else:
+            model_family = self._get_model_family(record)
+
+        components = RecordComponents(
+            service=service_type,
+            account=owner_account,
+            resource_type=resource_type,
+            usage_family=usage_family,
+            # Use consistent cloud-local-id construction (always use full model name)
+            cloud_local_id=self._get_cloud_local_id(record),
+            model_family=model_family,
+        )
+
+        # Validate required fields
+        if service_type and owner_account and resource_type:
+            provider = "litellm"
+            region = "cross-region"
+            components.czrn = (f"czrn:{provider}:{service_type}:{region}:{owner_account}:"
+                               f"{resource_type}:{components.cloud_local_id}")
+        return components
+
     def _get_owner_account(self, record: Dict[str, Any]) -> Optional[str]:
         """Get normalized owner account from record (prefers key_alias over api_key)."""
         # Prefer key_alias if available and not null/empty
         key_alias = self._extract_field(record, "key_alias")
         if key_alias and str(key_alias).strip():
-            return normalize_component(str(key_alias))
+            return normalize_component_cached(str(key_alias))
 
         # Fallback to api_key
         api_key = self._extract_field(record, "api_key")
         if api_key and str(api_key).strip():
-            return normalize_component(str(api_key))
+            return normalize_component_cached(str(api_key))
 
         return None
 
+    @staticmethod
+    def _owner_account_expr(schema: pl.Schema) -> Optional[pl.Expr]:
+        """Expression form of _get_owner_account() over the key_alias/api_key columns.
+
+        Returns:
+            The expression, or None if either column holds non-string values
+        """
+        candidates = []
+        for field in ("key_alias", "api_key"):
+            if field not in schema:
+                continue
+            if schema[field] not in (pl.Utf8, pl.Null):
+                return None
+            candidates.append(pl.col(field).cast(pl.Utf8))
+
+        # Blank values fall through to the next column, as in the row path
+        account = pl.lit(None, dtype=pl.Utf8)
+        for column in reversed(candidates):
+            account = (
+                pl.when(column.str.strip_chars().str.len_chars() > 0)
+                .then(normalize_component_expr(column))
+                .otherwise(account)
+            )
+        return account.alias("account")
+
     def _get_resource_type(self, record: Dict[str, Any]) -> Optional[str]:
         """Get resource type based on data source (model or call_type)."""
         field_value = self._extract_field(record, self.resource_type_field)
 
         if not field_value or str(field_value).strip() == "" or str(field_value) == "*":
-            self._track_missing_field_error(record, self.resource_type_field)
             return None
 
         # For model field, extract model name; for call_type, use directly
         if self.resource_type_field == "model":
             return extract_model_name(str(field_value))
         else:
-            return normalize_component(str(field_value))
+            return normalize_component_cached(str(field_value))
 
     def _get_usage_family(self, record: Dict[str, Any]) -> str:
         """Get usage family based on data source (model or call_type)."""
@@ -284,7 +495,7 @@ class DataProcessor:
         if self.usage_family_field == "model":
             return extract_model_name(str(field_value))
         else:
-            return normalize_component(str(field_value))
+            return normalize_component_cached(str(field_value))
 
     def _get_cloud_local_id(self, record: Dict[str, Any]) -> str:
         """Generate cloud local ID from provider and full model name.
@@ -308,26 +519,15 @@ class DataProcessor:
     def _get_usage_start_time(self, record: Dict[str, Any]) -> Optional[str]:
         """Get usage start time based on data source.
 
-        Always returns ISO format string for CloudZero API compatibility.
-        For SpendLogs, the start_time is already a datetime object from the database.
-        For user tables, we parse the date string into a datetime object then convert to string.
+        Always returns an ISO-8601 UTC string ('...Z') for CloudZero API compatibility.
+        SpendLogs use the start_time field, user tables the date field.
         """
-        if self.source == "logs":
-            # SpendLogs uses start_time field (already a datetime object)
-            start_time = self._extract_field(record, "start_time")
-            if isinstance(start_time, datetime):
-                # Convert datetime object to ISO format string for CloudZero API
-                return start_time.isoformat() + 'Z' if start_time.tzinfo is None else start_time.isoformat()
-            elif isinstance(start_time, str):
-                return start_time
-            return None
-        else:
-            # User tables use date field
-            date_value = self._extract_field(record, "date")
-            parsed_date = parse_date(date_value)
-            if isinstance(parsed_date, datetime):
-                return parsed_date.isoformat() + 'Z' if parsed_date.tzinfo is None else parsed_date.isoformat()
-            return parsed_date
+        value = self._extract_field(record, self._get_usage_start_field())
+        usage_start = normalize_date(value)
+        if usage_start is None and self.source == "logs" and isinstance(value, str):
+            # SpendLogs start times that cannot be parsed are passed through unchanged
+            return value
+        return usage_start
 
     def _calculate_total_tokens(self, record: Dict[str, Any]) -> int:
         """Calculate total tokens from prompt and completion tokens."""
@@ -339,19 +539,17 @@ class DataProcessor:
         except (ValueError, TypeError):
             return 0
 
-    def _build_resource_tags(self, record: Dict[str, Any], czrn: Optional[str]) -> Dict[str, str]:
+    def _build_resource_tags(self, record: Dict[str, Any], components: RecordComponents) -> Dict[str, str]:
         """Build resource tags dictionary from record data."""
         tags = {}
 
         # Add CZRN as a resource tag if available
-        if czrn:
-            tags["resource/tag:czrn"] = czrn
+        if components.czrn:
+            tags["resource/tag:czrn"] = components.czrn
 
         # Add extracted model family tag (always from model field regardless of source)
-        model_value = self._extract_field(record, "model")
-        if model_value and str(model_value).strip() and str(model_value) != "*":
-            extracted_model = extract_model_name(str(model_value))
-            tags["resource/tag:model_family"] = extracted_model
+        if components.model_family:
+            tags["resource/tag:model_family"] = components.model_family
 
         # Add all CBF-mapped fields as resource tags
         for field, mapping in self.cbf_mappings.items():
@@ -363,6 +561,86 @@ class DataProcessor:
 
         return tags
 
+    def _get_model_family(self, record: Dict[str, Any]) -> Optional[str]:
+        """Get the model_family tag value (None when the record has no usable model)."""
+        model_value = self._extract_field(record, "model")
+        if model_value and str(model_value).strip() and str(model_value) != "*":
+            return extract_model_name(str(model_value))
+        return None
+
+    def _get_usage_start_field(self) -> str:
+        """Get the field holding the usage start time for the data source."""
+        return "start_time" if self.source == "logs" else "date"
+
+    def _usage_start_time_column(self, df: pl.DataFrame) -> pl.Series:
+        """Get time/usage_start for every row in one pass over the date/start_time column."""
+        field = self._get_usage_start_field()
+        if field not in df.columns:
+            return pl.Series(field, [None] * len(df), dtype=pl.Utf8)
+
+        usage_start = normalize_dates(df[field])
+        if self.source == "logs" and df.schema[field] == pl.Utf8:
+            # SpendLogs start times that cannot be parsed are passed through unchanged
+            usage_start = usage_start.fill_null(df[field])
+        return usage_start
+
+    @staticmethod
+    def _stringify(expr: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+        """Convert a column to the str() text the row path uses for tags (nulls stay null)."""
+        if dtype == pl.Utf8:
+            return expr
+        if dtype == pl.Null or dtype.is_integer() or isinstance(dtype, (pl.Date, pl.Categorical, pl.Enum)):
+            return expr.cast(pl.Utf8)
+        # Decimals print in plain notation like str(Decimal) up to a scale of 6
+        if isinstance(dtype, pl.Decimal) and dtype.scale <= 6:
+            return expr.cast(pl.Utf8)
+        if dtype == pl.Boolean:
+            return pl.when(expr).then(pl.lit("True")).when(expr.not_()).then(pl.lit("False"))
+        if dtype.is_float():
+            return DataProcessor._float_text(expr)
+        if isinstance(dtype, pl.Datetime):
+            return DataProcessor._datetime_text(expr, dtype)
+        # Other types (durations, nested values, ...) don't occur in tag columns in practice
+        return expr.map_elements(str, return_dtype=pl.Utf8, skip_nulls=True)
+
+    @staticmethod
+    def _float_text(expr: pl.Expr) -> pl.Expr:
+        """str() of float values: Polars matches repr() except for NaN and magnitudes below 1e-4.
+
+        Python writes those in exponent form with two exponent digits ('1e-05', '2.5e-07'),
+        where Polars writes '0.00001' or '2.5e-7'.
+        """
+        value = expr.cast(pl.Float64)
+        text = value.cast(pl.Utf8)
+        small = (value.abs() < 1e-4) & (value != 0)
+        # sign, zeros after the decimal point, first significant digit, remaining digits
+        parts = text.str.extract_groups(r"^(-?)0\.(0*)(\d)(\d*)$")
+        rest = parts.struct[3]
+        exponent_form = pl.concat_str([
+            parts.struct[0],
+            parts.struct[2],
+            pl.when(rest != "").then(pl.concat_str([pl.lit("."), rest])).otherwise(pl.lit("")),
+            pl.lit("e-"),
+            (parts.struct[1].str.len_chars() + 1).cast(pl.Utf8).str.zfill(2),
+        ])
+        return (
+            pl.when(value.is_nan()).then(pl.lit("nan"))
+            .when(small & text.str.contains("e", literal=True)).then(text.str.replace(r"e-(\d)$", "e-0${1}"))
+            .when(small).then(exponent_form)
+            .otherwise(text)
+        )
+
+    @staticmethod
+    def _datetime_text(expr: pl.Expr, dtype: pl.Datetime) -> pl.Expr:
+        """str() of datetime values: microseconds only when non-zero, then the UTC offset if aware."""
+        text = expr.dt.strftime("%Y-%m-%d %H:%M:%S")
+        text = pl.when(expr.dt.microsecond() != 0).then(
+            pl.concat_str([text, expr.dt.strftime("%.6f")])
+        ).otherwise(text)
+        if dtype.time_zone is not None:
+            text = pl.concat_str([text, expr.dt.strftime("%:z")])
+        return text
+
     def _track_czrn_error(
         self,
         record: Dict[str, Any],
@@ -385,9 +663,3 @@ class DataProcessor:
                 f"{self.resource_type_field} field is empty or null", record, "CZRN"
             )
 
-    def _track_missing_field_error(self, record: Dict[str, Any], field: str):
-        """Track missing field errors."""
-        self.error_tracker.add_error(
-            f"MISSING_{field.upper()}", f"{field} field is empty or null", record, "CZRN"
-        )
-
@@ -4,7 +4,7 @@
 """Strategy pattern implementation for handling different data sources."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 import polars as pl
 from rich.console import Console
@@ -34,6 +34,26 @@ class DataSourceStrategy(ABC):
         """
         pass
 
+    def iter_data(self, database: LiteLLMDatabase,
+                  date_filter: Optional[Dict[str, str]] = None,
+                  limit: Optional[int] = None,
+                  batch_size: int = LiteLLMDatabase.DEFAULT_BATCH_SIZE) -> Iterator[pl.DataFrame]:
+        """Fetch data from the specific source as a stream of DataFrames.
+
+        The default implementation yields the whole get_data() result as a single batch;
+        strategies override it where the database can stream the query.
+
+        Args:
+            database: Database connection object
+            date_filter: Optional dict with 'start_date' and 'end_date' keys
+            limit: Optional limit on number of records
+            batch_size: Maximum number of rows per yielded DataFrame
+
+        Yields:
+            Polars DataFrames in query order
+        """
+        yield self.get_data(database, date_filter, limit)
+
     @abstractmethod
     def get_source_name(self) -> str:
         """Get human-readable source name."""
@@ -54,24 +74,33 @@ class UserTableStrategy(DataSourceStrategy):
         """Fetch data from user table with optional filtering."""
         if date_filter:
             console.print(f"[blue]Fetching {date_filter['description']} from user table...[/blue]")
-            # Since get_usage_data doesn't support date filtering, we'll fetch all data
-            # and filter it afterwards
-            console.print("[dim]Note: Date filtering will be applied after fetching data[/dim]")
-            data = database.get_usage_data(limit=limit)
-            
-            # Apply date filter on the DataFrame
-            if not data.is_empty() and 'date' in data.columns:
-                start_date = date_filter['start_date']
-                end_date = date_filter['end_date']
-                # Filter by date range
-                data = data.filter(
-                    (pl.col('date') >= start_date) & (pl.col('date') <= end_date)
-                )
-            return data
+            # Date range is pushed down into the query so only matching rows are read
+            return database.get_usage_data(
+                limit=limit,
+                start_date=date_filter['start_date'],
+                end_date=date_filter['end_date']
+            )
         else:
             console.print("[blue]Fetching all data from user table...[/blue]")
             return database.get_usage_data(limit=limit)
 
+    def iter_data(self, database: LiteLLMDatabase,
+                  date_filter: Optional[Dict[str, str]] = None,
+                  limit: Optional[int] = None,
+                  batch_size: int = LiteLLMDatabase.DEFAULT_BATCH_SIZE) -> Iterator[pl.DataFrame]:
+        """Stream user table data in batches (server-side cursor, or the local cache on cached databases)."""
+        if date_filter:
+            console.print(f"[blue]Streaming {date_filter['description']} from user table...[/blue]")
+            yield from database.iter_usage_data(
+                batch_size=batch_size,
+                limit=limit,
+                start_date=date_filter['start_date'],
+                end_date=date_filter['end_date']
+            )
+        else:
+            console.print("[blue]Streaming all data from user table...[/blue]")
+            yield from database.iter_usage_data(batch_size=batch_size, limit=limit)
+
     def get_source_name(self) -> str:
         return "UserTable (LiteLLMSpendCalculator)"
 
@@ -99,10 +128,34 @@ class SpendLogsStrategy(DataSourceStrategy):
                 console.print("[blue]Fetching all data from SpendLogs...[/blue]")
                 return database.get_spend_logs_for_analysis(limit=limit)
         else:
-            # For non-cached database, use the analysis method
+            # For non-cached database, bound the query on startTime so only the requested days are read
+            if date_filter:
+                console.print(f"[blue]Fetching {date_filter['description']} from SpendLogs...[/blue]")
+                return database.get_spend_logs_for_analysis(
+                    limit=limit,
+                    start_date=date_filter['start_date'],
+                    end_date=date_filter['end_date']
+                )
             console.print("[blue]Fetching data from SpendLogs for analysis...[/blue]")
             return database.get_spend_logs_for_analysis(limit=limit)
 
+    def iter_data(self, database: LiteLLMDatabase,
+                  date_filter: Optional[Dict[str, str]] = None,
+                  limit: Optional[int] = None,
+                  batch_size: int = LiteLLMDatabase.DEFAULT_BATCH_SIZE) -> Iterator[pl.DataFrame]:
+        """Stream spend logs in batches (server-side cursor, or the SpendLogs cache on cached databases)."""
+        if date_filter:
+            console.print(f"[blue]Streaming {date_filter['description']} from SpendLogs...[/blue]")
+            yield from database.iter_spend_logs_for_analysis(
+                batch_size=batch_size,
+                limit=limit,
+                start_date=date_filter['start_date'],
+                end_date=date_filter['end_date']
+            )
+        else:
+            console.print("[blue]Streaming data from SpendLogs...[/blue]")
+            yield from database.iter_spend_logs_for_analysis(batch_size=batch_size, limit=limit)
+
     def get_source_name(self) -> str:
         return "SpendLogs"
 
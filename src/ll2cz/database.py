@@ -4,7 +4,9 @@
 """Database connection and data extraction for LiteLLM with SQLite support."""
 
 import sqlite3
-from typing import Any, Dict, Optional, Union
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import polars as pl
@@ -14,9 +16,28 @@ import psycopg
 class LiteLLMDatabase:
     """Handle LiteLLM PostgreSQL and SQLite database connections and queries."""
 
-    def __init__(self, connection_string: str):
-        """Initialize database connection."""
+    DEFAULT_BATCH_SIZE = 50000
+    DEFAULT_PARTITIONS = 4
+    ENGINES = ('psycopg', 'connectorx')
+
+    def __init__(self, connection_string: str, engine: str = 'psycopg', partitions: int = DEFAULT_PARTITIONS):
+        """Initialize database connection.
+
+        Args:
+            connection_string: PostgreSQL URL or sqlite:// path
+            engine: Extraction engine for the bulk usage/SpendLogs reads. 'connectorx' reads
+                PostgreSQL through Arrow in `partitions` parallel date-range queries;
+                SQLite always uses the built-in driver.
+            partitions: Number of parallel date-range partitions for the connectorx engine
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Invalid engine: {engine}. Must be one of: {', '.join(self.ENGINES)}")
+        if partitions < 1:
+            raise ValueError(f"Invalid partitions: {partitions}. Must be at least 1")
+
         self.connection_string = connection_string
+        self.engine = engine
+        self.partitions = partitions
         self._connection: Optional[Union[psycopg.Connection, sqlite3.Connection]] = None
 
         # Parse connection string to determine database type
@@ -37,7 +58,9 @@ class LiteLLMDatabase:
         """Establish database connection."""
         if self.db_type == 'sqlite':
             if self._connection is None:
-                self._connection = sqlite3.connect(self.sqlite_path)
+                # The connection is reused across calls, and streaming transmits read from a
+                # producer thread, so it must not be pinned to the thread that opened it
+                self._connection = sqlite3.connect(self.sqlite_path, check_same_thread=False)
                 # Enable foreign keys in SQLite
                 self._connection.execute("PRAGMA foreign_keys = ON")
             return self._connection
@@ -58,6 +81,164 @@ class LiteLLMDatabase:
         if self.db_type == 'postgresql':
             conn.close()
 
+    def _placeholder(self) -> str:
+        """Get the DB-API parameter placeholder for the database type."""
+        return '?' if self.db_type == 'sqlite' else '%s'
+
+    def _build_date_filter(self, column: str, start_date: Optional[str] = None,
+                           end_date: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """Build a parameterized WHERE clause restricting a column to an inclusive date range.
+
+        Either bound may be omitted. Returns an empty clause when neither is given.
+        """
+        placeholder = self._placeholder()
+        if start_date and end_date:
+            return f"WHERE {column} BETWEEN {placeholder} AND {placeholder}", [start_date, end_date]
+        if start_date:
+            return f"WHERE {column} >= {placeholder}", [start_date]
+        if end_date:
+            return f"WHERE {column} <= {placeholder}", [end_date]
+        return '', []
+
+    def _execute_options(self, params: Optional[List[Any]]) -> Optional[Dict[str, Any]]:
+        """Build pl.read_database execute options for the driver's parameter argument name."""
+        if not params:
+            return None
+        # sqlite3 names the argument 'parameters', psycopg names it 'params'
+        key = 'parameters' if self.db_type == 'sqlite' else 'params'
+        return {key: params}
+
+    def _build_timestamp_filter(self, column: str, start_date: Optional[str] = None,
+                                end_date: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """Build a parameterized WHERE clause restricting a timestamp column to whole days.
+
+        The inclusive YYYY-MM-DD range is turned into a half-open timestamp range
+        ([start_date 00:00, end_date + 1 day 00:00)) so an index on the column can be used.
+        """
+        placeholder = self._placeholder()
+        conditions = []
+        params: List[Any] = []
+        if start_date:
+            conditions.append(f"{column} >= {placeholder}::timestamp")
+            params.append(start_date)
+        if end_date:
+            next_day = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
+            conditions.append(f"{column} < {placeholder}::timestamp")
+            params.append(next_day.strftime('%Y-%m-%d'))
+        if not conditions:
+            return '', []
+        return "WHERE " + " AND ".join(conditions), params
+
+    def _read_query(self, query: str, conn: Union[psycopg.Connection, sqlite3.Connection],
+                    params: Optional[List[Any]] = None) -> pl.DataFrame:
+        """Read a query into a DataFrame, binding parameters when provided."""
+        return pl.read_database(query, conn, execute_options=self._execute_options(params))
+
+    def _use_connectorx(self) -> bool:
+        """Check whether bulk reads should go through connectorx."""
+        return self.engine == 'connectorx' and self.db_type == 'postgresql'
+
+    @staticmethod
+    def _inline_params(query: str, params: List[Any]) -> str:
+        """Substitute %s placeholders with quoted literals (connectorx has no parameter binding).
+
+        Only used for the date bounds built by this class, which are validated YYYY-MM-DD strings.
+        """
+        for value in params:
+            literal = "'" + str(value).replace("'", "''") + "'"
+            query = query.replace('%s', literal, 1)
+        return query
+
+    @staticmethod
+    def _split_date_range(start_date: str, end_date: str, partitions: int) -> List[Tuple[str, str]]:
+        """Split an inclusive YYYY-MM-DD range into up to `partitions` contiguous sub-ranges, newest first."""
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
+        total_days = (end - start).days + 1
+        if total_days <= 0:
+            return [(start_date, end_date)]
+
+        partitions = min(partitions, total_days)
+        base, extra = divmod(total_days, partitions)
+        ranges = []
+        current = start
+        for i in range(partitions):
+            days = base + (1 if i < extra else 0)
+            range_end = current + timedelta(days=days - 1)
+            ranges.append((current.strftime('%Y-%m-%d'), range_end.strftime('%Y-%m-%d')))
+            current = range_end + timedelta(days=1)
+
+        # Queries order newest first, so keep the partitions in the same order
+        return list(reversed(ranges))
+
+    def _get_date_bounds(self, bounds_query: str) -> Tuple[Optional[str], Optional[str]]:
+        """Get the (min, max) date of a table as YYYY-MM-DD strings via connectorx."""
+        bounds = pl.read_database_uri(bounds_query, self.connection_string, engine='connectorx')
+        if bounds.is_empty() or bounds.row(0)[0] is None:
+            return None, None
+        return tuple(str(value)[:10] for value in bounds.row(0))
+
+    def _read_connectorx(self, build_query: Callable[..., Tuple[str, List[Any]]], bounds_query: str,
+                         limit: Optional[int], start_date: Optional[str], end_date: Optional[str]) -> pl.DataFrame:
+        """Read a date-filterable query through connectorx, partitioned by date range.
+
+        Each partition is an independent query over a contiguous slice of days; connectorx
+        runs them in parallel and writes straight into Arrow buffers. A limit applies to the
+        whole result, so limited reads run as a single query.
+        """
+        if limit:
+            query, params = build_query(limit, start_date, end_date)
+            return pl.read_database_uri(self._inline_params(query, params), self.connection_string,
+                                        engine='connectorx')
+
+        if not start_date or not end_date:
+            min_date, max_date = self._get_date_bounds(bounds_query)
+            if min_date is None:
+                # Empty table: still run the query so the result carries the right columns
+                query, params = build_query(None, start_date, end_date)
+                return pl.read_database_uri(self._inline_params(query, params), self.connection_string,
+                                            engine='connectorx')
+            start_date = start_date or min_date
+            end_date = end_date or max_date
+
+        queries = []
+        for part_start, part_end in self._split_date_range(start_date, end_date, self.partitions):
+            query, params = build_query(None, part_start, part_end)
+            queries.append(self._inline_params(query, params))
+
+        return pl.read_database_uri(queries if len(queries) > 1 else queries[0], self.connection_string,
+                                    engine='connectorx')
+
+    def iter_batches(self, query: str, params: Optional[List[Any]] = None,
+                     batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[pl.DataFrame]:
+        """Stream a query result as DataFrames of at most batch_size rows.
+
+        PostgreSQL reads through a named (server-side) cursor so only one batch is held
+        client-side at a time; SQLite uses fetchmany on a regular cursor.
+
+        Column dtypes are inferred per batch, so a column that is entirely null in one
+        batch may come back as pl.Null; use pl.concat(how='vertical_relaxed') to combine.
+        """
+        conn = self.connect()
+        try:
+            if self.db_type == 'sqlite':
+                cursor = conn.cursor()
+            else:
+                cursor = conn.cursor(name=f"ll2cz_stream_{uuid.uuid4().hex[:12]}")
+                cursor.itersize = batch_size
+            try:
+                yield from pl.read_database(
+                    query,
+                    cursor,
+                    iter_batches=True,
+                    batch_size=batch_size,
+                    execute_options=self._execute_options(params)
+                )
+            finally:
+                cursor.close()
+        finally:
+            self._close_connection(conn)
+
     def _adapt_query_for_db(self, query: str) -> str:
         """Adapt query syntax for specific database."""
         if self.db_type == 'sqlite':
@@ -75,8 +256,16 @@ class LiteLLMDatabase:
                 query = query.replace(f'"{table}"', table)
         return query
 
-    def get_usage_data(self, limit: Optional[int] = None) -> pl.DataFrame:
-        """Retrieve enriched usage data from LiteLLM DailyUserSpend table."""
+    def _usage_data_query(self, limit: Optional[int] = None, start_date: Optional[str] = None,
+                          end_date: Optional[str] = None,
+                          updated_since: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """Build the enriched DailyUserSpend query and its parameters."""
+        date_clause, params = self._build_date_filter('s.date', start_date, end_date)
+        if updated_since:
+            # Rows that were inserted or updated at or after the watermark (used for delta cache syncs)
+            change_condition = f"COALESCE(s.updated_at, s.created_at) >= {self._placeholder()}::timestamp"
+            date_clause = f"{date_clause} AND {change_condition}" if date_clause else f"WHERE {change_condition}"
+            params.append(updated_since)
         query = f"""
         SELECT
             s.id,
@@ -110,18 +299,49 @@ class LiteLLMDatabase:
         LEFT JOIN {self._quote_table('LiteLLM_UserTable')} u ON vt.user_id = u.user_id
         LEFT JOIN {self._quote_table('LiteLLM_TeamTable')} t ON vt.team_id = t.team_id
         LEFT JOIN {self._quote_table('LiteLLM_OrganizationTable')} o ON vt.organization_id = o.organization_id
+        {date_clause}
         ORDER BY s.date DESC, s.created_at DESC
         """
 
         if limit:
             query += f" LIMIT {limit}"
 
+        return self._adapt_query_for_db(query), params
+
+    def get_usage_data(self, limit: Optional[int] = None, start_date: Optional[str] = None,
+                       end_date: Optional[str] = None, updated_since: Optional[str] = None) -> pl.DataFrame:
+        """Retrieve enriched usage data from LiteLLM DailyUserSpend table.
+
+        Args:
+            limit: Optional maximum number of records, applied after the date filter
+            start_date: Optional inclusive lower bound on s.date (YYYY-MM-DD)
+            end_date: Optional inclusive upper bound on s.date (YYYY-MM-DD)
+            updated_since: Optional timestamp; only rows whose updated_at (or created_at when
+                updated_at is NULL) is at or after it are returned
+        """
+        if self._use_connectorx():
+            if updated_since:
+                # Deltas are small; a single query beats probing the table for partitions
+                query, params = self._usage_data_query(limit, start_date, end_date, updated_since)
+                return pl.read_database_uri(self._inline_params(query, params), self.connection_string,
+                                            engine='connectorx')
+            bounds_query = f'SELECT MIN(date), MAX(date) FROM {self._quote_table("LiteLLM_DailyUserSpend")}'
+            return self._read_connectorx(self._usage_data_query, bounds_query, limit, start_date, end_date)
+
+        query, params = self._usage_data_query(limit, start_date, end_date, updated_since)
+
         conn = self.connect()
         try:
-            return pl.read_database(query, conn)
+            return self._read_query(query, conn, params)
         finally:
             self._close_connection(conn)
 
+    def iter_usage_data(self, batch_size: int = DEFAULT_BATCH_SIZE, limit: Optional[int] = None,
+                        start_date: Optional[str] = None, end_date: Optional[str] = None) -> Iterator[pl.DataFrame]:
+        """Stream enriched usage data in bounded-size batches (see iter_batches)."""
+        query, params = self._usage_data_query(limit, start_date, end_date)
+        return self.iter_batches(query, params, batch_size=batch_size)
+
     def get_spend_analysis_data(self, limit: Optional[int] = None) -> pl.DataFrame:
         """Retrieve consolidated spend data from user and team tables."""
         query = f"""
@@ -207,6 +427,57 @@ class LiteLLMDatabase:
         finally:
             self._close_connection(conn)
 
+    def _get_table_columns(self, conn: Union[psycopg.Connection, sqlite3.Connection],
+                           table_name: str) -> List[Dict[str, Any]]:
+        """Get column name, declared type and nullability of a table from the catalog."""
+        if self.db_type == 'sqlite':
+            columns_df = pl.read_database(f"PRAGMA table_info({table_name})", conn)
+            return [{'column_name': row['name'], 'data_type': row['type'], 'is_nullable': not row['notnull']}
+                    for row in columns_df.to_dicts()]
+
+        query = f"""
+        SELECT column_name, data_type, is_nullable
+        FROM information_schema.columns
+        WHERE table_name = '{table_name}'
+        ORDER BY ordinal_position;
+        """
+        return pl.read_database(query, conn).to_dicts()
+
+    @staticmethod
+    def _declared_type_to_polars(data_type: str) -> pl.DataType:
+        """Map a declared SQL column type to the polars dtype used for it in the cache."""
+        data_type = (data_type or '').lower()
+        if 'int' in data_type:
+            return pl.Int64
+        if any(name in data_type for name in ('real', 'double', 'float', 'numeric', 'decimal')):
+            return pl.Float64
+        if 'bool' in data_type:
+            return pl.Boolean
+        return pl.Utf8
+
+    def get_usage_data_schema(self) -> Dict[str, pl.DataType]:
+        """Get the column names and dtypes of the enriched usage query without fetching any rows.
+
+        Runs the usage query with LIMIT 0. Columns whose dtype can't be inferred from an empty
+        result (SQLite reports them as Null) take the declared type of the matching
+        LiteLLM_DailyUserSpend column, falling back to text.
+        """
+        query, params = self._usage_data_query()
+        conn = self.connect()
+        try:
+            probe = self._read_query(f"{query} LIMIT 0", conn, params)
+            declared_types = {column['column_name']: column['data_type']
+                              for column in self._get_table_columns(conn, 'LiteLLM_DailyUserSpend')}
+        finally:
+            self._close_connection(conn)
+
+        schema = {}
+        for column, dtype in probe.schema.items():
+            if dtype == pl.Null:
+                dtype = self._declared_type_to_polars(declared_types.get(column, 'text'))
+            schema[column] = dtype
+        return schema
+
     def get_table_info(self) -> Dict[str, Any]:
         """Get information about the consolidated daily spend tables."""
         conn = self.connect()
@@ -217,20 +488,7 @@ class LiteLLMDatabase:
             tag_count = self._get_table_row_count(conn, 'LiteLLM_DailyTagSpend')
 
             # Get column structure
-            if self.db_type == 'sqlite':
-                query = "PRAGMA table_info(LiteLLM_DailyUserSpend)"
-                columns_df = pl.read_database(query, conn)
-                columns = [{'column_name': row['name'], 'data_type': row['type'], 'is_nullable': not row['notnull']}
-                          for row in columns_df.to_dicts()]
-            else:
-                query = """
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns
-                WHERE table_name = 'LiteLLM_DailyUserSpend'
-                ORDER BY ordinal_position;
-                """
-                columns_df = pl.read_database(query, conn)
-                columns = columns_df.to_dicts()
+            columns = self._get_table_columns(conn, 'LiteLLM_DailyUserSpend')
 
             return {
                 'columns': columns,
@@ -458,8 +716,16 @@ class LiteLLMDatabase:
         finally:
             self._close_connection(conn)
 
-    def get_spend_logs_for_analysis(self, limit: Optional[int] = None) -> pl.DataFrame:
-        """Retrieve SpendLogs data enriched with org information for CZRN/CBF analysis."""
+    def _spend_logs_analysis_query(self, limit: Optional[int] = None, start_date: Optional[str] = None,
+                                   end_date: Optional[str] = None,
+                                   started_since: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """Build the enriched SpendLogs query and its parameters."""
+        time_clause, params = self._build_timestamp_filter('s."startTime"', start_date, end_date)
+        if started_since:
+            # Rows that started at or after the watermark (used for incremental cache ingestion)
+            since_condition = f's."startTime" >= {self._placeholder()}::timestamp'
+            time_clause = f"{time_clause} AND {since_condition}" if time_clause else f"WHERE {since_condition}"
+            params.append(started_since)
         query = self._adapt_query_for_db(f"""
         SELECT
             s.request_id::text,
@@ -469,7 +735,7 @@ class LiteLLMDatabase:
             s.total_tokens::integer,
             s.prompt_tokens::integer,
             s.completion_tokens::integer,
-            s.startTime::timestamp as start_time,
+            s."startTime"::timestamp as start_time,
             s.model::text,
             s.model_group::text,
             s.custom_llm_provider::text,
@@ -488,20 +754,53 @@ class LiteLLMDatabase:
             COALESCE(vt.team_id, t.team_id, s.team_id)::text as enriched_team_id,
             o.organization_alias::text,
             COALESCE(vt.organization_id, o.organization_id)::text as organization_id,
-            s.startTime::date as date
+            s."startTime"::date as date
         FROM {self._quote_table('LiteLLM_SpendLogs')} s
         LEFT JOIN {self._quote_table('LiteLLM_VerificationToken')} vt ON s.api_key = vt.token
         LEFT JOIN {self._quote_table('LiteLLM_UserTable')} u ON s.user = u.user_id
         LEFT JOIN {self._quote_table('LiteLLM_TeamTable')} t ON COALESCE(vt.team_id, s.team_id) = t.team_id
         LEFT JOIN {self._quote_table('LiteLLM_OrganizationTable')} o ON vt.organization_id = o.organization_id
-        ORDER BY s.startTime DESC
+        {time_clause}
+        ORDER BY s."startTime" DESC
         """)
 
         if limit:
             query += f" LIMIT {limit}"
 
+        return query, params
+
+    def get_spend_logs_for_analysis(self, limit: Optional[int] = None, start_date: Optional[str] = None,
+                                    end_date: Optional[str] = None,
+                                    started_since: Optional[str] = None) -> pl.DataFrame:
+        """Retrieve SpendLogs data enriched with org information for CZRN/CBF analysis.
+
+        Args:
+            limit: Optional maximum number of records, applied after the date filter
+            start_date: Optional first day (YYYY-MM-DD) of startTime to include
+            end_date: Optional last day (YYYY-MM-DD) of startTime to include
+            started_since: Optional timestamp; only rows whose startTime is at or after it are returned
+        """
+        if self._use_connectorx():
+            if started_since:
+                # Increments are small; a single query beats probing the table for partitions
+                query, params = self._spend_logs_analysis_query(limit, start_date, end_date, started_since)
+                return pl.read_database_uri(self._inline_params(query, params), self.connection_string,
+                                            engine='connectorx')
+            bounds_query = (f'SELECT MIN("startTime")::date, MAX("startTime")::date '
+                            f'FROM {self._quote_table("LiteLLM_SpendLogs")}')
+            return self._read_connectorx(self._spend_logs_analysis_query, bounds_query, limit, start_date, end_date)
+
+        query, params = self._spend_logs_analysis_query(limit, start_date, end_date, started_since)
+
         conn = self.connect()
         try:
-            return pl.read_database(query, conn)
+            return self._read_query(query, conn, params)
         finally:
             self._close_connection(conn)
+
+    def iter_spend_logs_for_analysis(self, batch_size: int = DEFAULT_BATCH_SIZE, limit: Optional[int] = None,
+                                     start_date: Optional[str] = None, end_date: Optional[str] = None,
+                                     started_since: Optional[str] = None) -> Iterator[pl.DataFrame]:
+        """Stream enriched SpendLogs data in bounded-size batches (see iter_batches)."""
+        query, params = self._spend_logs_analysis_query(limit, start_date, end_date, started_since)
+        return self.iter_batches(query, params, batch_size=batch_size)
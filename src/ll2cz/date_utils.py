@@ -7,6 +7,7 @@ import zoneinfo
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple, Union
 
+import polars as pl
 from rich.console import Console
 
 console = Console()
@@ -209,3 +210,16 @@ def get_date_range(start_date: str, end_date: str) -> Tuple[datetime, datetime]:
         hour=23, minute=59, second=59, microsecond=999999, tzinfo=timezone.utc
     )
     return start, end
+
+
+def format_utc_timestamp(timestamp: pl.Expr) -> pl.Expr:
+    """Format a UTC (or naive UTC) datetime expression as an ISO-8601 string ending in Z.
+
+    Fractional seconds are included only when non-zero, matching datetime.isoformat().
+    """
+    return pl.concat_str([
+        timestamp.dt.strftime('%Y-%m-%dT%H:%M:%S'),
+        pl.when(timestamp.dt.microsecond() != 0)
+          .then(pl.lit('.') + timestamp.dt.strftime('%6f')).otherwise(pl.lit('')),
+        pl.lit('Z'),
+    ])
@@ -15,7 +15,7 @@ from rich.table import Table
 from .model_name_strategies import extract_model_name
 from .transformations import (
     generate_resource_id,
-    normalize_component,
+    normalize_component_cached,
     normalize_service,
     parse_date,
 )
@@ -73,6 +73,12 @@ class ConsolidatedErrorTracker:
         """Increment total operations counter."""
         self.total_operations += 1
 
+    def merge(self, errors: List[ErrorRecord], successful_operations: int = 0, total_operations: int = 0) -> None:
+        """Merge errors and counters collected by another tracker (e.g. in a worker process)."""
+        self.errors.extend(errors)
+        self.successful_operations += successful_operations
+        self.total_operations += total_operations
+
     def analyze_source_fields(self, data: pl.DataFrame, source: str = "usertable") -> Dict[str, SourceFieldAnalysis]:
         """Analyze source data fields and their mappings to CZRN/CBF components."""
         field_analysis = {}
@@ -323,13 +329,13 @@ class ConsolidatedErrorTracker:
                             mapped_samples.append(f"'{transformed}'")
                         elif field_name == 'call_type':
                             # For call_type, use normalize_component (direct mapping)
-                            transformed = normalize_component(str(sample_value))
+                            transformed = normalize_component_cached(str(sample_value))
                             mapped_samples.append(f"'{transformed}'")
                         elif field_name == 'custom_llm_provider':
                             transformed = normalize_service(str(sample_value))
                             mapped_samples.append(f"'{transformed}'")
                         elif field_name == 'entity_id':
-                            transformed = normalize_component(str(sample_value))
+                            transformed = normalize_component_cached(str(sample_value))
                             mapped_samples.append(f"'{transformed}'")
                         elif field_name == 'date':
                             try:
@@ -4,12 +4,19 @@
 """Strategy pattern implementation for model name extraction."""
 
 import re
+import threading
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Set
 
 import yaml
 
+# Letter+number parts are model names ("o1"); number+letter parts are versions ("4o", "3b")
+_MODEL_NAME_PART = re.compile(r'^[a-z]+[0-9]+$')
+_VERSION_PART = re.compile(r'^[0-9]+[a-z]+$')
+_TRAILING_VERSION_SUFFIX = re.compile(r'-+(latest|stable|final|v[0-9]+)$')
+
 
 class ModelNameStrategy(ABC):
     """Abstract base class for model name extraction strategies."""
@@ -119,9 +126,9 @@ class VersionPatternStrategy(ModelNameStrategy):
 
             # Special case: preserve letter+number patterns (e.g., "o1", "m7")
             # but remove number+letter patterns (e.g., "4o", "3b")
-            if re.match(r'^[a-z]+[0-9]+$', part):
+            if _MODEL_NAME_PART.match(part):
                 is_version = False  # This is a model name like "o1"
-            elif re.match(r'^[0-9]+[a-z]+$', part):
+            elif _VERSION_PART.match(part):
                 is_version = True   # This is a version like "4o"
 
             if not is_version:
@@ -135,16 +142,26 @@ class VersionPatternStrategy(ModelNameStrategy):
 
         # Final cleanup - remove any trailing version-like suffixes
         # Note: preview is excluded here since it's a valid model variant (e.g., o1-preview)
-        result = re.sub(r'-+(latest|stable|final|v[0-9]+)$', '', result)
+        result = _TRAILING_VERSION_SUFFIX.sub('', result)
 
         return result if result else model.lower()
 
 
 class ModelNameExtractor:
-    """Main class that uses strategies to extract model names."""
+    """Main class that uses strategies to extract model names.
+
+    Results are memoized per raw model string in a bounded LRU cache; see cache_info().
+    """
 
-    def __init__(self, config_path: Optional[Path] = None):
-        """Initialize with configuration from YAML file."""
+    DEFAULT_CACHE_SIZE = 4096
+
+    def __init__(self, config_path: Optional[Path] = None, cache_size: int = DEFAULT_CACHE_SIZE):
+        """Initialize with configuration from YAML file.
+
+        Args:
+            config_path: Optional providers.yml path (defaults to the packaged config)
+            cache_size: Maximum number of distinct model strings whose results are kept
+        """
         if config_path is None:
             config_path = Path(__file__).parent / 'config' / 'providers.yml'
 
@@ -175,11 +192,24 @@ class ModelNameExtractor:
             )
         ]
 
+        self._extract_cached = lru_cache(maxsize=cache_size)(self._extract)
+
     def extract(self, model: str) -> str:
-        """Extract model name using the strategy pattern."""
+        """Extract model name using the strategy pattern (memoized per model string)."""
         if not model:
             return 'unknown'
+        return self._extract_cached(model)
 
+    def cache_info(self):
+        """Get hit/miss statistics of the extraction cache (functools.lru_cache CacheInfo)."""
+        return self._extract_cached.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear the extraction cache and its statistics."""
+        self._extract_cached.cache_clear()
+
+    def _extract(self, model: str) -> str:
+        """Extract model name by applying the strategies in order."""
         current_model = model
 
         # Apply strategies in order
@@ -196,11 +226,24 @@ class ModelNameExtractor:
         return current_model
 
 
+_default_extractor: Optional[ModelNameExtractor] = None
+_default_extractor_lock = threading.Lock()
+
+
+def get_model_name_extractor() -> ModelNameExtractor:
+    """Get the process-wide ModelNameExtractor, loading providers.yml on first use."""
+    global _default_extractor
+    if _default_extractor is None:
+        with _default_extractor_lock:
+            if _default_extractor is None:
+                _default_extractor = ModelNameExtractor()
+    return _default_extractor
+
+
 # Convenience function to maintain backward compatibility
 def extract_model_name(model: str) -> str:
     """Extract the core model name by removing version-related information.
 
-    This is a backward-compatible wrapper around ModelNameExtractor.
+    This is a backward-compatible wrapper around the shared ModelNameExtractor.
     """
-    extractor = ModelNameExtractor()
-    return extractor.extract(model)
+    return get_model_name_extractor().extract(model)
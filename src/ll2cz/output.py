@@ -3,16 +3,29 @@
 
 """Output modules for writing CBF data to various destinations."""
 
+import gzip
 import zoneinfo
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 import polars as pl
 from rich.console import Console
 
+from .checkpoint import CheckpointJournal, CheckpointKey, payload_content_hash
+from .date_utils import format_utc_timestamp
+from .payload import api_records, serialize_billing_drop
+from .retry import RetryPolicy, TokenBucket
+
+
+# UTC timestamp as the API expects it, without fractional seconds
+_CANONICAL_TIMESTAMP = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$'
+
 
 class CSVWriter:
     """Write CBF data to CSV file."""
@@ -51,15 +64,107 @@ class CSVWriter:
         return pl.DataFrame(flattened_records)
 
 
+@dataclass
+class BatchResult:
+    """Outcome of uploading one daily batch to the AnyCost API."""
+
+    batch_date: str
+    records: int
+    operation: str
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+    # Already acknowledged in the checkpoint journal, so not sent again
+    skipped: bool = False
+    # Requests the batch was split into (see CloudZeroStreamer.max_drop_bytes)
+    drops: int = 0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the batch was accepted by the API."""
+        return self.error is None
+
+
+@dataclass
+class _BillingDrop:
+    """A serialized daily batch waiting to be uploaded, as (operation, body) requests sent in order."""
+
+    result: BatchResult
+    parts: List[Tuple[str, bytes]]
+    checkpoint: Optional[CheckpointKey] = None
+
+
+class BatchUploadError(Exception):
+    """Raised after a batched send when one or more daily batches failed to upload."""
+
+    def __init__(self, results: List[BatchResult]):
+        self.results = results
+        failed = [result for result in results if not result.succeeded]
+        super().__init__(
+            f"{len(failed)} of {len(results)} daily batch(es) failed to upload: "
+            + ", ".join(f"{result.batch_date} ({result.error})" for result in failed)
+        )
+
+
 class CloudZeroStreamer:
-    """Stream CBF data to CloudZero AnyCost API with proper batching and timezone handling."""
+    """Stream CBF data to CloudZero AnyCost API with proper batching and timezone handling.
+
+    One pooled HTTP client is kept for the lifetime of the streamer (or until close()), so
+    connections are reused across daily batches. Use the streamer as a context manager or
+    call close() when done.
+    """
+
+    REQUEST_TIMEOUT = 30.0
+    COMPRESSIONS = ('gzip',)
+    # zlib's default: most of the ratio of level 9 at a fraction of the CPU time
+    GZIP_LEVEL = 6
+    # Serialized (uncompressed) size above which a daily batch is split into several requests
+    DEFAULT_MAX_DROP_BYTES = 5 * 1024 * 1024
+    # Operation for the parts of an hour after its first request, so they add to it
+    CONTINUATION_OPERATION = "sum"
+
+    def __init__(self, api_key: str, connection_id: str, user_timezone: Optional[str] = None,
+                 upload_concurrency: int = 1, retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[TokenBucket] = None, journal: Optional[CheckpointJournal] = None,
+                 resume: bool = False, compression: Optional[str] = None,
+                 max_drop_bytes: Optional[int] = DEFAULT_MAX_DROP_BYTES, max_drop_records: Optional[int] = None):
+        """Initialize CloudZero streamer with credentials.
+
+        Args:
+            api_key: CloudZero API key
+            connection_id: CloudZero AnyCost connection ID
+            user_timezone: Timezone assumed for timestamps without an offset (default: UTC)
+            upload_concurrency: Maximum number of daily batches uploaded at the same time
+            retry_policy: Backoff policy for failed uploads (default: RetryPolicy())
+            rate_limiter: Optional token bucket shared by all uploads from this streamer
+            journal: Optional checkpoint journal that records every acknowledged batch
+            resume: Skip batches the journal has already recorded as acknowledged
+            compression: Request body compression ('gzip'), applied in the upload threads
+            max_drop_bytes: Split daily batches whose serialized records exceed this size (None: no limit)
+            max_drop_records: Split daily batches with more records than this (None: no limit)
+        """
+        if upload_concurrency < 1:
+            raise ValueError(f"Invalid upload_concurrency: {upload_concurrency}. Must be at least 1")
+        if compression is not None and compression not in self.COMPRESSIONS:
+            raise ValueError(f"Invalid compression: {compression}. Must be one of: {', '.join(self.COMPRESSIONS)}")
+        if max_drop_bytes is not None and max_drop_bytes < 1:
+            raise ValueError(f"Invalid max_drop_bytes: {max_drop_bytes}. Must be at least 1")
+        if max_drop_records is not None and max_drop_records < 1:
+            raise ValueError(f"Invalid max_drop_records: {max_drop_records}. Must be at least 1")
 
-    def __init__(self, api_key: str, connection_id: str, user_timezone: Optional[str] = None):
-        """Initialize CloudZero streamer with credentials."""
         self.api_key = api_key
         self.connection_id = connection_id
+        self.upload_concurrency = upload_concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.journal = journal
+        self.resume = resume
+        self.compression = compression
+        self.max_drop_bytes = max_drop_bytes
+        self.max_drop_records = max_drop_records
         self.base_url = "https://api.cloudzero.com"
         self.console = Console()
+        self._client: Optional[httpx.Client] = None
+        self._exit_stack = ExitStack()
 
         # Set timezone - default to UTC
         if user_timezone:
@@ -71,55 +176,191 @@ class CloudZeroStreamer:
         else:
             self.user_timezone = timezone.utc
 
-    def send_batched(self, data: pl.DataFrame, operation: str = "replace_hourly") -> None:
-        """Send CBF data in daily batches to CloudZero AnyCost API."""
+    def __enter__(self) -> 'CloudZeroStreamer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP client; a new one is opened on the next send."""
+        self._exit_stack.close()
+        self._client = None
+
+    def _get_client(self) -> httpx.Client:
+        """Return the pooled HTTP client, opening it on first use."""
+        if self._client is None:
+            limits = httpx.Limits(max_connections=self.upload_concurrency,
+                                  max_keepalive_connections=self.upload_concurrency)
+            self._client = self._exit_stack.enter_context(
+                httpx.Client(timeout=self.REQUEST_TIMEOUT, limits=limits)
+            )
+        return self._client
+
+    def send_batched(self, data: pl.DataFrame, operation: str = "replace_hourly") -> List[BatchResult]:
+        """Send CBF data in daily batches to CloudZero AnyCost API.
+
+        Each day is serialized in the calling thread while earlier days are compressed and
+        posted by upload threads; up to upload_concurrency days are uploaded at the same time.
+        Every batch is attempted even if another one fails.
+
+        Returns:
+            One BatchResult per daily batch, in date-group order
+
+        Raises:
+            BatchUploadError: If any daily batch failed to upload
+        """
         if data.is_empty():
             self.console.print("[yellow]No data to send to CloudZero[/yellow]")
-            return
+            return []
 
         # Group data by date and send each day as a batch
         daily_batches = self._group_by_date(data)
 
         if not daily_batches:
             self.console.print("[yellow]No valid daily batches to send[/yellow]")
-            return
-
-        self.console.print(f"[blue]Sending {len(daily_batches)} daily batch(es) with operation '{operation}'[/blue]")
+            return []
+
+        concurrency = min(self.upload_concurrency, len(daily_batches))
+        concurrency_desc = f" ({concurrency} concurrent)" if concurrency > 1 else ""
+        self.console.print(f"[blue]Sending {len(daily_batches)} daily batch(es) with operation "
+                           f"'{operation}'{concurrency_desc}[/blue]")
+
+        # Open the shared client before fanning out so upload threads don't race to create it
+        self._get_client()
+        results = self._send_pipelined(daily_batches, operation, concurrency)
+
+        skipped = sum(1 for result in results if result.skipped)
+        if skipped:
+            self.console.print(f"[dim]Skipped {skipped} daily batch(es) already acknowledged in the checkpoint journal[/dim]")
+
+        if not all(result.succeeded for result in results):
+            raise BatchUploadError(results)
+        return results
+
+    def _send_pipelined(self, daily_batches: Dict[str, pl.DataFrame], operation: str,
+                        concurrency: int) -> List[BatchResult]:
+        """Serialize daily batches in this thread while upload threads compress and post earlier ones.
+
+        At most `concurrency` drops are uploading and one more is waiting, so only a few
+        serialized days are held in memory at a time.
+        """
+        results = []
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='ll2cz-upload') as executor:
+            for batch_date, batch_data in daily_batches.items():
+                result = BatchResult(batch_date=batch_date, records=len(batch_data), operation=operation)
+                results.append(result)
+
+                drop = self._prepare_drop(result, batch_data)
+                if drop is None:
+                    continue
+                while len(pending) > concurrency:
+                    pending.popleft().result()
+                pending.append(executor.submit(self._deliver_drop, drop))
 
-        for batch_date, batch_data in daily_batches.items():
-            self._send_daily_batch(batch_date, batch_data, operation)
+            for future in pending:
+                future.result()
+        return results
 
     def _group_by_date(self, data: pl.DataFrame) -> Dict[str, pl.DataFrame]:
-        """Group data by date, converting to UTC and validating dates."""
-        daily_batches = {}
+        """Group data by UTC date, in order of each date's first row.
 
+        Timestamps are converted to UTC as a column; timestamps without an offset are taken
+        in the streamer's timezone. Rows with a missing or unparseable timestamp are skipped.
+        """
         # Ensure we have the required columns
         if 'time/usage_start' not in data.columns:
             self.console.print("[red]Error: Missing 'time/usage_start' column for date grouping[/red]")
             return {}
 
-        for row in data.iter_rows(named=True):
-            try:
-                # Parse the timestamp and convert to UTC
-                timestamp_str = row.get('time/usage_start')
-                if not timestamp_str:
-                    continue
-
-                # Parse timestamp and handle timezone conversion
-                dt = self._parse_and_convert_timestamp(timestamp_str)
-                batch_date = dt.strftime('%Y-%m-%d')
+        batch_dates = self._utc_batch_dates(data['time/usage_start'])
+        dated = data.with_columns(batch_dates.alias('__batch_date')).filter(pl.col('__batch_date').is_not_null())
 
-                if batch_date not in daily_batches:
-                    daily_batches[batch_date] = []
-
-                daily_batches[batch_date].append(row)
+        # Partition on the Date column and format only the keys; casting every row to a string
+        # would cost more than the parsing
+        return {
+            key[0].isoformat(): batch.drop('__batch_date')
+            for key, batch in dated.partition_by('__batch_date', as_dict=True, maintain_order=True).items()
+        }
 
+    def _timezone_name(self) -> str:
+        """IANA name of the streamer's timezone for Polars time zone operations."""
+        return getattr(self.user_timezone, 'key', 'UTC')
+
+    def _utc_batch_dates(self, timestamps: pl.Series) -> pl.Series:
+        """Map a usage start column to UTC dates, null where it can't be parsed."""
+        return self._utc_timestamps(timestamps).dt.date()
+
+    def _utc_timestamps(self, timestamps: pl.Series) -> pl.Series:
+        """Convert a usage start column to UTC datetimes, null where it can't be parsed."""
+        if isinstance(timestamps.dtype, pl.Datetime):
+            if timestamps.dtype.time_zone is not None:
+                return timestamps.dt.convert_time_zone('UTC').dt.cast_time_unit('us')
+
+            utc = (
+                timestamps.dt.replace_time_zone(self._timezone_name(), ambiguous='earliest', non_existent='null')
+                .dt.convert_time_zone('UTC').dt.cast_time_unit('us')
+            )
+            # Local times skipped by a DST change go through the per-value parser, like strings
+            gap = utc.is_null() & timestamps.is_not_null()
+            if not gap.any():
+                return utc
+            local = timestamps.filter(gap).dt.strftime('%Y-%m-%dT%H:%M:%S%.f')
+            return utc.scatter(gap.arg_true(), self._parse_residual_timestamps(local))
+
+        if timestamps.dtype != pl.Utf8:
+            return pl.Series(timestamps.name, [None] * len(timestamps), dtype=pl.Datetime('us', 'UTC'))
+
+        # ISO-8601 in UTC (Z), with an offset, then without one in the streamer's timezone
+        value = pl.col('timestamp')
+        utc = pl.coalesce(
+            value.str.to_datetime('%Y-%m-%dT%H:%M:%S%.fZ', time_unit='us', strict=False, time_zone='UTC'),
+            value.str.to_datetime('%Y-%m-%dT%H:%M:%S%.f%:z', time_unit='us', strict=False, time_zone='UTC'),
+            value.str.to_datetime('%Y-%m-%dT%H:%M:%S%.f', time_unit='us', strict=False)
+            .dt.replace_time_zone(self._timezone_name(), ambiguous='earliest', non_existent='null')
+            .dt.convert_time_zone('UTC'),
+        )
+        frame = pl.DataFrame({'timestamp': timestamps}).with_columns(utc.alias('utc'))
+
+        # Other spellings fromisoformat accepts (date only, space separator, ...) are parsed
+        # once per distinct value
+        residual = frame.filter(
+            pl.col('utc').is_null() & pl.col('timestamp').is_not_null() & (pl.col('timestamp') != '')
+        )['timestamp'].unique(maintain_order=True)
+        if residual.is_empty():
+            return frame['utc']
+
+        return frame['utc'].fill_null(self._parse_residual_timestamps(frame['timestamp'], residual))
+
+    def _parse_residual_timestamps(self, timestamps: pl.Series, distinct: Optional[pl.Series] = None) -> pl.Series:
+        """Parse timestamps the vectorized paths can't, once per distinct value.
+
+        Values that can't be parsed are reported and left null.
+
+        Args:
+            timestamps: Timestamp strings
+            distinct: The distinct values of timestamps to parse (default: all of them)
+        """
+        if distinct is None:
+            distinct = timestamps.drop_nulls().unique(maintain_order=True)
+
+        parsed = {}
+        for timestamp_str in distinct:
+            try:
+                parsed[timestamp_str] = self._parse_and_convert_timestamp(timestamp_str)
             except Exception as e:
                 self.console.print(f"[yellow]Warning: Could not process timestamp '{timestamp_str}': {e}[/yellow]")
-                continue
+        return timestamps.replace_strict(parsed, default=None, return_dtype=pl.Datetime('us', 'UTC'))
+
+    def _api_timestamps(self, timestamps: pl.Series) -> pl.Series:
+        """Format a usage start column as UTC ISO-8601 strings ending in Z."""
+        # CBF produced by the transformer is already in this form; don't reformat it
+        if timestamps.dtype == pl.Utf8 and timestamps.str.contains(_CANONICAL_TIMESTAMP).all():
+            return timestamps
 
-        # Convert lists back to DataFrames
-        return {date_key: pl.DataFrame(records) for date_key, records in daily_batches.items() if records}
+        utc = self._utc_timestamps(timestamps).alias('utc')
+        return pl.DataFrame([utc]).select(format_utc_timestamp(pl.col('utc'))).to_series().alias(timestamps.name)
 
     def _parse_and_convert_timestamp(self, timestamp_str: str) -> datetime:
         """Parse timestamp string and convert to UTC."""
@@ -147,40 +388,160 @@ class CloudZeroStreamer:
         except ValueError as e:
             raise ValueError(f"Could not parse timestamp '{timestamp_str}': {e}")
 
-    def _send_daily_batch(self, batch_date: str, batch_data: pl.DataFrame, operation: str) -> None:
-        """Send a single daily batch to CloudZero API."""
+    def _prepare_drop(self, result: BatchResult, batch_data: pl.DataFrame) -> Optional[_BillingDrop]:
+        """Serialize a daily batch for upload.
+
+        Returns:
+            None if there is nothing to send: the batch is empty, or the journal already has
+            it (result.skipped is set)
+        """
         if batch_data.is_empty():
-            return
+            return None
 
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json'
-        }
+        # Prepare the batch payload according to AnyCost API format
+        month, encoded = self._encode_batch(result.batch_date, batch_data)
+
+        checkpoint = None
+        if self.journal:
+            checkpoint = CheckpointKey(self.connection_id, month, result.batch_date, result.operation,
+                                       payload_content_hash(encoded['record']))
+            if self.resume and self.journal.is_acknowledged(checkpoint):
+                self.console.print(f"[dim]Skipping batch for {result.batch_date} ({len(batch_data)} records), "
+                                   f"already acknowledged[/dim]")
+                result.skipped = True
+                return None
+
+        parts = [(operation, serialize_billing_drop(month, operation, records))
+                 for operation, records in self._split_drop(encoded, result.operation)]
+        result.drops = len(parts)
+        return _BillingDrop(result, parts, checkpoint)
+
+    def _split_drop(self, encoded: pl.DataFrame, operation: str) -> List[Tuple[str, pl.Series]]:
+        """Split a day's encoded records into requests within max_drop_bytes and max_drop_records.
+
+        Requests hold whole hours where possible and keep the batch operation. An hour too large
+        for one request is split: its first part keeps the operation and the rest are sent with
+        CONTINUATION_OPERATION, each holding only that hour, so replace_hourly still replaces the
+        hour exactly once. replace_drop replaces the whole month with each request, so only the
+        first request keeps it and every later one is sent with CONTINUATION_OPERATION.
+
+        Returns:
+            (operation, records) per request, in the order they must be sent
+        """
+        max_bytes = self.max_drop_bytes or float('inf')
+        max_records = self.max_drop_records or float('inf')
+
+        # Each record takes its length plus a separating comma in the body
+        lengths = encoded['record'].str.len_bytes() + 1
+        if len(encoded) <= max_records and lengths.sum() <= max_bytes:
+            return [(operation, encoded['record'])]
+
+        encoded = encoded.with_columns(lengths.alias('length')).sort('hour', maintain_order=True)
+        hours = encoded['hour'].to_list()
+        lengths = encoded['length'].to_list()
+
+        boundaries = []
+        start, size, part_operation = 0, 0, operation
+        for i, (hour, length) in enumerate(zip(hours, lengths)):
+            if i > start:
+                new_hour = hour != hours[i - 1]
+                if i - start >= max_records or size + length > max_bytes:
+                    boundaries.append((part_operation, start, i))
+                    start, size = i, 0
+                    part_operation = operation if new_hour else self.CONTINUATION_OPERATION
+                elif new_hour and part_operation != operation:
+                    # A continuation request carries only the rest of its hour
+                    boundaries.append((part_operation, start, i))
+                    start, size, part_operation = i, 0, operation
+            size += length
+        boundaries.append((part_operation, start, len(hours)))
+
+        if operation == 'replace_drop':
+            boundaries = [(operation if i == 0 else self.CONTINUATION_OPERATION, first, last)
+                          for i, (_, first, last) in enumerate(boundaries)]
+
+        records = encoded['record']
+        return [(part_operation, records.slice(first, last - first)) for part_operation, first, last in boundaries]
+
+    def _deliver_drop(self, drop: _BillingDrop) -> None:
+        """Compress (if enabled) and send a prepared batch, recording the outcome on its result.
+
+        The requests of a split batch are sent one after another, and the rest are abandoned
+        after a failure, so a continuation is never applied without the request before it.
+        """
+        result = drop.result
+        batch_date = result.batch_date
 
         # Use the correct API endpoint format from documentation
         url = f"{self.base_url}/v2/connections/billing/anycost/{self.connection_id}/billing_drops"
 
-        # Prepare the batch payload according to AnyCost API format
-        payload = self._prepare_batch_payload(batch_date, batch_data, operation)
+        drops_desc = f" in {len(drop.parts)} drops" if len(drop.parts) > 1 else ""
+        self.console.print(f"[blue]Sending batch for {batch_date} ({result.records} records{drops_desc})[/blue]")
 
-        try:
-            with httpx.Client(timeout=30.0) as client:
-                self.console.print(f"[blue]Sending batch for {batch_date} ({len(batch_data)} records)[/blue]")
+        for part, (operation, body) in enumerate(drop.parts, start=1):
+            headers = {
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json'
+            }
+            if self.compression == 'gzip':
+                body = gzip.compress(body, compresslevel=self.GZIP_LEVEL)
+                headers['Content-Encoding'] = 'gzip'
 
-                response = client.post(url, headers=headers, json=payload)
+            part_desc = f" (drop {part}/{len(drop.parts)})" if len(drop.parts) > 1 else ""
+            try:
+                self._post(batch_date, url, headers, body, operation)
+            except httpx.RequestError as e:
+                self.console.print(f"[red]✗ Network error sending batch for {batch_date}{part_desc}: {e}[/red]")
+                result.error = f"{type(e).__name__}: {e}"
+                return
+            except httpx.HTTPStatusError as e:
+                self.console.print(f"[red]✗ HTTP error sending batch for {batch_date}{part_desc}: "
+                                   f"{e.response.status_code} {e.response.text}[/red]")
+                result.status_code = e.response.status_code
+                result.error = f"HTTP {e.response.status_code}"
+                return
+
+        self.console.print(f"[green]✓ Successfully sent batch for {batch_date} ({result.records} records)[/green]")
+
+        if drop.checkpoint:
+            self.journal.record(drop.checkpoint, result.records)
+
+    def _post(self, batch_date: str, url: str, headers: Dict[str, str], payload: bytes,
+              operation: str) -> httpx.Response:
+        """POST a billing drop, retrying transient failures according to the retry policy."""
+        attempt = 1
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            try:
+                response = self._get_client().post(url, headers=headers, content=payload)
                 response.raise_for_status()
-
-                self.console.print(f"[green]✓ Successfully sent batch for {batch_date} ({len(batch_data)} records)[/green]")
-
-        except httpx.RequestError as e:
-            self.console.print(f"[red]✗ Network error sending batch for {batch_date}: {e}[/red]")
-            raise
-        except httpx.HTTPStatusError as e:
-            self.console.print(f"[red]✗ HTTP error sending batch for {batch_date}: {e.response.status_code} {e.response.text}[/red]")
-            raise
-
-    def _prepare_batch_payload(self, batch_date: str, batch_data: pl.DataFrame, operation: str) -> Dict[str, Any]:
-        """Prepare batch payload according to CloudZero AnyCost API format."""
+                return response
+            except httpx.HTTPError as e:
+                if not self.retry_policy.should_retry(e, operation, attempt):
+                    raise
+                error = e
+
+            delay = self.retry_policy.delay_for(attempt, error)
+            # Throttling applies to the connection, so hold back every upload sharing the limiter
+            if self.rate_limiter and self.retry_policy.retry_after(error) is not None:
+                self.rate_limiter.pause(delay)
+
+            if isinstance(error, httpx.HTTPStatusError):
+                reason = f"HTTP {error.response.status_code}"
+            else:
+                reason = type(error).__name__
+            self.console.print(f"[yellow]Retrying batch for {batch_date} in {delay:.1f}s "
+                               f"(attempt {attempt + 1}/{self.retry_policy.max_attempts}, {reason})[/yellow]")
+            self.retry_policy.sleep(delay)
+            attempt += 1
+
+    def _encode_batch(self, batch_date: str, batch_data: pl.DataFrame) -> Tuple[str, pl.DataFrame]:
+        """Encode a daily batch's rows as API records.
+
+        Returns:
+            Tuple of (month, frame of encoded 'record' strings with the UTC 'hour' each belongs to)
+        """
         # Convert batch_date to month for the API (YYYY-MM format)
         try:
             date_obj = datetime.strptime(batch_date, '%Y-%m-%d')
@@ -189,61 +550,11 @@ class CloudZeroStreamer:
             # Fallback to current month
             month_str = datetime.now().strftime('%Y-%m')
 
-        # Convert DataFrame rows to API format
-        data_records = []
-        for row in batch_data.iter_rows(named=True):
-            record = self._convert_cbf_to_api_format(row)
-            if record:
-                data_records.append(record)
-
-        payload = {
-            'month': month_str,
-            'operation': operation,
-            'data': data_records
-        }
-
-        return payload
-
-    def _convert_cbf_to_api_format(self, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Convert CBF row to CloudZero API format - keeping CBF field names as CloudZero expects them."""
-        try:
-            # CloudZero expects CBF format field names directly, not converted names
-            api_record = {}
-
-            # Copy all CBF fields, converting numeric values to strings as required by CloudZero
-            for key, value in row.items():
-                if value is not None:
-                    # CloudZero requires numeric values to be strings, but NOT in scientific notation
-                    if isinstance(value, (int, float, Decimal)):
-                        # Format floats and decimals to avoid scientific notation
-                        if isinstance(value, (float, Decimal)):
-                            # Use a reasonable precision that avoids scientific notation
-                            api_record[key] = f"{float(value):.10f}".rstrip('0').rstrip('.')
-                        else:
-                            api_record[key] = str(value)
-                    else:
-                        api_record[key] = value
-
-            # Ensure timestamp is in UTC format
-            if 'time/usage_start' in api_record:
-                api_record['time/usage_start'] = self._ensure_utc_timestamp(api_record['time/usage_start'])
-
-            return api_record
-
-        except Exception as e:
-            self.console.print(f"[yellow]Warning: Could not convert record to API format: {e}[/yellow]")
-            return None
-
-    def _ensure_utc_timestamp(self, timestamp_str: str) -> str:
-        """Ensure timestamp is in UTC format for API."""
-        if not timestamp_str:
-            return datetime.now(timezone.utc).isoformat()
-
-        try:
-            dt = self._parse_and_convert_timestamp(timestamp_str)
-            return dt.isoformat().replace('+00:00', 'Z')
-        except Exception:
-            # Fallback to current time in UTC
-            return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-
+        # Timestamps go out in UTC; numeric formatting and JSON encoding happen column-wise
+        if 'time/usage_start' in batch_data.columns:
+            batch_data = batch_data.with_columns(self._api_timestamps(batch_data['time/usage_start']))
+            hours = batch_data['time/usage_start'].str.slice(0, 13)
+        else:
+            hours = pl.Series([None] * len(batch_data), dtype=pl.Utf8)
 
+        return month_str, pl.DataFrame({'hour': hours, 'record': api_records(batch_data)})
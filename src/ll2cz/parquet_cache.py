@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Date-partitioned Parquet storage backend for the LiteLLM data cache."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import polars as pl
+
+from .cache import DataCache
+from .database import LiteLLMDatabase
+
+
+class ParquetDataCache(DataCache):
+    """Data cache that keeps consolidated spend as date-partitioned Parquet files.
+
+    Records live under <cache_dir>/<conn_hash>/date=YYYY-MM-DD/data.parquet and are read
+    lazily with pl.scan_parquet, so date filters only open the matching partitions.
+    Freshness, watermark and schema metadata stay in the SQLite cache_metadata table.
+    """
+
+    PARTITION_FILE = 'data.parquet'
+
+    def _get_partition_root(self, connection_string: str) -> Path:
+        """Get the directory holding the partitions for a connection."""
+        return self.cache_dir / self._get_connection_hash(connection_string)
+
+    def _get_partition_path(self, connection_string: str, date: str) -> Path:
+        """Get the Parquet file for one date partition."""
+        return self._get_partition_root(connection_string) / f"date={date}" / self.PARTITION_FILE
+
+    def _list_partition_files(self, connection_string: str) -> List[Path]:
+        """List the partition files for a connection."""
+        return sorted(self._get_partition_root(connection_string).glob(f"date=*/{self.PARTITION_FILE}"))
+
+    def _scan(self, connection_string: str) -> Optional[pl.LazyFrame]:
+        """Lazily scan all partitions for a connection, or None when nothing is cached."""
+        if not self._list_partition_files(connection_string):
+            return None
+        return pl.scan_parquet(
+            self._get_partition_root(connection_string) / f"date=*/{self.PARTITION_FILE}",
+            hive_partitioning=True,
+            hive_schema={'date': pl.Utf8}
+        )
+
+    @staticmethod
+    def _write_partition(data: pl.DataFrame, path: Path) -> None:
+        """Atomically write one partition file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.parquet.tmp')
+        data.write_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+    def _normalize(self, data: pl.DataFrame, schema: Optional[Dict[str, pl.DataType]] = None) -> pl.DataFrame:
+        """Give a batch stable dtypes so every partition shares one schema.
+
+        Dates are stored as YYYY-MM-DD text like the SQLite cache. When the cache already holds
+        data, the batch is cast to that schema; otherwise all-null columns become text.
+        """
+        data = data.with_columns(pl.col('date').cast(pl.Utf8).str.slice(0, 10))
+        casts = []
+        for column, dtype in data.schema.items():
+            target = schema.get(column) if schema else None
+            if target is not None and target != dtype:
+                casts.append(pl.col(column).cast(target, strict=False))
+            elif target is None and dtype == pl.Null:
+                casts.append(pl.col(column).cast(pl.Utf8))
+        if casts:
+            data = data.with_columns(casts)
+        if schema:
+            data = data.select([column for column in schema if column in data.columns] +
+                               [column for column in data.columns if column not in schema])
+        return data
+
+    def _count_cached_records(self, connection_string: Optional[str] = None) -> int:
+        """Count the records held in the cache (from Parquet footers only)."""
+        lazy_frame = self._scan(connection_string or "")
+        if lazy_frame is None:
+            return 0
+        return lazy_frame.select(pl.len()).collect().item()
+
+    def _get_cached_columns(self, connection_string: str) -> set:
+        """Get the column names the cache can hold."""
+        columns = self._get_cache_metadata(f"parquet_columns_{self._get_connection_hash(connection_string)}")
+        return set(json.loads(columns)) if columns else set()
+
+    def _set_cached_columns(self, connection_string: str, columns: List[str]) -> None:
+        """Remember the column names the cache holds."""
+        conn_hash = self._get_connection_hash(connection_string)
+        self._set_cache_metadata(f"parquet_columns_{conn_hash}", json.dumps(list(columns)))
+
+    def _store_records(self, connection_string: str, data: pl.DataFrame, replace: bool) -> int:
+        """Store fetched records, either replacing the cached partitions or upserting into them."""
+        root = self._get_partition_root(connection_string)
+        if replace:
+            shutil.rmtree(root, ignore_errors=True)
+            schema = None
+        else:
+            lazy_frame = self._scan(connection_string)
+            schema = dict(lazy_frame.collect_schema()) if lazy_frame is not None else None
+
+        if data.is_empty():
+            return 0
+
+        data = self._normalize(data, schema)
+        for (date,), partition in data.partition_by('date', as_dict=True, maintain_order=True).items():
+            path = self._get_partition_path(connection_string, date)
+            if not replace and path.exists():
+                # Replace existing rows with the same key, keep the rest of the day
+                existing = pl.read_parquet(path)
+                partition = pl.concat([
+                    existing.join(partition.select('id', 'entity_type'), on=['id', 'entity_type'], how='anti'),
+                    partition
+                ], how='diagonal_relaxed')
+            self._write_partition(partition, path)
+
+        self._set_cached_columns(connection_string, data.columns)
+        return len(data)
+
+    def _read_cached_records(self, connection_string: str, limit: Optional[int] = None,
+                             start_date: Optional[str] = None, end_date: Optional[str] = None) -> pl.DataFrame:
+        """Read cached records; the date filter prunes partitions before any file is opened."""
+        lazy_frame = self._scan(connection_string)
+        if lazy_frame is None:
+            return pl.DataFrame()
+
+        if start_date:
+            lazy_frame = lazy_frame.filter(pl.col('date') >= start_date)
+        if end_date:
+            lazy_frame = lazy_frame.filter(pl.col('date') <= end_date)
+
+        lazy_frame = lazy_frame.sort(['date', 'created_at'], descending=True, nulls_last=True)
+        if limit:
+            lazy_frame = lazy_frame.head(limit)
+        return lazy_frame.collect()
+
+    def _iter_cached_records(self, connection_string: str, batch_size: int, limit: Optional[int] = None,
+                             start_date: Optional[str] = None,
+                             end_date: Optional[str] = None) -> Iterator[pl.DataFrame]:
+        """Stream cached records one date partition at a time, newest first, so only one day is held in memory."""
+        lazy_frame = self._scan(connection_string)
+        if lazy_frame is None:
+            return
+
+        dates = sorted({path.parent.name.split('=', 1)[1] for path in self._list_partition_files(connection_string)},
+                       reverse=True)
+        remaining = limit or None
+        for date in dates:
+            if (start_date and date < start_date) or (end_date and date > end_date):
+                continue
+
+            partition = lazy_frame.filter(pl.col('date') == date).sort('created_at', descending=True, nulls_last=True)
+            if remaining:
+                partition = partition.head(remaining)
+            data = partition.collect()
+            yield from data.iter_slices(n_rows=batch_size)
+
+            if remaining:
+                remaining -= len(data)
+                if remaining <= 0:
+                    return
+
+    def _get_cached_breakdown(self, connection_string: str) -> Dict[str, int]:
+        """Get cached record counts by entity type."""
+        lazy_frame = self._scan(connection_string)
+        if lazy_frame is None:
+            return {}
+        counts = lazy_frame.group_by('entity_type').len().collect()
+        return dict(counts.iter_rows())
+
+    def _clear_cached_records(self, connection_string: Optional[str] = None) -> None:
+        """Remove cached partitions for one connection, or for all connections."""
+        if connection_string:
+            shutil.rmtree(self._get_partition_root(connection_string), ignore_errors=True)
+            return
+
+        for path in self.cache_dir.iterdir():
+            if path.is_dir() and any(path.glob('date=*')):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _recreate_cache_schema(self, database: LiteLLMDatabase,
+                               server_schema: Optional[Dict[str, pl.DataType]] = None) -> None:
+        """Record the server schema; Parquet files carry their own schema and are rewritten on refresh."""
+        try:
+            if server_schema is None:
+                server_schema = database.get_usage_data_schema()
+            self._set_cached_columns(database.connection_string, list(server_schema))
+        except Exception as e:
+            self.console.print(f"[red]Failed to recreate cache schema: {e}[/red]")
+
+    def get_cache_info(self, connection_string: str) -> Dict:
+        """Get information about cached data."""
+        result = super().get_cache_info(connection_string)
+        result['cache_backend'] = 'parquet'
+        result['partition_dir'] = str(self._get_partition_root(connection_string))
+        result['partition_count'] = len(self._list_partition_files(connection_string))
+        return result
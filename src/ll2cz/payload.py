@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Columnar serialization of CBF batches into AnyCost billing_drops request bodies."""
+
+import io
+
+import orjson
+import polars as pl
+
+# Digits kept after the decimal point for cost and usage values
+NUMERIC_SCALE = 10
+
+# Magnitude from which a float has more whole digits than Decimal(38, NUMERIC_SCALE) holds
+_DECIMAL_LIMIT = 10.0 ** (38 - NUMERIC_SCALE)
+
+# Characters a JSON string can't contain unescaped
+_NEEDS_ESCAPING = r'["\\\x00-\x1f]'
+
+
+def format_numeric(value: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+    """Format a numeric expression as a plain decimal string.
+
+    Floats and decimals keep up to NUMERIC_SCALE fractional digits with trailing zeros removed
+    (0.002 -> '0.002', 12.0 -> '12'), matching f'{value:.10f}' up to ties. Floats of 1e28 and
+    above have no fractional part and are written as whole numbers while they fit an Int128;
+    NaN, infinities and larger values fall back to Polars' float formatting ('NaN', 'inf',
+    '1e+39'), the only case that can produce scientific notation.
+    """
+    if dtype.is_integer():
+        return value.cast(pl.Utf8)
+    if isinstance(dtype, pl.Decimal):
+        if not dtype.scale:
+            return value.cast(pl.Utf8)
+        if dtype.scale > NUMERIC_SCALE:
+            # At most 38 - NUMERIC_SCALE whole digits, so this always fits
+            value = value.cast(pl.Decimal(38, NUMERIC_SCALE))
+        return _strip_fraction_zeros(value.cast(pl.Utf8))
+
+    value = value.cast(pl.Float64)
+    in_decimal_range = value.abs() < _DECIMAL_LIMIT
+    whole = value.floor()
+    whole_digits = whole.cast(pl.Int128, strict=False)
+    # Casting the whole and fractional parts separately keeps the digits exact; casting the value
+    # directly scales it by 10**NUMERIC_SCALE in floating point first. Out-of-range values are
+    # masked before the cast, which raises on overflow even when not strict.
+    decimal = (
+        pl.when(in_decimal_range).then(whole_digits).cast(pl.Decimal(38, NUMERIC_SCALE))
+        + pl.when(in_decimal_range).then(value - whole).cast(pl.Decimal(38, NUMERIC_SCALE))
+    )
+    return (
+        pl.when(in_decimal_range).then(_strip_fraction_zeros(decimal.cast(pl.Utf8)))
+        .when(whole_digits.is_not_null()).then(whole_digits.cast(pl.Utf8))
+        .otherwise(value.cast(pl.Utf8))
+    )
+
+
+def _strip_fraction_zeros(text: pl.Expr) -> pl.Expr:
+    """Remove trailing zeros (and a bare decimal point) from decimal strings with a fraction."""
+    return text.str.strip_chars_end('0').str.strip_chars_end('.')
+
+
+def api_records(data: pl.DataFrame) -> pl.Series:
+    """Encode each CBF row as a JSON object string in the form the AnyCost API expects.
+
+    CBF field names are kept as-is. Numeric values are sent as strings (see format_numeric),
+    booleans as 'True'/'False', and null fields are left out of the object. Fields are
+    written in name order, so the same content always encodes to the same string.
+    """
+    members = []
+    for name, dtype in sorted(data.schema.items()):
+        if dtype == pl.Null:
+            continue
+
+        value = pl.col(name)
+        if dtype == pl.Boolean:
+            token = _quoted(pl.when(value).then(pl.lit('True')).when(~value).then(pl.lit('False')))
+        elif dtype.is_numeric():
+            token = _quoted(format_numeric(value, dtype))
+        elif dtype == pl.Utf8 and not data[name].unique().str.contains(_NEEDS_ESCAPING).any():
+            token = _quoted(value)
+        else:
+            # json_encode handles escaping (and non-string types); only the value is kept
+            token = pl.struct(value.alias('')).struct.json_encode().str.strip_prefix('{"":').str.strip_suffix('}')
+
+        member = pl.lit(orjson.dumps(name).decode() + ':') + token
+        if data[name].null_count():
+            member = pl.when(value.is_not_null()).then(member)
+        members.append(member)
+
+    if not members:
+        return pl.Series('record', ['{}'] * len(data), dtype=pl.Utf8)
+
+    return data.select(
+        pl.concat_str([pl.lit('{'), pl.concat_str(members, separator=',', ignore_nulls=True), pl.lit('}')])
+        .alias('record')
+    ).to_series()
+
+
+def serialize_billing_drop(month: str, operation: str, records: pl.Series) -> bytes:
+    """Frame encoded records (see api_records) into a billing_drops request body."""
+    body = io.BytesIO()
+    body.write(orjson.dumps({'month': month, 'operation': operation})[:-1] + b',"data":[')
+    if not records.is_empty():
+        # Polars writes the rows straight into the buffer, each followed by a comma; the
+        # last comma is overwritten by the closing bracket
+        records.to_frame().write_csv(body, include_header=False, quote_style='never', line_terminator=',')
+        body.seek(-1, io.SEEK_END)
+    body.write(b']}')
+    return body.getvalue()
+
+
+def _quoted(token: pl.Expr) -> pl.Expr:
+    """Wrap a string expression known not to need escaping in JSON quotes."""
+    return pl.lit('"') + token + pl.lit('"')
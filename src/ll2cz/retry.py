@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Retry and rate-limiting policies for CloudZero API uploads."""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+import httpx
+
+
+@dataclass
+class RetryPolicy:
+    """Bounded exponential backoff with full jitter.
+
+    Attempt n waits a random time between 0 and min(max_delay, base_delay * 2 ** (n - 1)).
+    A Retry-After header on 429/503 responses replaces the computed delay (capped at
+    max_retry_after).
+
+    Operations that add to existing data (sum) are only retried when the request is known
+    not to have been applied: connection failures and 429/503 responses. Ambiguous failures
+    such as read timeouts or 5xx responses could otherwise count the same drop twice.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    max_retry_after: float = 300.0
+    retry_statuses: frozenset = frozenset({429, 500, 502, 503, 504})
+    idempotent_operations: frozenset = frozenset({'replace_hourly', 'replace_drop'})
+    sleep: Callable[[float], None] = field(default=time.sleep, repr=False)
+
+    THROTTLE_STATUSES = frozenset({429, 503})
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError(f"Invalid max_attempts: {self.max_attempts}. Must be at least 1")
+
+    def should_retry(self, error: httpx.HTTPError, operation: str, attempt: int) -> bool:
+        """Whether a failed attempt (1-based) should be retried."""
+        if attempt >= self.max_attempts:
+            return False
+
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status not in self.retry_statuses:
+                return False
+            return operation in self.idempotent_operations or status in self.THROTTLE_STATUSES
+
+        if isinstance(error, httpx.RequestError):
+            return (operation in self.idempotent_operations
+                    or isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)))
+
+        return False
+
+    def delay_for(self, attempt: int, error: Optional[httpx.HTTPError] = None) -> float:
+        """Seconds to wait before the attempt after `attempt` (1-based)."""
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def retry_after(self, error: Optional[httpx.HTTPError]) -> Optional[float]:
+        """Parse Retry-After (delta-seconds or HTTP-date) from a 429/503 response."""
+        if not isinstance(error, httpx.HTTPStatusError):
+            return None
+        if error.response.status_code not in self.THROTTLE_STATUSES:
+            return None
+
+        value = error.response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter shared by concurrent uploads.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; acquire() blocks
+    until a token is available. pause() holds back every caller, e.g. after the API
+    answers 429 with a Retry-After.
+    """
+
+    # Refill arithmetic can land a hair below a whole token; don't spin on sub-nanosecond waits
+    _EPSILON = 1e-9
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}. Must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, waiting for the bucket to refill if needed."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                wait = self._paused_until - now
+                if wait <= 0:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1 - self._EPSILON:
+                        self._tokens = max(self._tokens - 1, 0.0)
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the next `seconds`."""
+        with self._lock:
+            resume_at = self._clock() + seconds
+            if resume_at > self._paused_until:
+                self._paused_until = resume_at
+                # No tokens accumulate while paused
+                self._tokens = 0.0
+                self._updated = resume_at
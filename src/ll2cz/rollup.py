@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Hourly rollup of SpendLogs transactions ahead of CBF generation."""
+
+import polars as pl
+
+from .transformations import normalize_dates
+
+# Transaction counters and amounts that are added up within each hour
+SUM_COLUMNS = ('spend', 'total_tokens', 'prompt_tokens', 'completion_tokens',
+               'api_requests', 'successful_requests', 'failed_requests')
+
+# Per-transaction identifiers that would keep every row apart
+DROP_COLUMNS = ('request_id',)
+
+# Columns derived from start_time, constant within an hour
+DERIVED_COLUMNS = ('date',)
+
+
+def rollup_spend_logs(df: pl.DataFrame) -> pl.DataFrame:
+    """Aggregate SpendLogs rows into one row per hour and dimension combination.
+
+    start_time is truncated to the hour (UTC for text timestamps, which become
+    'YYYY-MM-DDTHH:00:00Z'). Rows are grouped by the hour and every other column, i.e. the
+    CZRN dimensions (custom_llm_provider, key_alias/api_key, call_type, model) and all tag
+    columns, with spend, token and request counts summed. request_id is dropped.
+
+    Text start times that can't be parsed are kept as they are, so those rows are only
+    merged with exact duplicates. Frames without start_time are returned unchanged.
+
+    Args:
+        df: SpendLogs DataFrame as returned by get_spend_logs_for_analysis()
+
+    Returns:
+        Rolled-up DataFrame with the input columns except request_id, in order of each
+        group's first row
+    """
+    if df.is_empty() or 'start_time' not in df.columns:
+        return df
+
+    df = df.drop([col for col in DROP_COLUMNS if col in df.columns])
+    df = df.with_columns(_truncate_to_hour(df['start_time']))
+
+    sums = [col for col in SUM_COLUMNS if col in df.columns]
+    derived = [col for col in DERIVED_COLUMNS if col in df.columns]
+    keys = [col for col in df.columns if col not in sums and col not in derived]
+
+    aggregations = [_sum(col, df.schema[col]) for col in sums] + [pl.col(col).first() for col in derived]
+    return df.group_by(keys, maintain_order=True).agg(aggregations).select(df.columns)
+
+
+def _truncate_to_hour(start_time: pl.Series) -> pl.Series:
+    """Truncate start times to the hour, leaving unparseable text untouched."""
+    if isinstance(start_time.dtype, pl.Datetime):
+        return start_time.dt.truncate('1h')
+    if start_time.dtype != pl.Utf8:
+        return start_time
+
+    normalized = normalize_dates(start_time)
+    return pl.DataFrame([start_time.alias('raw'), normalized.alias('utc')]).select(
+        pl.when(pl.col('utc').is_not_null())
+        .then(pl.col('utc').str.slice(0, 13) + pl.lit(':00:00Z'))
+        .otherwise(pl.col('raw'))
+        .alias(start_time.name)
+    ).to_series()
+
+
+def _sum(col: str, dtype: pl.DataType) -> pl.Expr:
+    """Sum a measure column; text amounts are read as numbers."""
+    if dtype == pl.Utf8:
+        return pl.col(col).cast(pl.Float64, strict=False).sum()
+    if dtype == pl.Null:
+        return pl.col(col).first()
+    return pl.col(col).sum()
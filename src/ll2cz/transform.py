@@ -3,13 +3,13 @@
 
 """Transform LiteLLM data to CloudZero AnyCost CBF format."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import polars as pl
 
 from .czrn import CZRNGenerator
 from .error_tracking import ConsolidatedErrorTracker
-from .transformations import parse_date
+from .transformations import normalize_dates
 
 
 class CBFTransformer:
@@ -47,12 +47,19 @@ class CBFTransformer:
         czrn_dropped_count = 0
         filtered_count = len(filtered_data)
 
-        for row in filtered_data.iter_rows(named=True):
+        # Parse the whole date column in one pass
+        if 'date' in filtered_data.columns:
+            usage_starts = normalize_dates(filtered_data['date'])
+        else:
+            usage_starts = pl.Series([None] * filtered_count, dtype=pl.Utf8)
+
+        for row, usage_start in zip(filtered_data.iter_rows(named=True), usage_starts):
             if use_error_tracking:
                 self.error_tracker.increment_total()
 
             try:
-                cbf_record = self._create_cbf_record(row, use_error_tracking=use_error_tracking)
+                cbf_record = self._create_cbf_record(row, use_error_tracking=use_error_tracking,
+                                                     usage_start=usage_start)
                 # Only include the record if CZRN generation was successful
                 cbf_data.append(cbf_record)
                 if use_error_tracking:
@@ -80,9 +87,13 @@ class CBFTransformer:
 
         return pl.DataFrame(cbf_data)
 
-    def _create_cbf_record(self, row: Dict[str, Any], use_error_tracking: bool = False) -> Dict[str, Any]:
+    def _create_cbf_record(self, row: Dict[str, Any], use_error_tracking: bool = False,
+                           usage_start: Optional[str] = None) -> Dict[str, Any]:
         """Create a single CBF record from LiteLLM daily spend row.
 
+        usage_start is the row's date already normalized by normalize_dates(); it is derived
+        from the row when omitted.
+
         CZRN components are mapped to supported CBF fields where possible:
         CZRN format: czrn:<provider>:<service-type>:<region>:<owner-account-id>:<resource-type>:<cloud-local-id>
 
@@ -95,8 +106,9 @@ class CBFTransformer:
         - Full CZRN → resource/tag:czrn (resource tag) [complete CZRN string]
         """
 
-        # Parse date (daily spend tables use date strings like '2025-04-19')
-        usage_date = parse_date(row.get('date'))
+        # Normalize date (daily spend tables use date strings like '2025-04-19')
+        if usage_start is None:
+            usage_start = normalize_dates(pl.Series([row.get('date')]))[0]
 
         # Calculate total tokens
         prompt_tokens = int(row.get('prompt_tokens', 0))
@@ -151,7 +163,7 @@ class CBFTransformer:
         # CloudZero CBF format with proper column names
         cbf_record = {
             # Required CBF fields
-            'time/usage_start': usage_date.isoformat() if usage_date else None,  # Required: ISO-formatted UTC datetime
+            'time/usage_start': usage_start,  # Required: ISO-formatted UTC datetime
             'cost/cost': float(row.get('spend', 0.0)),  # Required: billed cost
             'resource/id': cloud_local_id,  # Required when resource tags are present
 
@@ -3,7 +3,9 @@
 
 """Transformation functions for converting LiteLLM data to CZRN and CBF formats."""
 
-from datetime import datetime
+import re
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -11,8 +13,15 @@ import litellm
 import polars as pl
 import yaml
 
+from .date_utils import format_utc_timestamp
+
 # Import the new model name extraction
 
+# CZRN components may only contain alphanumerics and hyphens
+_INVALID_COMPONENT_CHARS = re.compile(r'[^a-zA-Z0-9-]+')
+_REPEATED_HYPHENS = re.compile(r'-{2,}')
+COMPONENT_CACHE_SIZE = 65536
+
 
 class ProviderNormalizer:
     """Handle provider normalization using configuration."""
@@ -124,21 +133,47 @@ def normalize_component(component: str, allow_uppercase: bool = False) -> str:
     if not allow_uppercase:
         component = component.lower()
 
-    # Replace invalid characters with hyphens
-    # Valid: alphanumeric and hyphens
-    import re
-    component = re.sub(r'[^a-zA-Z0-9-]', '-', component)
-
-    # Remove consecutive hyphens
-    component = re.sub(r'-+', '-', component)
-
-    # Strip leading/trailing hyphens
+    # Replace invalid characters with hyphens (valid: alphanumeric and hyphens),
+    # collapse consecutive hyphens and strip leading/trailing ones
+    component = _INVALID_COMPONENT_CHARS.sub('-', component)
+    component = _REPEATED_HYPHENS.sub('-', component)
     component = component.strip('-')
 
     # Return 'unknown' if empty after normalization
     return component if component else 'unknown'
 
 
+@lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def normalize_component_cached(component: str, allow_uppercase: bool = False) -> str:
+    """Memoized normalize_component() for row-level callers that see the same values repeatedly."""
+    return normalize_component(component, allow_uppercase)
+
+
+def normalize_component_expr(expr: pl.Expr, allow_uppercase: bool = False) -> pl.Expr:
+    """Polars expression counterpart of normalize_component() for whole columns.
+
+    Args:
+        expr: String expression to normalize (e.g. pl.col('key_alias'))
+        allow_uppercase: Whether to preserve uppercase characters
+
+    Returns:
+        Expression yielding the same values as normalize_component() per row, with
+        nulls and values that normalize to nothing becoming 'unknown'
+
+    Examples:
+        >>> pl.select(normalize_component_expr(pl.lit("My Entity 123!"))).item()
+        'my-entity-123'
+    """
+    if not allow_uppercase:
+        expr = expr.str.to_lowercase()
+    normalized = (
+        expr.str.replace_all(_INVALID_COMPONENT_CHARS.pattern, '-')
+        .str.replace_all(_REPEATED_HYPHENS.pattern, '-')
+        .str.strip_chars('-')
+    )
+    return pl.when(normalized.str.len_chars() > 0).then(normalized).otherwise(pl.lit('unknown'))
+
+
 def generate_resource_id(model: str, provider: str = None) -> str:
     """Generate a consistent resource ID from model name for use as cloud-local-id in CZRN and resource/id in CBF.
 
@@ -226,6 +261,118 @@ def parse_date(date_value: Union[str, datetime, None]) -> Optional[datetime]:
             return None
 
 
+def normalize_dates(values: pl.Series) -> pl.Series:
+    """Convert a column of dates or timestamps to ISO-8601 UTC strings for CBF.
+
+    Column-level counterpart of normalize_date(), accepting exactly the same strings: values
+    in the common ISO-8601 shapes (YYYY-MM-DD, optionally with a time, fraction and offset)
+    are parsed in one pass, and only the remaining distinct values go through the scalar
+    parser. Naive timestamps are taken as UTC; zone-aware ones are converted to UTC.
+
+    Args:
+        values: Series of date strings, datetimes or dates
+
+    Returns:
+        Series of strings like '2024-01-15T00:00:00Z' (fractional seconds only when
+        non-zero), null where a value could not be parsed
+
+    Examples:
+        >>> normalize_dates(pl.Series(["2024-01-15", "2024-01-15T10:30:00+02:00", None])).to_list()
+        ['2024-01-15T00:00:00Z', '2024-01-15T08:30:00Z', None]
+    """
+    if values.dtype == pl.Utf8:
+        parsed = _parse_date_strings(values)
+    elif isinstance(values.dtype, pl.Datetime):
+        parsed = values if values.dtype.time_zone is None else values.dt.convert_time_zone('UTC')
+    elif values.dtype == pl.Date:
+        parsed = values.cast(pl.Datetime('us'))
+    else:
+        return pl.Series(values.name, [None] * len(values), dtype=pl.Utf8)
+
+    return pl.DataFrame([parsed.alias('timestamp')]).select(
+        format_utc_timestamp(pl.col('timestamp'))
+    )['timestamp'].alias(values.name)
+
+
+def normalize_date(value: Any) -> Optional[str]:
+    """Convert a single date or timestamp to an ISO-8601 UTC string for CBF.
+
+    Scalar counterpart of normalize_dates() for callers holding one record. Strings are
+    parsed with datetime.fromisoformat(), falling back to parse_date().
+
+    Args:
+        value: Date string, datetime, date or None
+
+    Returns:
+        String like '2024-01-15T00:00:00Z', or None if the value could not be parsed
+
+    Examples:
+        >>> normalize_date("2024-01-15T10:30:00+02:00")
+        '2024-01-15T08:30:00Z'
+    """
+    if isinstance(value, str):
+        parsed = _parse_date_string(value)
+    elif isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        return None
+
+    if parsed is None:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+
+    fraction = f".{parsed.microsecond:06d}" if parsed.microsecond else ""
+    return f"{parsed.strftime('%Y-%m-%dT%H:%M:%S')}{fraction}Z"
+
+
+# ISO-8601 timestamp shape that fromisoformat() and Polars parse to the same instant
+_ISO_TIMESTAMP = re.compile(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(\.\d{1,6})?(Z|[+-]\d{2}:\d{2})?$')
+
+
+def _parse_date_string(value: str) -> Optional[datetime]:
+    """Parse one date string: datetime.fromisoformat(), falling back to parse_date()."""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return parse_date(value)
+
+
+def _parse_date_strings(values: pl.Series) -> pl.Series:
+    """Parse date strings to UTC datetimes with the same results as _parse_date_string().
+
+    YYYY-MM-DD values (parse_date()'s own first format) and values in the shape of
+    _ISO_TIMESTAMP are parsed natively; the rest are parsed once per distinct value with
+    _parse_date_string().
+    """
+    text = pl.col('value')
+    timestamp = text.str.replace(' ', 'T', literal=True).str.replace('Z', '+00:00', literal=True)
+    parsed = pl.DataFrame([values.alias('value')]).select(pl.coalesce(
+        text.str.to_datetime('%Y-%m-%d', time_unit='us', time_zone='UTC', strict=False),
+        pl.when(text.str.contains(_ISO_TIMESTAMP.pattern)).then(pl.coalesce(
+            timestamp.str.to_datetime('%Y-%m-%dT%H:%M:%S%.f%:z', time_unit='us', time_zone='UTC', strict=False),
+            timestamp.str.to_datetime('%Y-%m-%dT%H:%M:%S%.f', time_unit='us', strict=False)
+            .dt.replace_time_zone('UTC'),
+        )),
+    ).alias('parsed'))['parsed']
+
+    fallback = parsed.is_null() & values.is_not_null()
+    if fallback.any():
+        distinct = values.filter(fallback).unique()
+        utc = []
+        for value in distinct:
+            result = _parse_date_string(value)
+            if result is not None:
+                result = result.astimezone(timezone.utc) if result.tzinfo else result.replace(tzinfo=timezone.utc)
+            utc.append(result)
+        parsed = parsed.scatter(fallback.arg_true(), values.filter(fallback).replace_strict(
+            distinct, pl.Series(utc, dtype=parsed.dtype), return_dtype=parsed.dtype
+        ))
+    return parsed
+
+
 # Base field mappings (shared between user tables and logs)
 _BASE_CBF_MAPPINGS = {
     'spend': 'cost/cost',
@@ -175,8 +175,8 @@ class DataTransmitter:
         """
         self.console.print(f"[blue]Transmitting to CloudZero AnyCost API using operation: '{operation}'[/blue]")
 
-        streamer = CloudZeroStreamer(self.cz_api_key, self.cz_connection_id, self.timezone)
-        streamer.send_batched(cbf_data, operation=operation)
+        with CloudZeroStreamer(self.cz_api_key, self.cz_connection_id, self.timezone) as streamer:
+            streamer.send_batched(cbf_data, operation=operation)
 
         self.console.print(f"[green]✓ Successfully transmitted {len(cbf_data)} records to CloudZero AnyCost API[/green]")
 
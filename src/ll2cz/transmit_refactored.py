@@ -9,17 +9,22 @@ This refactoring addresses the following issues:
 3. Separation of Concerns: Business logic, I/O, and presentation are clearly separated
 """
 
+import queue
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Protocol, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple, Union
 
 import polars as pl
 
 from .cached_database import CachedLiteLLMDatabase
+from .checkpoint import CheckpointJournal
 from .chunked_processor import ChunkedDataProcessor
 from .data_processor import DataProcessor
 from .data_source_strategy import DataSourceFactory, DataSourceStrategy
 from .database import LiteLLMDatabase
 from .date_utils import DateParser
+from .retry import RetryPolicy, TokenBucket
+from .rollup import rollup_spend_logs
 
 # ==============================================================================
 # DATA MODELS - Pure data structures with validation
@@ -135,6 +140,17 @@ class DataLoader:
         else:
             return strategy.get_data(self.database, date_filter, limit)
 
+    def iter_data(self, request: TransmitRequest,
+                  batch_size: int = LiteLLMDatabase.DEFAULT_BATCH_SIZE) -> Iterator[pl.DataFrame]:
+        """Stream data for the request as DataFrames of at most batch_size rows."""
+        date_filter = self.date_parser.parse_date_spec(request.mode, request.date_spec)
+        strategy = self.source_factory(request.source)
+        limit = self._determine_limit(request)
+
+        if request.test:
+            date_filter = None
+        return strategy.iter_data(self.database, date_filter, limit, batch_size)
+
     def _determine_limit(self, request: TransmitRequest) -> Optional[int]:
         """Determine the limit to use for data loading."""
         if request.test and request.limit is None:
@@ -160,16 +176,26 @@ class DataTransformer:
     def __init__(self,
                  chunk_threshold: int = DEFAULT_CHUNK_THRESHOLD,
                  chunk_size: int = DEFAULT_CHUNK_SIZE,
-                 processor_factory: Optional[Callable[[str], DataProcessor]] = None):
+                 processor_factory: Optional[Callable[[str], DataProcessor]] = None,
+                 workers: int = 1,
+                 rollup: bool = False):
+        if workers < 1:
+            raise ValueError(f"Invalid workers: {workers}. Must be at least 1")
         self.chunk_threshold = chunk_threshold
         self.chunk_size = chunk_size
         self.processor_factory = processor_factory or (lambda source: DataProcessor(source=source))
+        self.workers = workers
+        # Aggregate SpendLogs rows per hour before CBF generation
+        self.rollup = rollup
 
     def transform(self, data: pl.DataFrame, source: str) -> pl.DataFrame:
         """Transform data to CBF format."""
         if data.is_empty():
             return data
 
+        if self.rollup and source == 'logs':
+            data = rollup_spend_logs(data)
+
         processor = self.processor_factory(source)
 
         # Use chunked processing for large datasets
@@ -184,24 +210,16 @@ class DataTransformer:
 
     def _transform_direct(self, data: pl.DataFrame, processor: DataProcessor) -> pl.DataFrame:
         """Direct transformation for smaller datasets."""
-        _, cbf_records, _ = processor.process_dataframe(data)
-        return pl.DataFrame(cbf_records)
+        return DataProcessor.drop_null_tags(processor.transform_frame(data))
 
     def _transform_chunked(self, data: pl.DataFrame, processor: DataProcessor) -> pl.DataFrame:
         """Chunked transformation for large datasets."""
         chunked_processor = ChunkedDataProcessor(
             chunk_size=self.chunk_size,
-            show_progress=False  # No UI concerns in business logic
-        )
-
-        all_cbf_records = []
-        def collect_results(cbf_records, error_summary):
-            all_cbf_records.extend(cbf_records)
-
-        chunked_processor.process_dataframe_chunked(
-            data, processor, callback=collect_results
+            show_progress=False,  # No UI concerns in business logic
+            workers=self.workers
         )
-        return pl.DataFrame(all_cbf_records)
+        return chunked_processor.transform_dataframe(data, processor)
 
 
 class BatchAnalyzer:
@@ -233,6 +251,55 @@ class BatchAnalyzer:
         }
 
 
+class DailyBatchAssembler:
+    """Assembles streamed CBF batches into complete daily batches.
+
+    Input batches are expected in date order (the extraction queries sort by date), so a
+    day is complete once a later batch no longer ends on it. Rows for a day that has
+    already been emitted are returned as a continuation rather than being held back.
+    """
+
+    DATE_COLUMN = 'time/usage_start'
+
+    def __init__(self):
+        self._pending: Dict[str, List[pl.DataFrame]] = {}
+        self._emitted: set = set()
+
+    def add(self, data: pl.DataFrame) -> List[Tuple[str, pl.DataFrame, bool]]:
+        """Add a CBF batch and return the days it completes.
+
+        Returns:
+            List of (batch_date, data, is_continuation) tuples
+        """
+        if data.is_empty() or self.DATE_COLUMN not in data.columns:
+            return []
+
+        data = data.filter(pl.col(self.DATE_COLUMN).is_not_null()).with_columns(
+            pl.col(self.DATE_COLUMN).str.slice(0, 10).alias('__batch_date')
+        )
+        if data.is_empty():
+            return []
+
+        open_date = data['__batch_date'][-1]
+        for part in data.partition_by('__batch_date', maintain_order=True):
+            batch_date = part['__batch_date'][0]
+            self._pending.setdefault(batch_date, []).append(part.drop('__batch_date'))
+
+        return self._take([batch_date for batch_date in self._pending if batch_date != open_date])
+
+    def flush(self) -> List[Tuple[str, pl.DataFrame, bool]]:
+        """Return all days that are still pending."""
+        return self._take(list(self._pending))
+
+    def _take(self, batch_dates: List[str]) -> List[Tuple[str, pl.DataFrame, bool]]:
+        completed = []
+        for batch_date in batch_dates:
+            parts = self._pending.pop(batch_date)
+            completed.append((batch_date, pl.concat(parts, how='diagonal_relaxed'), batch_date in self._emitted))
+            self._emitted.add(batch_date)
+        return completed
+
+
 # ==============================================================================
 # INTERFACES - Protocols and abstractions for loose coupling
 # ==============================================================================
@@ -415,17 +482,40 @@ class CollectingOutput:
 # ==============================================================================
 
 
+# Marks a max_drop_bytes argument left at CloudZeroStreamer's default; None means no limit
+DEFAULT_MAX_DROP_BYTES: Any = object()
+
+
 class CloudZeroTransmitter:
     """CloudZero API transmitter."""
 
-    def __init__(self, api_key: str, connection_id: str, timezone: str = 'UTC'):
+    def __init__(self, api_key: str, connection_id: str, timezone: str = 'UTC',
+                 upload_concurrency: int = 1, retry_policy: Optional[RetryPolicy] = None,
+                 requests_per_second: Optional[float] = None, journal: Optional[CheckpointJournal] = None,
+                 resume: bool = False, compression: Optional[str] = None,
+                 max_drop_bytes: Optional[int] = DEFAULT_MAX_DROP_BYTES, max_drop_records: Optional[int] = None):
         from .output import CloudZeroStreamer
-        self.streamer = CloudZeroStreamer(api_key, connection_id, timezone)
+        if max_drop_bytes is DEFAULT_MAX_DROP_BYTES:
+            max_drop_bytes = CloudZeroStreamer.DEFAULT_MAX_DROP_BYTES
+        rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+        self.streamer = CloudZeroStreamer(api_key, connection_id, timezone,
+                                          upload_concurrency=upload_concurrency,
+                                          retry_policy=retry_policy,
+                                          rate_limiter=rate_limiter,
+                                          journal=journal,
+                                          resume=resume,
+                                          compression=compression,
+                                          max_drop_bytes=max_drop_bytes,
+                                          max_drop_records=max_drop_records)
 
     def transmit(self, data: pl.DataFrame, operation: str) -> None:
         """Transmit data to CloudZero."""
         self.streamer.send_batched(data, operation=operation)
 
+    def close(self) -> None:
+        """Release the streamer's pooled HTTP connections."""
+        self.streamer.close()
+
 
 class MockTransmitter:
     """Mock transmitter for testing - records transmissions without side effects."""
@@ -557,6 +647,181 @@ class TransmitOrchestrator:
         )
 
 
+class StreamingTransmitOrchestrator(TransmitOrchestrator):
+    """Orchestrates a streaming transmission with overlapped extraction and upload.
+
+    A producer thread pulls database batches, transforms them and hands each completed
+    day to a bounded queue; the calling thread transmits days as they arrive. When the
+    queue is full the producer blocks, so memory is bounded by the queue size and the
+    largest day rather than by the whole date range. Up to upload_concurrency days that
+    are already waiting are passed to the transmitter together, so its uploads can run
+    in parallel. Test mode runs the regular, non-streaming flow.
+    """
+
+    DEFAULT_BATCH_SIZE = LiteLLMDatabase.DEFAULT_BATCH_SIZE
+    DEFAULT_QUEUE_SIZE = 4
+    # Rows for a day that was already sent are added to it; repeating replace_hourly
+    # would overwrite the hours sent earlier
+    CONTINUATION_OPERATION = "sum"
+
+    _END = object()
+
+    def __init__(self,
+                 validator: RequestValidator,
+                 data_loader: DataLoader,
+                 data_transformer: DataTransformer,
+                 batch_analyzer: BatchAnalyzer,
+                 transmitter: Transmitter,
+                 output: OutputHandler,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 upload_concurrency: int = 1):
+        super().__init__(validator, data_loader, data_transformer, batch_analyzer, transmitter, output)
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch_size: {batch_size}. Must be at least 1")
+        if queue_size < 1:
+            raise ValueError(f"Invalid queue_size: {queue_size}. Must be at least 1")
+        if upload_concurrency < 1:
+            raise ValueError(f"Invalid upload_concurrency: {upload_concurrency}. Must be at least 1")
+        self.batch_size = batch_size
+        # The queue must be able to hold a full set of concurrent uploads
+        self.queue_size = max(queue_size, upload_concurrency)
+        self.upload_concurrency = upload_concurrency
+
+    def execute(self, request: TransmitRequest) -> TransmitResult:
+        """Execute a transmission request, streaming daily batches to the transmitter."""
+        if request.test:
+            return super().execute(request)
+
+        try:
+            self.validator.validate(request)
+
+            date_desc = self.data_loader.get_date_description(request)
+            self.output.show_loading(request.mode, request.source, date_desc)
+
+            return self._stream(request, self._determine_operation(request))
+
+        except Exception as e:
+            return self._handle_error(e)
+
+    def _stream(self, request: TransmitRequest, operation: str) -> TransmitResult:
+        """Run the producer thread and transmit days from the queue until it finishes."""
+        day_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        failures: List[Exception] = []
+
+        producer = threading.Thread(
+            target=self._produce,
+            args=(request, day_queue, stop, failures),
+            name='ll2cz-transmit-producer',
+            daemon=True
+        )
+        producer.start()
+
+        records = 0
+        batches = 0
+        finished = False
+        try:
+            while not finished:
+                days, finished = self._take_ready_days(day_queue)
+                for day_operation, group in self._group_by_operation(days, operation):
+                    if batches == 0:
+                        self.output.show_transmitting(operation)
+                    day_data = group[0] if len(group) == 1 else pl.concat(group, how='diagonal_relaxed')
+                    self.transmitter.transmit(day_data, day_operation)
+                    records += len(day_data)
+                    batches += len(group)
+        finally:
+            stop.set()
+            producer.join()
+
+        if failures:
+            raise failures[0]
+
+        if batches == 0:
+            self.output.show_no_data()
+            return TransmitResult(status='no_data')
+
+        self.output.show_success(records)
+        return TransmitResult(
+            status='success',
+            records=records,
+            batches=batches,
+            operation=operation
+        )
+
+    def _take_ready_days(self, day_queue: queue.Queue) -> Tuple[List[Tuple[str, pl.DataFrame, bool]], bool]:
+        """Wait for the next day, then take up to upload_concurrency - 1 more that are already queued.
+
+        Returns:
+            Tuple of (days, finished), where finished means the producer is done
+        """
+        days = []
+        item = day_queue.get()
+        while item is not self._END:
+            days.append(item)
+            if len(days) >= self.upload_concurrency:
+                return days, False
+            try:
+                item = day_queue.get_nowait()
+            except queue.Empty:
+                return days, False
+        return days, True
+
+    def _group_by_operation(self, days: List[Tuple[str, pl.DataFrame, bool]],
+                            operation: str) -> List[Tuple[str, List[pl.DataFrame]]]:
+        """Group consecutive days that are sent with the same operation, keeping their order."""
+        groups: List[Tuple[str, List[pl.DataFrame]]] = []
+        for _, day_data, is_continuation in days:
+            day_operation = self.CONTINUATION_OPERATION if is_continuation else operation
+            if groups and groups[-1][0] == day_operation:
+                groups[-1][1].append(day_data)
+            else:
+                groups.append((day_operation, [day_data]))
+        return groups
+
+    def _produce(self, request: TransmitRequest, day_queue: queue.Queue,
+                 stop: threading.Event, failures: List[Exception]) -> None:
+        """Extract and transform batches, queueing each day once it is complete."""
+        assembler = DailyBatchAssembler()
+        batches = None
+        try:
+            batches = self.data_loader.iter_data(request, self.batch_size)
+            for data in batches:
+                if stop.is_set():
+                    return
+                if data.is_empty():
+                    continue
+
+                self.output.show_processing(len(data))
+                cbf_data = self.data_transformer.transform(data, request.source)
+                for item in assembler.add(cbf_data):
+                    if not self._put(day_queue, item, stop):
+                        return
+
+            for item in assembler.flush():
+                if not self._put(day_queue, item, stop):
+                    return
+        except Exception as e:
+            failures.append(e)
+        finally:
+            close = getattr(batches, 'close', None)
+            if close:
+                close()
+            self._put(day_queue, self._END, stop)
+
+    @staticmethod
+    def _put(day_queue: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        """Put an item on the queue, giving up if the consumer has stopped."""
+        while not stop.is_set():
+            try:
+                day_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
 # ==============================================================================
 # MAIN API - Facade that provides backward compatibility
 # ==============================================================================
@@ -578,7 +843,20 @@ class DataTransmitterV2:
                  # Advanced customization options
                  validator: Optional[RequestValidator] = None,
                  data_transformer: Optional[DataTransformer] = None,
-                 batch_analyzer: Optional[BatchAnalyzer] = None):
+                 batch_analyzer: Optional[BatchAnalyzer] = None,
+                 workers: int = 1,
+                 stream: bool = False,
+                 batch_size: int = StreamingTransmitOrchestrator.DEFAULT_BATCH_SIZE,
+                 queue_size: int = StreamingTransmitOrchestrator.DEFAULT_QUEUE_SIZE,
+                 upload_concurrency: int = 1,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 requests_per_second: Optional[float] = None,
+                 journal: Optional[CheckpointJournal] = None,
+                 resume: bool = False,
+                 compression: Optional[str] = None,
+                 max_drop_bytes: Optional[int] = DEFAULT_MAX_DROP_BYTES,
+                 max_drop_records: Optional[int] = None,
+                 rollup: bool = False):
         """Initialize with dependency injection for better testability.
         
         Args:
@@ -591,6 +869,21 @@ class DataTransmitterV2:
             validator: Optional custom validator
             data_transformer: Optional custom transformer
             batch_analyzer: Optional custom batch analyzer
+            workers: Number of worker processes for the default transformer's chunked mode
+            stream: Stream extraction, transformation and upload day by day
+            batch_size: Rows per extracted database batch in streaming mode
+            queue_size: Completed days that may wait for upload in streaming mode
+            upload_concurrency: Daily batches the default transmitter uploads at the same time; in
+                streaming mode, also the number of ready days handed to the transmitter at once
+            retry_policy: Backoff policy for the default transmitter's failed uploads
+            requests_per_second: Optional request rate limit shared by the default transmitter's uploads
+            journal: Optional checkpoint journal the default transmitter records acknowledged batches in
+            resume: Skip batches the journal has already recorded as acknowledged
+            compression: Request body compression ('gzip') for the default transmitter's uploads
+            max_drop_bytes: Serialized size above which the default transmitter splits a daily batch
+                (default: CloudZeroStreamer.DEFAULT_MAX_DROP_BYTES; None: no limit)
+            max_drop_records: Record count above which the default transmitter splits a daily batch
+            rollup: Have the default transformer aggregate SpendLogs rows per hour (--source logs)
         """
         # Core dependencies
         self.database = database
@@ -600,17 +893,20 @@ class DataTransmitterV2:
         date_parser = DateParser(timezone)
         self.validator = validator or RequestValidator()
         self.data_loader = DataLoader(database, date_parser)
-        self.data_transformer = data_transformer or DataTransformer()
+        self.data_transformer = data_transformer or DataTransformer(workers=workers, rollup=rollup)
         self.batch_analyzer = batch_analyzer or BatchAnalyzer()
 
         # Use provided or create default implementations
         self.output = output or ConsoleOutput()
         self.transmitter = transmitter or CloudZeroTransmitter(
-            cz_api_key, cz_connection_id, timezone
+            cz_api_key, cz_connection_id, timezone, upload_concurrency=upload_concurrency,
+            retry_policy=retry_policy, requests_per_second=requests_per_second,
+            journal=journal, resume=resume, compression=compression,
+            max_drop_bytes=max_drop_bytes, max_drop_records=max_drop_records
         )
 
         # Create orchestrator
-        self.orchestrator = TransmitOrchestrator(
+        components = (
             self.validator,
             self.data_loader,
             self.data_transformer,
@@ -618,6 +914,13 @@ class DataTransmitterV2:
             self.transmitter,
             self.output
         )
+        if stream:
+            self.orchestrator = StreamingTransmitOrchestrator(
+                *components, batch_size=batch_size, queue_size=queue_size,
+                upload_concurrency=upload_concurrency
+            )
+        else:
+            self.orchestrator = TransmitOrchestrator(*components)
 
     def transmit(self, mode: str, date_spec: Optional[str] = None,
                  source: str = 'usertable', append: bool = False,
@@ -636,8 +939,13 @@ class DataTransmitterV2:
             limit=limit
         )
 
-        # Execute
-        result = self.orchestrator.execute(request)
+        # Execute, keeping the transmitter's connections open only for this run
+        try:
+            result = self.orchestrator.execute(request)
+        finally:
+            close = getattr(self.transmitter, 'close', None)
+            if close:
+                close()
 
         # Convert to legacy format for compatibility
         return result.to_dict()
@@ -0,0 +1,328 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the SQLite data cache."""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from ll2cz.cache import DataCache
+from ll2cz.database import LiteLLMDatabase
+from ll2cz.parquet_cache import ParquetDataCache
+
+SOURCE_SCHEMA = """
+CREATE TABLE LiteLLM_OrganizationTable (organization_id TEXT PRIMARY KEY, organization_alias TEXT);
+CREATE TABLE LiteLLM_TeamTable (team_id TEXT PRIMARY KEY, team_alias TEXT, organization_id TEXT);
+CREATE TABLE LiteLLM_UserTable (user_id TEXT PRIMARY KEY, user_alias TEXT, user_email TEXT);
+CREATE TABLE LiteLLM_VerificationToken (
+    token TEXT PRIMARY KEY, key_name TEXT, key_alias TEXT, user_id TEXT, team_id TEXT, organization_id TEXT
+);
+CREATE TABLE LiteLLM_DailyUserSpend (
+    id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    api_key TEXT,
+    model TEXT,
+    model_group TEXT,
+    custom_llm_provider TEXT,
+    prompt_tokens INTEGER DEFAULT 0,
+    completion_tokens INTEGER DEFAULT 0,
+    spend REAL DEFAULT 0.0,
+    api_requests INTEGER DEFAULT 0,
+    successful_requests INTEGER DEFAULT 0,
+    failed_requests INTEGER DEFAULT 0,
+    cache_creation_input_tokens INTEGER DEFAULT 0,
+    cache_read_input_tokens INTEGER DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE TABLE LiteLLM_DailyTeamSpend (id TEXT PRIMARY KEY, created_at TEXT, updated_at TEXT);
+CREATE TABLE LiteLLM_DailyTagSpend (id TEXT PRIMARY KEY, created_at TEXT, updated_at TEXT);
+CREATE TABLE LiteLLM_SpendLogs (
+    request_id TEXT PRIMARY KEY,
+    call_type TEXT,
+    api_key TEXT,
+    spend DECIMAL(10, 6),
+    total_tokens INTEGER,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER,
+    startTime TIMESTAMP,
+    model TEXT,
+    model_group TEXT,
+    custom_llm_provider TEXT,
+    user TEXT,
+    team_id TEXT,
+    end_user TEXT
+);
+"""
+
+SPEND_LOG_INSERT = (
+    "INSERT INTO LiteLLM_SpendLogs (request_id, call_type, spend, total_tokens, startTime, model, user) "
+    "VALUES (?, 'completion', 0.01, 150, ?, 'gpt-4', 'user-1')"
+)
+
+
+class TestDataCacheSync:
+    """Test full and incremental cache synchronisation against a SQLite source."""
+
+    @pytest.fixture
+    def source_db(self, tmp_path):
+        """Create a LiteLLM-shaped SQLite source database with two spend rows."""
+        db_path = tmp_path / 'litellm.sqlite'
+        conn = sqlite3.connect(db_path)
+        conn.executescript(SOURCE_SCHEMA)
+        conn.executemany(
+            "INSERT INTO LiteLLM_DailyUserSpend (id, date, user_id, model, spend, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                ('row-1', '2025-01-14', 'user-1', 'gpt-4', 1.0, '2025-01-14 10:00:00', '2025-01-14 10:00:00'),
+                ('row-2', '2025-01-15', 'user-1', 'gpt-4', 2.0, '2025-01-15 10:00:00', '2025-01-15 10:00:00'),
+            ]
+        )
+        conn.commit()
+        conn.close()
+        return db_path
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create an empty cache in a temporary directory."""
+        return DataCache(tmp_path / 'cache')
+
+    def _sync(self, cache, db_path):
+        connection_string = f'sqlite:///{db_path}'
+        return cache.get_cached_data(LiteLLMDatabase(connection_string), connection_string).sort('id')
+
+    def test_initial_sync_sets_watermark(self, cache, source_db):
+        """Test that the first sync loads everything and records the change watermark."""
+        data = self._sync(cache, source_db)
+
+        assert data['id'].to_list() == ['row-1', 'row-2']
+        conn_hash = cache._get_connection_hash(f'sqlite:///{source_db}')
+        assert cache._get_cache_metadata(f'sync_watermark_{conn_hash}') == '2025-01-15 10:00:00'
+
+    def test_incremental_sync_upserts_changes(self, cache, source_db):
+        """Test that later syncs fetch only changed rows and upsert them."""
+        self._sync(cache, source_db)
+
+        conn = sqlite3.connect(source_db)
+        conn.execute("UPDATE LiteLLM_DailyUserSpend SET spend = 5.0, updated_at = '2025-01-16 09:00:00' "
+                     "WHERE id = 'row-1'")
+        conn.execute("INSERT INTO LiteLLM_DailyUserSpend (id, date, user_id, model, spend, created_at, updated_at) "
+                     "VALUES ('row-3', '2025-01-16', 'user-2', 'gpt-4', 3.0, '2025-01-16 10:00:00', NULL)")
+        conn.commit()
+        conn.close()
+
+        database = LiteLLMDatabase(f'sqlite:///{source_db}')
+        assert len(database.get_usage_data(updated_since='2025-01-15 10:00:00')) == 3
+
+        data = self._sync(cache, source_db)
+        assert data['id'].to_list() == ['row-1', 'row-2', 'row-3']
+        assert data['spend'].to_list() == [5.0, 2.0, 3.0]
+
+        conn_hash = cache._get_connection_hash(f'sqlite:///{source_db}')
+        assert cache._get_cache_metadata(f'sync_watermark_{conn_hash}') == '2025-01-16 10:00:00'
+
+    def test_deleted_rows_trigger_full_refresh(self, cache, source_db):
+        """Test that a row-count mismatch after a delta sync falls back to a full reload."""
+        self._sync(cache, source_db)
+
+        conn = sqlite3.connect(source_db)
+        conn.execute("DELETE FROM LiteLLM_DailyUserSpend WHERE id = 'row-1'")
+        conn.commit()
+        conn.close()
+
+        data = self._sync(cache, source_db)
+        assert data['id'].to_list() == ['row-2']
+
+    def test_schema_check_does_not_fetch_rows(self, cache, source_db):
+        """Test that schema drift detection probes the schema instead of downloading the table."""
+        connection_string = f'sqlite:///{source_db}'
+        self._sync(cache, source_db)
+
+        conn_hash = cache._get_connection_hash(connection_string)
+        assert cache._get_cache_metadata(f'schema_fingerprint_{conn_hash}') is not None
+
+        database = LiteLLMDatabase(connection_string)
+        with patch.object(database, 'get_usage_data', side_effect=AssertionError("bulk fetch")):
+            data = cache.get_cached_data(database, connection_string)
+        assert len(data) == 2
+
+    def test_schema_mismatch_detected_from_probe(self, cache, source_db):
+        """Test that a cache table missing query columns is reported as a mismatch."""
+        connection_string = f'sqlite:///{source_db}'
+        database = LiteLLMDatabase(connection_string)
+
+        # The initial cache table has no key/user/team enrichment columns
+        assert cache._check_schema_mismatch(database, connection_string)
+
+        cache._recreate_cache_schema(database)
+        assert not cache._check_schema_mismatch(database, connection_string)
+
+
+    def test_iter_cached_data_streams_in_read_order(self, cache, source_db):
+        """Test that streaming the cache yields bounded batches in get_cached_data() order."""
+        connection_string = f'sqlite:///{source_db}'
+        database = LiteLLMDatabase(connection_string)
+        expected = cache.get_cached_data(database, connection_string)
+
+        batches = list(cache.iter_cached_data(database, connection_string, batch_size=1))
+        assert [len(batch) for batch in batches] == [1, 1]
+        assert [batch['id'][0] for batch in batches] == expected['id'].to_list() == ['row-2', 'row-1']
+
+        batches = list(cache.iter_cached_data(None, connection_string, batch_size=1, limit=1,
+                                              start_date='2025-01-14', end_date='2025-01-15'))
+        assert [batch['id'].to_list() for batch in batches] == [['row-2']]
+
+
+class TestParquetDataCacheSync(TestDataCacheSync):
+    """Run the cache synchronisation tests against the date-partitioned Parquet backend."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create an empty Parquet cache in a temporary directory."""
+        return ParquetDataCache(tmp_path / 'cache')
+
+    def test_partitions_by_date(self, cache, source_db):
+        """Test that records are written to one Parquet partition per date."""
+        connection_string = f'sqlite:///{source_db}'
+        self._sync(cache, source_db)
+
+        root = cache._get_partition_root(connection_string)
+        assert sorted(path.name for path in root.iterdir()) == ['date=2025-01-14', 'date=2025-01-15']
+
+    def test_date_filter_reads_matching_partitions(self, cache, source_db):
+        """Test that date-filtered reads return only the matching partitions."""
+        connection_string = f'sqlite:///{source_db}'
+        self._sync(cache, source_db)
+
+        data = cache._read_cached_records(connection_string, start_date='2025-01-15', end_date='2025-01-15')
+        assert data['id'].to_list() == ['row-2']
+        assert data['date'].to_list() == ['2025-01-15']
+
+    def test_clear_cache_removes_partitions(self, cache, source_db):
+        """Test that clearing the cache removes the connection's partitions."""
+        connection_string = f'sqlite:///{source_db}'
+        self._sync(cache, source_db)
+
+        cache.clear_cache(connection_string)
+        assert cache._is_cache_empty(connection_string)
+        assert not cache._get_partition_root(connection_string).exists()
+
+
+class TestSpendLogsCache:
+    """Test the append-only SpendLogs cache."""
+
+    @pytest.fixture
+    def source_db(self, tmp_path):
+        """Create a LiteLLM-shaped SQLite source database with three SpendLogs rows."""
+        db_path = tmp_path / 'litellm.sqlite'
+        conn = sqlite3.connect(db_path)
+        conn.executescript(SOURCE_SCHEMA)
+        conn.executemany(SPEND_LOG_INSERT, [
+            ('req-1', '2025-01-14 23:59:59.999000'),
+            ('req-2', '2025-01-15 00:00:00.000000'),
+            ('req-3', '2025-01-15 12:00:00.000000'),
+        ])
+        conn.commit()
+        conn.close()
+        return db_path
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create an empty cache in a temporary directory."""
+        return DataCache(tmp_path / 'cache')
+
+    def test_initial_sync_and_date_filter(self, cache, source_db):
+        """Test that the first read caches all rows and date bounds apply to the startTime day."""
+        connection_string = f'sqlite:///{source_db}'
+        database = LiteLLMDatabase(connection_string)
+
+        data = cache.get_cached_spend_logs(database, connection_string, start_date='2025-01-15',
+                                           end_date='2025-01-15')
+        assert data['request_id'].to_list() == ['req-3', 'req-2']
+        assert data['date'].to_list() == ['2025-01-15', '2025-01-15']
+        assert cache.get_cache_info(connection_string)['spend_logs_count'] == 3
+
+        conn_hash = cache._get_connection_hash(connection_string)
+        assert cache._get_cache_metadata(f'spend_logs_watermark_{conn_hash}') == '2025-01-15 12:00:00.000000'
+
+    def test_incremental_sync_appends_new_and_late_rows(self, cache, source_db):
+        """Test that later reads only append rows after the watermark, including late arrivals."""
+        connection_string = f'sqlite:///{source_db}'
+        cache.get_cached_spend_logs(LiteLLMDatabase(connection_string), connection_string)
+
+        conn = sqlite3.connect(source_db)
+        conn.executemany(SPEND_LOG_INSERT, [
+            ('req-4', '2025-01-15 13:00:00.000000'),
+            # Flushed late, but within the lookback window before the watermark
+            ('req-late', '2025-01-15 11:30:00.000000'),
+        ])
+        conn.commit()
+        conn.close()
+
+        database = LiteLLMDatabase(connection_string)
+        with patch.object(database, 'iter_spend_logs_for_analysis',
+                          wraps=database.iter_spend_logs_for_analysis) as iter_logs:
+            data = cache.get_cached_spend_logs(database, connection_string)
+
+        assert iter_logs.call_args.kwargs['started_since'] == '2025-01-15 11:00:00.000000'
+        assert data['request_id'].to_list() == ['req-4', 'req-3', 'req-late', 'req-2', 'req-1']
+
+    def test_offline_reads_cached_rows(self, cache, source_db):
+        """Test that cached SpendLogs are served without a server connection."""
+        connection_string = f'sqlite:///{source_db}'
+        cache.get_cached_spend_logs(LiteLLMDatabase(connection_string), connection_string)
+
+        data = cache.get_cached_spend_logs(None, connection_string, limit=1)
+        assert data['request_id'].to_list() == ['req-3']
+
+    def test_connections_are_cached_separately(self, cache, source_db, tmp_path):
+        """Test that SpendLogs from different databases don't mix and are cleared per connection."""
+        other_db = tmp_path / 'other.sqlite'
+        conn = sqlite3.connect(other_db)
+        conn.executescript(SOURCE_SCHEMA)
+        conn.execute(SPEND_LOG_INSERT, ('other-1', '2025-01-15 09:00:00.000000'))
+        conn.commit()
+        conn.close()
+
+        connection_string = f'sqlite:///{source_db}'
+        other_connection_string = f'sqlite:///{other_db}'
+        cache.get_cached_spend_logs(LiteLLMDatabase(connection_string), connection_string)
+        other = cache.get_cached_spend_logs(LiteLLMDatabase(other_connection_string), other_connection_string)
+        assert other['request_id'].to_list() == ['other-1']
+
+        cache.clear_cache(other_connection_string)
+        assert cache.get_cache_info(other_connection_string)['spend_logs_count'] == 0
+        assert cache.get_cached_spend_logs(None, connection_string)['request_id'].len() == 3
+
+        # A cleared connection re-populates from scratch rather than from a stale watermark
+        database = LiteLLMDatabase(other_connection_string)
+        with patch.object(database, 'iter_spend_logs_for_analysis',
+                          wraps=database.iter_spend_logs_for_analysis) as iter_logs:
+            other = cache.get_cached_spend_logs(database, other_connection_string)
+        assert iter_logs.call_args.kwargs['started_since'] is None
+        assert other['request_id'].to_list() == ['other-1']
+
+    def test_cached_database_streams_spend_logs(self, tmp_path, source_db):
+        """Test that SpendLogsStrategy.iter_data streams cached databases in batch_size rows."""
+        from ll2cz.cached_database import CachedLiteLLMDatabase
+        from ll2cz.data_source_strategy import SpendLogsStrategy
+
+        database = CachedLiteLLMDatabase(f'sqlite:///{source_db}', cache_dir=tmp_path / 'cache')
+        date_filter = {'start_date': '2025-01-14', 'end_date': '2025-01-15', 'description': 'two days'}
+
+        batches = list(SpendLogsStrategy().iter_data(database, date_filter=date_filter, batch_size=2))
+        assert [batch['request_id'].to_list() for batch in batches] == [['req-3', 'req-2'], ['req-1']]
+
+    def test_cached_database_get_spend_logs(self, tmp_path, source_db):
+        """Test the date-bounded get_spend_logs API used by SpendLogsStrategy."""
+        from ll2cz.cached_database import CachedLiteLLMDatabase
+        from ll2cz.data_source_strategy import SpendLogsStrategy
+
+        database = CachedLiteLLMDatabase(f'sqlite:///{source_db}', cache_dir=tmp_path / 'cache')
+        date_filter = {'start_date': '2025-01-14', 'end_date': '2025-01-14', 'description': 'a day'}
+
+        data = SpendLogsStrategy().get_data(database, date_filter=date_filter)
+        assert data['request_id'].to_list() == ['req-1']
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the transmit checkpoint journal."""
+
+import polars as pl
+
+from ll2cz.checkpoint import CheckpointJournal, CheckpointKey, payload_content_hash
+
+
+class TestCheckpointJournal:
+    """Test recording and looking up acknowledged batches."""
+
+    def key(self, batch_date='2025-01-15', operation='replace_hourly', content_hash='abc', connection_id='conn'):
+        return CheckpointKey(connection_id, batch_date[:7], batch_date, operation, content_hash)
+
+    def test_record_and_lookup(self, tmp_path):
+        """Only the exact recorded key counts as acknowledged, across journal instances."""
+        CheckpointJournal(tmp_path / 'journal.db').record(self.key(), records=10)
+
+        journal = CheckpointJournal(tmp_path / 'journal.db')
+        assert journal.is_acknowledged(self.key())
+        assert not journal.is_acknowledged(self.key(batch_date='2025-01-16'))
+        assert not journal.is_acknowledged(self.key(operation='sum'))
+        assert not journal.is_acknowledged(self.key(content_hash='def'))
+        assert not journal.is_acknowledged(self.key(connection_id='other'))
+
+    def test_clear(self, tmp_path):
+        """Entries can be cleared for one connection or all of them."""
+        journal = CheckpointJournal(tmp_path / 'journal.db')
+        journal.record(self.key(), records=1)
+        journal.record(self.key(connection_id='other'), records=1)
+
+        assert journal.clear('other') == 1
+        assert journal.is_acknowledged(self.key())
+        assert journal.clear() == 1
+        assert not journal.is_acknowledged(self.key())
+
+    def test_content_hash_ignores_order(self):
+        """The content hash depends on the records, not their row order."""
+        first = '{"cost/cost":"0.1","resource/id":"a"}'
+        second = '{"cost/cost":"0.2","resource/id":"b"}'
+
+        assert payload_content_hash(pl.Series([first, second])) == payload_content_hash(pl.Series([second, first]))
+        assert payload_content_hash(pl.Series([first])) != payload_content_hash(pl.Series([first, second]))
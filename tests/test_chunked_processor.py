@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for chunked and multi-process CBF transformation."""
+
+import polars as pl
+import pytest
+
+from ll2cz.chunked_processor import ChunkedDataProcessor, _to_ipc, _transform_chunk
+from ll2cz.data_processor import DataProcessor
+
+
+def make_usage_frame(rows: int) -> pl.DataFrame:
+    """Build a small user-table frame, with every seventh row missing its model."""
+    return pl.DataFrame({
+        'date': [f"2025-01-{(i % 28) + 1:02d}" for i in range(rows)],
+        'custom_llm_provider': ['openai' if i % 2 else 'anthropic' for i in range(rows)],
+        'model': [None if i % 7 == 0 else ('gpt-4o' if i % 2 else 'claude-3-haiku') for i in range(rows)],
+        'api_key': [f"sk-{i % 5}" for i in range(rows)],
+        'prompt_tokens': list(range(rows)),
+        'completion_tokens': [i * 2 for i in range(rows)],
+        'spend': [i / 100 for i in range(rows)],
+        'entity_type': ['user'] * rows,
+    })
+
+
+def collect(chunked_processor: ChunkedDataProcessor, df: pl.DataFrame, processor: DataProcessor):
+    """Run process_dataframe_chunked and collect the records passed to the callback."""
+    records = []
+    _, successful, summary = chunked_processor.process_dataframe_chunked(
+        df, processor, callback=lambda cbf_records, _: records.extend(cbf_records)
+    )
+    return records, successful, summary
+
+
+class TestChunkedDataProcessorWorkers:
+    """Chunks sent to worker processes produce the same ordered results as serial processing."""
+
+    def test_invalid_workers(self):
+        """At least one worker is required."""
+        with pytest.raises(ValueError, match="Invalid workers"):
+            ChunkedDataProcessor(workers=0)
+
+    def test_serial_chunks_use_transform_frame(self):
+        """workers=1 transforms chunks with transform_frame() too, matching the row path."""
+        df = make_usage_frame(20)
+        czrns, records, _ = DataProcessor(source='usertable').process_dataframe(df)
+
+        processor = DataProcessor(source='usertable')
+        chunked = ChunkedDataProcessor(chunk_size=15, show_progress=False)
+        results = list(chunked.process_dataframe_as_generator(df, processor))
+
+        assert [czrn for result in results for czrn in result[0]] == czrns
+        assert [record for result in results for record in result[1]] == records
+
+    def test_transform_dataframe_concatenates_frames(self):
+        """transform_dataframe() joins the chunk frames into the frame transform_frame() gives for the whole input."""
+        df = make_usage_frame(20)
+        expected = DataProcessor.drop_null_tags(DataProcessor(source='usertable').transform_frame(df))
+
+        chunked = ChunkedDataProcessor(chunk_size=6, show_progress=False)
+        result = chunked.transform_dataframe(df, DataProcessor(source='usertable'))
+
+        assert result.equals(expected)
+        assert chunked.transform_dataframe(df.clear(), DataProcessor(source='usertable')).is_empty()
+
+    def test_transform_chunk_round_trip(self):
+        """A worker's IPC result merges into the same records and errors as the row path."""
+        df = make_usage_frame(20)
+        serial = DataProcessor(source='usertable')
+        czrns, records, summary = serial.process_dataframe(df)
+
+        parent = DataProcessor(source='usertable')
+        frame = ChunkedDataProcessor._merge_chunk_frame(_transform_chunk('usertable', _to_ipc(df)), parent)
+        merged = ChunkedDataProcessor._chunk_result(frame, parent)
+
+        assert merged[0] == czrns
+        assert merged[1] == records
+        assert merged[2]['error_types'] == summary['error_types']
+
+    def test_process_pool_matches_serial(self, monkeypatch):
+        """workers=2 keeps chunk order and merges error summaries."""
+        # Spawned workers import litellm; keep it from fetching the model cost map
+        monkeypatch.setenv('LITELLM_LOCAL_MODEL_COST_MAP', 'True')
+        df = make_usage_frame(50)
+
+        serial_records, serial_count, serial_summary = collect(
+            ChunkedDataProcessor(chunk_size=15, show_progress=False), df, DataProcessor(source='usertable')
+        )
+        parallel_records, parallel_count, parallel_summary = collect(
+            ChunkedDataProcessor(chunk_size=15, show_progress=False, workers=2), df, DataProcessor(source='usertable')
+        )
+
+        assert parallel_records == serial_records
+        assert parallel_count == serial_count == 50
+        assert parallel_summary['total_errors'] == serial_summary['total_errors'] > 0
@@ -109,6 +109,26 @@ class TestCLISmoke:
         assert 'cannot import' not in result.stderr
         assert 'invalid choice' in result.stderr
     
+    def test_workers_must_be_positive(self):
+        """Test that --workers below 1 is rejected while parsing arguments."""
+        result = self.run_command('transform', '--workers', '0')
+        assert result.returncode != 0
+        assert 'must be at least 1' in result.stderr
+
+    @pytest.mark.parametrize('option,value,message', [
+        ('--batch-size', '0', 'must be at least 1'),
+        ('--upload-concurrency', '0', 'must be at least 1'),
+        ('--max-drop-records', '-5', 'must be at least 1'),
+        ('--max-retries', '-1', 'must be at least 0'),
+        ('--max-drop-bytes', '-1', 'must be at least 0'),
+        ('--partitions', '0', 'must be at least 1'),
+    ])
+    def test_transmit_limits_validated_while_parsing(self, option, value, message):
+        """Out-of-range transmit limits are rejected before any database or upload work."""
+        result = self.run_command('transmit', 'day', option, value)
+        assert result.returncode != 0
+        assert message in result.stderr
+
     def test_transmit_with_env_credentials(self):
         """Test that transmit can use environment variables for credentials (CI/CD safe)."""
         # Set environment variables
@@ -124,4 +144,23 @@ class TestCLISmoke:
         assert result.returncode == 0
         assert 'transmit' in result.stdout
         assert 'ImportError' not in result.stderr
-        assert 'cannot import' not in result.stderr
\ No newline at end of file
+        assert 'cannot import' not in result.stderr
+
+    def test_cache_clear_journal(self, tmp_path):
+        """cache clear --journal forgets acknowledged batches of the given connection only."""
+        from ll2cz.checkpoint import CheckpointJournal, CheckpointKey
+
+        journal = CheckpointJournal(tmp_path / '.ll2cz' / 'cache' / 'transmit_journal.db')
+        for connection_id in ('cleared', 'kept'):
+            journal.record(CheckpointKey(connection_id, '2025-01', '2025-01-15', 'replace_hourly', 'abc'), records=1)
+
+        env = os.environ.copy()
+        env['HOME'] = str(tmp_path)
+        cmd = [sys.executable, '-m', 'll2cz', 'cache', 'clear', '--input', f'sqlite:///{tmp_path / "litellm.db"}',
+               '--journal', '--cz-connection-id', 'cleared']
+        result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+
+        assert result.returncode == 0, result.stderr
+        assert 'Cleared 1 transmit journal entries' in result.stdout
+        assert not journal.is_acknowledged(CheckpointKey('cleared', '2025-01', '2025-01-15', 'replace_hourly', 'abc'))
+        assert journal.is_acknowledged(CheckpointKey('kept', '2025-01', '2025-01-15', 'replace_hourly', 'abc'))
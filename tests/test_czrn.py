@@ -3,9 +3,17 @@
 
 """Tests for CloudZero Resource Names (CZRN) generation."""
 
+import polars as pl
 import pytest
 
 from ll2cz.czrn import CZRNGenerator
+from ll2cz.transformations import normalize_component, normalize_component_cached, normalize_component_expr
+
+COMPONENT_SAMPLES = [
+    'Test_Component', 'UPPERCASE', 'with spaces', 'with@special!chars', 'multiple---hyphens',
+    '-leading-trailing-', '', '!!!', 'sk-1234abcd', 'Team Key (prod) #2', 'café-Ünïcode', 'a -- b__c', None,
+    '--a--b--', '_x_', 'İstanbul', '\u212aelvin', 'ＦＵＬＬ-width', '日本語キー', ' padded ',
+]
 
 
 class TestCZRNGenerator:
@@ -204,3 +212,24 @@ class TestCZRNGenerator:
         assert ':' not in cloud_local_id
         assert cloud_local_id == 'bedrock/us.anthropic.claude-3-haiku|0'
 
+
+class TestNormalizeComponent:
+    """Test the scalar, memoized and Polars expression forms of normalize_component."""
+
+    @pytest.mark.parametrize('allow_uppercase', [False, True])
+    def test_expression_matches_scalar(self, allow_uppercase):
+        """normalize_component_expr gives the same value as normalize_component for every row."""
+        column = pl.Series('component', COMPONENT_SAMPLES, dtype=pl.Utf8)
+
+        result = pl.select(normalize_component_expr(pl.lit(column), allow_uppercase)).to_series().to_list()
+
+        assert result == [normalize_component(value, allow_uppercase) for value in COMPONENT_SAMPLES]
+
+    def test_cached_matches_scalar(self):
+        """The memoized variant returns the same values and serves repeats from its cache."""
+        normalize_component_cached.cache_clear()
+
+        for value in COMPONENT_SAMPLES + COMPONENT_SAMPLES:
+            assert normalize_component_cached(value) == normalize_component(value)
+
+        assert normalize_component_cached.cache_info().hits == len(COMPONENT_SAMPLES)
@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for DataProcessor record resolution and the columnar transform_frame()."""
+
+import warnings
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+
+from ll2cz.data_processor import DataProcessor, RecordComponents
+from ll2cz.transformations import normalize_service
+from ll2cz.database import LiteLLMDatabase
+
+TEST_DB = Path(__file__).parent.parent / "test.sqlite"
+
+
+def row_path_records(source: str, df: pl.DataFrame) -> list:
+    """CBF records from the per-record path."""
+    _, records, _ = DataProcessor(source=source).process_dataframe(df)
+    return records
+
+
+def frame_path_records(source: str, df: pl.DataFrame) -> list:
+    """CBF records from transform_frame()."""
+    return DataProcessor.records_from_frame(DataProcessor(source=source).transform_frame(df))
+
+
+class TestResolveComponents:
+    """Components are derived once per record and shared by the CZRN and CBF record."""
+
+    def test_components_shared_between_czrn_and_cbf(self):
+        """The CBF record reuses the resolved components, including the CZRN tag."""
+        processor = DataProcessor(source='usertable')
+        record = {'date': '2025-01-15', 'custom_llm_provider': 'openai', 'model': 'gpt-4o',
+                  'key_alias': 'Team Key', 'api_key': 'sk-1', 'spend': 0.5}
+
+        components = processor.resolve_components(record)
+        cbf_record = processor.create_cbf_record(record, components)
+
+        assert isinstance(components, RecordComponents)
+        assert components.czrn == processor.create_czrn(record)
+        assert cbf_record['resource/tag:czrn'] == components.czrn
+        assert cbf_record['resource/account'] == components.account == 'team-key'
+        assert cbf_record == processor.create_cbf_record(record)
+
+    def test_process_dataframe_resolves_each_record_once(self):
+        """Provider normalization runs once per record, not once for the CZRN and again for the CBF."""
+        df = pl.DataFrame({
+            'date': ['2025-01-15', '2025-01-16'],
+            'custom_llm_provider': ['openai', 'anthropic'],
+            'model': ['gpt-4o', 'claude-3-haiku'],
+            'api_key': ['sk-1', 'sk-2'],
+        })
+
+        with patch('ll2cz.data_processor.normalize_service', wraps=normalize_service) as normalize:
+            czrns, records, _ = DataProcessor(source='usertable').process_dataframe(df)
+
+        assert normalize.call_count == 2
+        assert len(czrns) == len(records) == 2
+
+    def test_missing_components_tracked_once_per_record(self):
+        """Each missing component produces a single error entry per record."""
+        df = pl.DataFrame({
+            'date': ['2025-01-15'],
+            'custom_llm_provider': [None],
+            'model': [None],
+            'api_key': ['sk-1'],
+        })
+
+        czrns, records, summary = DataProcessor(source='usertable').process_dataframe(df)
+
+        assert czrns == []
+        assert 'resource/tag:czrn' not in records[0]
+        assert summary['total_errors'] == 2
+        assert summary['error_types'] == {'MISSING_PROVIDER': 1, 'MISSING_MODEL': 1}
+
+
+class TestResolveDimensions:
+    """Components are resolved once per distinct (provider, model, key_alias, api_key) tuple."""
+
+    def test_normalizers_run_once_per_distinct_tuple(self):
+        """Repeated tuples, including ones with nulls, are resolved once and joined back."""
+        df = pl.DataFrame({
+            'date': ['2025-01-15', '2025-01-16', '2025-01-17', '2025-01-18', '2025-01-19'],
+            'custom_llm_provider': ['openai', 'openai', None, 'openai', None],
+            'model': ['gpt-4o', 'gpt-4o', 'claude-3-haiku', 'gpt-4o', 'claude-3-haiku'],
+            'key_alias': [None, None, 'team', None, 'team'],
+            'api_key': ['sk-1', 'sk-1', 'sk-2', 'sk-1', 'sk-2'],
+        })
+        processor = DataProcessor(source='usertable')
+
+        with patch('ll2cz.data_processor.normalize_service', wraps=normalize_service) as normalize:
+            dimensions = processor.resolve_dimensions(df)
+
+        assert normalize.call_count == 1  # the null provider is never normalized
+        assert dimensions.columns == DataProcessor.COMPONENT_FIELDS
+        assert dimensions['account'].to_list() == ['sk-1', 'sk-1', 'team', 'sk-1', 'team']
+        assert dimensions['czrn'].is_null().to_list() == [False, False, True, False, True]
+        for values, record in zip(dimensions.iter_rows(named=True), df.to_dicts()):
+            assert RecordComponents(**values) == processor._derive_components(
+                record, processor._get_owner_account(record))
+
+    def test_owner_account_matches_row_path(self):
+        """Owner accounts normalized per column match the per-record normalization."""
+        key_aliases = ['Team--A', '  ', None, '-prod-', 'Équipe Ünïcode', '', '!!!']
+        df = pl.DataFrame({
+            'custom_llm_provider': ['openai'] * len(key_aliases),
+            'model': ['gpt-4o'] * len(key_aliases),
+            'key_alias': key_aliases,
+            'api_key': ['sk-1', 'sk--2', 'SK_3', None, 'sk-5', None, 'sk-7'],
+        })
+        processor = DataProcessor(source='usertable')
+
+        dimensions = processor.resolve_dimensions(df)
+
+        assert dimensions['account'].to_list() == [processor._get_owner_account(record) for record in df.to_dicts()]
+        assert dimensions['account'].to_list() == [
+            'team-a', 'sk-2', 'sk-3', 'prod', 'quipe-n-code', None, 'unknown'
+        ]
+
+    def test_missing_dimension_columns(self):
+        """Frames without dimension columns resolve like records without those fields."""
+        df = pl.DataFrame({'date': ['2025-01-15', '2025-01-16']})
+
+        dimensions = DataProcessor(source='usertable').resolve_dimensions(df)
+
+        assert dimensions['resource_type'].to_list() == [None, None]
+        assert dimensions['cloud_local_id'].to_list() == ['unknown', 'unknown']
+
+
+class TestTransformFrame:
+    """transform_frame() must produce exactly the records of create_cbf_record()."""
+
+    def test_usertable_edge_cases_match_row_path(self):
+        """Missing/empty/wildcard values, key_alias fallback and date formats match."""
+        df = pl.DataFrame({
+            'date': ['2025-01-15', '2025-01-15', '2025-01-16T10:30:00Z', None, '2025-01-17'],
+            'custom_llm_provider': ['openai', '', 'anthropic', None, 'azure_ai'],
+            'model': ['gpt-4o', 'gpt-4o', '*', None, 'gpt-4o:2024-08-06'],
+            'key_alias': ['Team Key!', None, '  ', 'alias', None],
+            'api_key': ['sk-1', 'sk-2', 'sk-3', None, None],
+            'prompt_tokens': [10, None, 5, 1, 2],
+            'completion_tokens': [20, 3, None, None, 2],
+            'spend': [0.25, None, 1e-07, 0.0, 2.5],
+            'api_requests': [1, 2, None, 4, 5],
+            'entity_type': ['user', 'team', 'user', 'tag', 'user'],
+        })
+
+        assert frame_path_records('usertable', df) == row_path_records('usertable', df)
+
+    def test_logs_datetime_start_time_normalized_to_utc(self):
+        """Datetime start times become UTC 'Z' strings, naive or tz-aware, on both paths."""
+        start_times = [datetime(2025, 1, 15, 10, 0, 0), datetime(2025, 1, 15, 10, 0, 0, 123456)]
+        base = {
+            'custom_llm_provider': ['openai', 'openai'],
+            'model': ['gpt-4o', 'gpt-4o-mini'],
+            'call_type': ['acompletion', 'Embedding Call'],
+            'api_key': ['sk-1', 'sk-2'],
+            'spend': [0.1, 0.2],
+        }
+        naive = pl.DataFrame({**base, 'start_time': start_times})
+        aware = naive.with_columns(pl.col('start_time').dt.replace_time_zone('Europe/Berlin'))
+
+        records = frame_path_records('logs', naive)
+        assert [r['time/usage_start'] for r in records] == [
+            '2025-01-15T10:00:00Z', '2025-01-15T10:00:00.123456Z'
+        ]
+        assert records == row_path_records('logs', naive)
+        assert frame_path_records('logs', aware) == row_path_records('logs', aware)
+        assert frame_path_records('logs', aware)[0]['time/usage_start'] == '2025-01-15T09:00:00Z'
+
+    def test_missing_czrn_rows_track_errors(self):
+        """Rows without a CZRN are still reported to the error tracker."""
+        df = pl.DataFrame({'date': ['2025-01-15'], 'custom_llm_provider': ['openai'], 'model': [None]})
+        processor = DataProcessor(source='usertable')
+
+        frame = processor.transform_frame(df)
+
+        assert frame['resource/tag:czrn'].to_list() == [None]
+        assert processor.error_tracker.get_error_summary()['total_errors'] > 0
+
+    @pytest.mark.parametrize('values,dtype', [
+        ([None, None], pl.Null),
+        ([1, -20, None], pl.Int64),
+        ([True, False, None], pl.Boolean),
+        ([0.1, 1.0, 1e16, 1.5e-5, 2.5e-07, -1e-4, 1e-300, 0.0, float('nan'), float('inf'), None], pl.Float64),
+        ([0.1, 3.3e-9, 1e20, None], pl.Float32),
+        ([Decimal('1.50'), Decimal('-0.01'), None], pl.Decimal(10, 2)),
+        ([date(2025, 1, 15), None], pl.Date),
+        ([datetime(2025, 1, 15, 10), datetime(2025, 1, 15, 10, 0, 0, 5), None], pl.Datetime('us')),
+        ([datetime(2025, 1, 15, 10), datetime(2025, 1, 15, 10, 0, 0, 5), None], pl.Datetime('ns', 'Europe/Berlin')),
+    ])
+    def test_tags_stringified_like_str(self, values, dtype):
+        """Tag columns of every type are converted natively to exactly the str() text of the row path."""
+        df = pl.DataFrame({'value': pl.Series(values, dtype=dtype)})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', pl.exceptions.PolarsInefficientMapWarning)
+            result = df.select(DataProcessor._stringify(pl.col('value'), df.schema['value'])).to_series().to_list()
+
+        assert result == [None if value is None else str(value) for value in df['value'].to_list()]
+
+    def test_all_null_tag_columns_without_map_warning(self):
+        """SpendLogs with all-null tag columns transform without a per-row Python callback."""
+        df = pl.DataFrame({
+            'start_time': ['2025-01-15 10:00:00'],
+            'custom_llm_provider': ['openai'],
+            'model': ['gpt-4o'],
+            'call_type': ['acompletion'],
+            'api_key': ['sk-1'],
+            'end_user': [None],
+            'organization_id': [None],
+        })
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', pl.exceptions.PolarsInefficientMapWarning)
+            records = frame_path_records('logs', df)
+
+        assert records == row_path_records('logs', df)
+
+    @pytest.mark.skipif(not TEST_DB.exists(), reason="test.sqlite not available")
+    @pytest.mark.parametrize('source', ['usertable', 'logs'])
+    def test_sample_database_matches_row_path(self, source):
+        """Records from the sample database are identical on both paths."""
+        database = LiteLLMDatabase(f"sqlite:///{TEST_DB}")
+        df = database.get_usage_data() if source == 'usertable' else database.get_spend_logs_for_analysis()
+
+        assert frame_path_records(source, df) == row_path_records(source, df)
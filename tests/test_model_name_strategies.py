@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for model name extraction."""
+
+from unittest.mock import patch
+
+from ll2cz.model_name_strategies import ModelNameExtractor, extract_model_name, get_model_name_extractor
+
+
+class TestModelNameExtractor:
+    """Test the memoized model name extractor."""
+
+    def test_extract_model_names(self):
+        """Test extraction across the supported model string formats."""
+        extractor = ModelNameExtractor()
+        assert extractor.extract('gpt-4o-2024-08-06') == 'gpt'
+        assert extractor.extract('claude-3-5-sonnet-20241022') == 'claude-sonnet'
+        assert extractor.extract('fireworks_ai/accounts/fireworks/models/deepseek-v3') == 'deepseek'
+        assert extractor.extract('us.amazon.nova-lite-v1:0') == 'nova-lite'
+        assert extractor.extract('o1-preview') == 'o1-preview'
+        assert extractor.extract('') == 'unknown'
+
+    def test_cache_hits_and_misses(self):
+        """Test that repeated model strings are served from the LRU cache."""
+        extractor = ModelNameExtractor()
+        for _ in range(3):
+            extractor.extract('gpt-4o-mini')
+        extractor.extract('claude-3-haiku')
+
+        info = extractor.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+
+        extractor.cache_clear()
+        assert extractor.cache_info().currsize == 0
+
+    def test_cache_is_bounded(self):
+        """Test that the cache never holds more than cache_size entries."""
+        extractor = ModelNameExtractor(cache_size=2)
+        for model in ('model-a', 'model-b', 'model-c'):
+            extractor.extract(model)
+        assert extractor.cache_info().currsize == 2
+
+    def test_shared_extractor_loads_config_once(self):
+        """Test that extract_model_name reuses one extractor instead of re-reading providers.yml."""
+        extractor = get_model_name_extractor()
+        assert get_model_name_extractor() is extractor
+
+        with patch('ll2cz.model_name_strategies.yaml.safe_load') as safe_load:
+            for _ in range(100):
+                extract_model_name('gpt-4o')
+        safe_load.assert_not_called()
@@ -3,13 +3,22 @@
 
 """Tests for output modules."""
 
+import gzip
+import json
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import httpx
 import polars as pl
+import pytest
 
-from ll2cz.output import CloudZeroStreamer, CSVWriter
+from ll2cz.checkpoint import CheckpointJournal
+from ll2cz.output import BatchUploadError, CloudZeroStreamer, CSVWriter
+from ll2cz.payload import serialize_billing_drop
+from ll2cz.retry import RetryPolicy, TokenBucket
 
 
 class TestCSVWriter:
@@ -92,7 +101,7 @@ class TestCloudZeroStreamer:
             assert call_args[1]['headers']['Authorization'] == 'Bearer test-api-key'
             assert 'test-connection-id' in call_args[0][0]
 
-            payload = call_args[1]['json']
+            payload = json.loads(call_args[1]['content'])
             # Check the data array in the payload
             data_records = payload['data']
             assert len(data_records) == 1
@@ -101,3 +110,346 @@ class TestCloudZeroStreamer:
             assert record['resource/id'] == 'req_123'
             assert record['cost/cost'] == '0.002'  # CloudZero expects strings
 
+    @staticmethod
+    def daily_data(days):
+        return pl.DataFrame({
+            'time/usage_start': [f'2024-01-{day:02d}T10:00:00Z' for day in days],
+            'cost/cost': [0.5] * len(days),
+            'resource/service': ['litellm'] * len(days),
+        })
+
+    def test_client_is_pooled_across_batches(self):
+        """One HTTP client is opened for all daily batches until close()."""
+        with patch('ll2cz.output.httpx.Client') as mock_client_class:
+            mock_client = Mock()
+            mock_client_class.return_value.__enter__.return_value = mock_client
+
+            streamer = CloudZeroStreamer('test-api-key', 'test-connection-id')
+            streamer.send_batched(self.daily_data([1, 2, 3]))
+            streamer.send_batched(self.daily_data([4]))
+
+            assert mock_client_class.call_count == 1
+            assert mock_client.post.call_count == 4
+
+            streamer.close()
+            mock_client_class.return_value.__exit__.assert_called_once()
+
+    def test_concurrent_upload_results(self):
+        """Concurrent uploads report one result per day, in date-group order."""
+        with patch('ll2cz.output.httpx.Client') as mock_client_class:
+            mock_client = Mock()
+            mock_client_class.return_value.__enter__.return_value = mock_client
+
+            with CloudZeroStreamer('test-api-key', 'test-connection-id', upload_concurrency=3) as streamer:
+                results = streamer.send_batched(self.daily_data([1, 1, 2, 3]), operation='sum')
+
+            assert mock_client_class.call_args[1]['limits'].max_connections == 3
+            assert [(r.batch_date, r.records, r.operation, r.succeeded) for r in results] == [
+                ('2024-01-01', 2, 'sum', True),
+                ('2024-01-02', 1, 'sum', True),
+                ('2024-01-03', 1, 'sum', True),
+            ]
+
+    def test_failed_batches_do_not_stop_other_days(self):
+        """A failing day is reported per batch after every other day has been attempted."""
+        def post(url, headers, content):
+            status = 500 if json.loads(content)['data'][0]['time/usage_start'].startswith('2024-01-02') else 200
+            return httpx.Response(status, request=httpx.Request('POST', url))
+
+        with patch('ll2cz.output.httpx.Client') as mock_client_class:
+            mock_client = Mock()
+            mock_client.post.side_effect = post
+            mock_client_class.return_value.__enter__.return_value = mock_client
+
+            streamer = CloudZeroStreamer('test-api-key', 'test-connection-id', upload_concurrency=2,
+                                         retry_policy=RetryPolicy(max_attempts=1))
+            with pytest.raises(BatchUploadError, match=r"1 of 3 daily batch\(es\) failed") as exc_info:
+                streamer.send_batched(self.daily_data([1, 2, 3]))
+
+        assert mock_client.post.call_count == 3
+        assert [(r.batch_date, r.status_code) for r in exc_info.value.results if not r.succeeded] == [
+            ('2024-01-02', 500)
+        ]
+
+    def test_gzip_uploads_to_stub_server(self):
+        """Compressed drops are accepted by a server that honours Content-Encoding: gzip."""
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                if self.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                received.append((self.headers.get('Content-Encoding'), json.loads(body)))
+                self.send_response(200)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            with CloudZeroStreamer('key', 'conn', compression='gzip') as streamer:
+                streamer.base_url = f"http://127.0.0.1:{server.server_port}"
+                results = streamer.send_batched(self.daily_data([1, 2, 3]), operation='sum')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert all(result.succeeded for result in results)
+        assert [(encoding, payload['operation'], payload['data'][0]['time/usage_start'])
+                for encoding, payload in received] == [
+            ('gzip', 'sum', '2024-01-01T10:00:00Z'),
+            ('gzip', 'sum', '2024-01-02T10:00:00Z'),
+            ('gzip', 'sum', '2024-01-03T10:00:00Z'),
+        ]
+
+    def test_invalid_compression(self):
+        """Only supported compression schemes are accepted."""
+        with pytest.raises(ValueError, match="Invalid compression: br"):
+            CloudZeroStreamer('key', 'conn', compression='br')
+
+    @staticmethod
+    def hourly_data(hours):
+        return pl.DataFrame({
+            'time/usage_start': [f'2024-01-01T{hour:02d}:15:00Z' for hour in hours],
+            'cost/cost': [0.5] * len(hours),
+            'resource/id': [f'row-{i:02d}' for i in range(len(hours))],
+        })
+
+    def test_split_drop_keeps_hours_replaced_once(self):
+        """Whole hours keep the operation; only the overflow of an hour is sent with sum."""
+        streamer = CloudZeroStreamer('key', 'conn', max_drop_records=2)
+        _, encoded = streamer._encode_batch('2024-01-01', self.hourly_data([2, 0, 0, 1, 0, 2]))
+
+        parts = streamer._split_drop(encoded, 'replace_hourly')
+
+        assert [(operation, [json.loads(record)['resource/id'] for record in records])
+                for operation, records in parts] == [
+            ('replace_hourly', ['row-01', 'row-02']),
+            ('sum', ['row-04']),
+            ('replace_hourly', ['row-03', 'row-00']),
+            ('sum', ['row-05']),
+        ]
+
+    def test_split_drop_by_bytes(self):
+        """Requests stay within max_drop_bytes of serialized records."""
+        _, encoded = CloudZeroStreamer('key', 'conn')._encode_batch('2024-01-01', self.hourly_data(range(12)))
+        # Records plus separating commas; every record has the same length here
+        record_bytes = len(encoded['record'][0]) + 1
+        streamer = CloudZeroStreamer('key', 'conn', max_drop_bytes=record_bytes * 5)
+
+        parts = streamer._split_drop(encoded, 'replace_hourly')
+
+        assert [(operation, len(records)) for operation, records in parts] == [
+            ('replace_hourly', 5), ('replace_hourly', 5), ('replace_hourly', 2)
+        ]
+
+    def test_split_drop_replaces_drop_once(self):
+        """Only the first request of a split replace_drop replaces the month; the rest add to it."""
+        streamer = CloudZeroStreamer('key', 'conn', max_drop_records=2)
+        _, encoded = streamer._encode_batch('2024-01-01', self.hourly_data([0, 0, 0, 1, 2]))
+
+        parts = streamer._split_drop(encoded, 'replace_drop')
+
+        assert [(operation, len(records)) for operation, records in parts] == [
+            ('replace_drop', 2), ('sum', 1), ('sum', 2)
+        ]
+
+    def test_split_batch_sent_in_order(self):
+        """A split day is posted request by request and reported as one batch."""
+        with patch('ll2cz.output.httpx.Client') as mock_client_class:
+            mock_client = Mock()
+            mock_client_class.return_value.__enter__.return_value = mock_client
+
+            results = CloudZeroStreamer('key', 'conn', max_drop_records=2).send_batched(
+                self.hourly_data([0, 0, 0, 1]))
+
+        payloads = [json.loads(call[1]['content']) for call in mock_client.post.call_args_list]
+        assert [(payload['operation'], len(payload['data'])) for payload in payloads] == [
+            ('replace_hourly', 2), ('sum', 1), ('replace_hourly', 1)
+        ]
+        assert [(r.batch_date, r.records, r.drops, r.succeeded) for r in results] == [('2024-01-01', 4, 3, True)]
+
+    def test_split_batch_stops_after_failure(self):
+        """Continuations are not sent once an earlier request of the day failed."""
+        with patch('ll2cz.output.httpx.Client') as mock_client_class:
+            mock_client = self.scripted_client(mock_client_class, [(500, {})])
+            streamer = CloudZeroStreamer('key', 'conn', max_drop_records=2, retry_policy=RetryPolicy(max_attempts=1))
+            with pytest.raises(BatchUploadError):
+                streamer.send_batched(self.hourly_data([0, 0, 0]))
+
+        assert mock_client.post.call_count == 1
+
+    def test_invalid_drop_limits(self):
+        """Drop limits must be positive."""
+        with pytest.raises(ValueError, match="Invalid max_drop_bytes"):
+            CloudZeroStreamer('key', 'conn', max_drop_bytes=0)
+        with pytest.raises(ValueError, match="Invalid max_drop_records"):
+            CloudZeroStreamer('key', 'conn', max_drop_records=0)
+
+    def test_invalid_upload_concurrency(self):
+        """Upload concurrency must be positive."""
+        with pytest.raises(ValueError, match="Invalid upload_concurrency"):
+            CloudZeroStreamer('test-api-key', 'test-connection-id', upload_concurrency=0)
+
+    @staticmethod
+    def scripted_client(mock_client_class, responses):
+        """Make the pooled client answer POSTs with the given status codes/headers in order."""
+        mock_client = Mock()
+
+        def post(url, headers, content):
+            status, response_headers = responses.pop(0)
+            return httpx.Response(status, headers=response_headers, request=httpx.Request('POST', url))
+
+        mock_client.post.side_effect = post
+        mock_client_class.return_value.__enter__.return_value = mock_client
+        return mock_client
+
+    def test_retries_transient_failures_with_backoff(self):
+        """5xx responses are retried with capped exponential backoff until one succeeds."""
+        delays = []
+        policy = RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=3.0, sleep=delays.append)
+
+        with patch('ll2cz.output.httpx.Client') as mock_client_class, \
+                patch('ll2cz.retry.random.uniform', side_effect=lambda low, high: high):
+            mock_client = self.scripted_client(mock_client_class, [(502, {}), (500, {}), (504, {}), (200, {})])
+            results = CloudZeroStreamer('key', 'conn', retry_policy=policy).send_batched(self.daily_data([1]))
+
+        assert mock_client.post.call_count == 4
+        assert delays == [1.0, 2.0, 3.0]
+        assert results[0].succeeded
+
+    def test_retry_after_is_respected_and_pauses_limiter(self):
+        """A 429 Retry-After sets the delay and pauses the shared rate limiter."""
+        delays = []
+        limiter = Mock(spec=TokenBucket)
+
+        with patch('ll2cz.output.httpx.Client') as mock_client_class:
+            self.scripted_client(mock_client_class, [(429, {'Retry-After': '7'}), (200, {})])
+            streamer = CloudZeroStreamer('key', 'conn', rate_limiter=limiter,
+                                         retry_policy=RetryPolicy(sleep=delays.append))
+            streamer.send_batched(self.daily_data([1]))
+
+        assert delays == [7.0]
+        limiter.pause.assert_called_once_with(7.0)
+        assert limiter.acquire.call_count == 2
+
+    def test_gives_up_after_max_attempts(self):
+        """The last failure is reported once the retry budget is spent."""
+        policy = RetryPolicy(max_attempts=2, sleep=lambda delay: None)
+
+        with patch('ll2cz.output.httpx.Client') as mock_client_class:
+            mock_client = self.scripted_client(mock_client_class, [(503, {}), (503, {})])
+            with pytest.raises(BatchUploadError) as exc_info:
+                CloudZeroStreamer('key', 'conn', retry_policy=policy).send_batched(self.daily_data([1]))
+
+        assert mock_client.post.call_count == 2
+        assert exc_info.value.results[0].status_code == 503
+
+    def test_sum_is_not_retried_on_ambiguous_failures(self):
+        """A 500 on a sum drop may have been applied, so it is not sent again."""
+        with patch('ll2cz.output.httpx.Client') as mock_client_class:
+            mock_client = self.scripted_client(mock_client_class, [(500, {})])
+            streamer = CloudZeroStreamer('key', 'conn', retry_policy=RetryPolicy(sleep=lambda delay: None))
+            with pytest.raises(BatchUploadError):
+                streamer.send_batched(self.daily_data([1]), operation='sum')
+
+        assert mock_client.post.call_count == 1
+
+    def test_resume_skips_acknowledged_batches(self, tmp_path):
+        """With resume, days already in the journal are skipped unless their content changed."""
+        journal = CheckpointJournal(tmp_path / 'journal.db')
+        policy = RetryPolicy(max_attempts=1)
+
+        with patch('ll2cz.output.httpx.Client') as mock_client_class:
+            self.scripted_client(mock_client_class, [(200, {}), (500, {}), (200, {})])
+            with pytest.raises(BatchUploadError):
+                CloudZeroStreamer('key', 'conn', retry_policy=policy, journal=journal).send_batched(
+                    self.daily_data([1, 2, 3]))
+
+        data = self.daily_data([1, 2, 3]).with_columns(
+            cost=pl.when(pl.col('time/usage_start').str.starts_with('2024-01-03')).then(0.75).otherwise(0.5)
+        ).drop('cost/cost').rename({'cost': 'cost/cost'})
+
+        with patch('ll2cz.output.httpx.Client') as mock_client_class:
+            mock_client = self.scripted_client(mock_client_class, [(200, {}), (200, {})])
+            results = CloudZeroStreamer('key', 'conn', retry_policy=policy, journal=journal,
+                                        resume=True).send_batched(data)
+
+        assert [(r.batch_date, r.skipped) for r in results] == [
+            ('2024-01-01', True), ('2024-01-02', False), ('2024-01-03', False)
+        ]
+        assert all(r.succeeded for r in results)
+        assert mock_client.post.call_count == 2
+
+    def test_group_by_date_in_utc(self):
+        """Days are UTC dates; offset-less timestamps are read in the streamer's timezone."""
+        data = pl.DataFrame({
+            'time/usage_start': [
+                '2025-01-15T23:30:00Z', '2025-01-15T23:30:00-05:00', '2025-01-15T22:00:00',
+                '2025-01-15 22:00:00', '2025-01-15', 'not a timestamp', None,
+            ],
+            'row': list(range(7)),
+        })
+
+        streamer = CloudZeroStreamer('key', 'conn', 'America/New_York')
+        streamer.console.quiet = True
+        batches = streamer._group_by_date(data)
+
+        assert {day: batch['row'].to_list() for day, batch in batches.items()} == {
+            '2025-01-15': [0, 4],
+            '2025-01-16': [1, 2, 3],
+        }
+        assert batches['2025-01-15'].columns == ['time/usage_start', 'row']
+
+    def test_group_by_date_datetime_column(self):
+        """Datetime columns are bucketed without string parsing."""
+        data = pl.DataFrame({
+            'time/usage_start': pl.Series([
+                '2025-01-15T12:00:00', '2025-01-16T01:00:00'
+            ]).str.to_datetime().dt.replace_time_zone('Asia/Tokyo'),
+        })
+
+        batches = CloudZeroStreamer('key', 'conn')._group_by_date(data)
+
+        assert {day: len(batch) for day, batch in batches.items()} == {'2025-01-15': 2}
+
+    def test_naive_datetimes_in_dst_gap(self):
+        """Local times skipped by a DST change are parsed like strings instead of failing the batch."""
+        local = pl.Series('time/usage_start', [
+            '2025-03-30T02:30:00', '2025-03-30T03:30:00', None
+        ]).str.to_datetime()
+        streamer = CloudZeroStreamer('key', 'conn', user_timezone='Europe/Berlin')
+
+        utc = streamer._utc_timestamps(local)
+
+        assert utc.to_list() == streamer._utc_timestamps(local.dt.strftime('%Y-%m-%dT%H:%M:%S')).to_list()
+        assert [value.isoformat() if value else None for value in utc] == [
+            '2025-03-30T01:30:00+00:00', '2025-03-30T01:30:00+00:00', None
+        ]
+        assert {day: len(batch) for day, batch in streamer._group_by_date(local.to_frame()).items()} == {
+            '2025-03-30': 2
+        }
+
+    def test_payload_timestamps_in_utc(self):
+        """Usage start times are sent as UTC ISO-8601 strings whatever their input form."""
+        data = pl.DataFrame({
+            'time/usage_start': ['2025-01-15T23:30:00-05:00', '2025-01-16T10:00:00', '2025-01-16T10:00:00.250000Z'],
+            'cost/cost': [0.1, 0.2, 0.3],
+        })
+
+        month, encoded = CloudZeroStreamer('key', 'conn', user_timezone='Europe/Berlin')._encode_batch(
+            '2025-01-16', data)
+        records = encoded['record']
+
+        payload = json.loads(serialize_billing_drop(month, 'replace_hourly', records))
+        assert (month, payload['month'], payload['operation']) == ('2025-01', '2025-01', 'replace_hourly')
+        assert [record['time/usage_start'] for record in payload['data']] == [
+            '2025-01-16T04:30:00Z', '2025-01-16T09:00:00Z', '2025-01-16T10:00:00.250000Z'
+        ]
+        assert len(records) == 3
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for columnar billing_drops payload serialization."""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import polars as pl
+
+from ll2cz.date_utils import format_utc_timestamp
+from ll2cz.payload import api_records, serialize_billing_drop
+
+
+class TestApiRecords:
+    """Test encoding CBF rows as API records."""
+
+    def test_numeric_values_are_plain_strings(self):
+        """Numbers are sent as strings without scientific notation or trailing zeros."""
+        data = pl.DataFrame({
+            'cost/cost': [0.002, 1e-7, 12.0, 0.0],
+            'usage/amount': [1000, 0, 5, 2_000_000_000_000],
+        })
+
+        records = [json.loads(record) for record in api_records(data)]
+
+        assert records == [
+            {'cost/cost': '0.002', 'usage/amount': '1000'},
+            {'cost/cost': '0.0000001', 'usage/amount': '0'},
+            {'cost/cost': '12', 'usage/amount': '5'},
+            {'cost/cost': '0', 'usage/amount': '2000000000000'},
+        ]
+
+    def test_large_values_keep_their_digits(self):
+        """Values past Decimal(38, 10) are written as whole numbers instead of failing or losing digits."""
+        values = [123456789.12345679, 1.5e27, 1e30, -1e30]
+        data = pl.DataFrame({'cost/cost': values})
+
+        records = [json.loads(record)['cost/cost'] for record in api_records(data)]
+
+        assert records == [f'{value:.10f}'.rstrip('0').rstrip('.') for value in values]
+
+    def test_non_finite_values_are_kept(self):
+        """NaN, infinities and values past Int128 fall back to float formatting rather than being dropped."""
+        data = pl.DataFrame({'cost/cost': [float('nan'), float('inf'), float('-inf'), 1e39]})
+
+        records = [json.loads(record) for record in api_records(data)]
+
+        assert records == [{'cost/cost': 'NaN'}, {'cost/cost': 'inf'}, {'cost/cost': '-inf'}, {'cost/cost': '1e+39'}]
+
+    def test_decimal_values(self):
+        """Decimals are written exactly, including ones with more whole digits than Decimal(38, 10) holds."""
+        data = pl.DataFrame({
+            'cost/cost': pl.Series([Decimal('1.50'), Decimal('12')], dtype=pl.Decimal(38, 2)),
+            'usage/amount': pl.Series([Decimal('1' + '0' * 30), Decimal('7')], dtype=pl.Decimal(38, 0)),
+        })
+
+        records = [json.loads(record) for record in api_records(data)]
+
+        assert records == [
+            {'cost/cost': '1.5', 'usage/amount': '1' + '0' * 30},
+            {'cost/cost': '12', 'usage/amount': '7'},
+        ]
+
+    def test_nulls_are_omitted_and_strings_escaped(self):
+        """Null fields are left out; strings keep quotes and non-ASCII characters intact."""
+        data = pl.DataFrame({
+            'resource/id': ['model "a" é', None],
+            'resource/tag:flag': [True, None],
+            'cost/cost': [None, 0.5],
+        })
+
+        records = [json.loads(record) for record in api_records(data)]
+
+        assert records == [
+            {'resource/id': 'model "a" é', 'resource/tag:flag': 'True'},
+            {'cost/cost': '0.5'},
+        ]
+
+    def test_fields_in_name_order(self):
+        """Column order doesn't change the encoded record."""
+        data = pl.DataFrame({'b': ['x'], 'a': [1]})
+
+        assert api_records(data).to_list() == api_records(data.select('a', 'b')).to_list() == ['{"a":"1","b":"x"}']
+
+
+class TestSerializeBillingDrop:
+    """Test framing records into a request body."""
+
+    def test_envelope(self):
+        """The body is a JSON object with month, operation and the records as data."""
+        records = api_records(pl.DataFrame({'cost/cost': [0.25, 0.5]}))
+
+        body = json.loads(serialize_billing_drop('2025-01', 'replace_hourly', records))
+
+        assert body == {
+            'month': '2025-01',
+            'operation': 'replace_hourly',
+            'data': [{'cost/cost': '0.25'}, {'cost/cost': '0.5'}],
+        }
+
+    def test_empty(self):
+        """An empty batch serializes to an empty data list."""
+        body = serialize_billing_drop('2025-01', 'sum', api_records(pl.DataFrame({'cost/cost': []})))
+
+        assert json.loads(body)['data'] == []
+
+    def test_format_utc_timestamp(self):
+        """Fractional seconds appear only when non-zero."""
+        data = pl.DataFrame({'ts': [datetime(2025, 1, 15, 10, 30), datetime(2025, 1, 15, 10, 30, 0, 120000)]})
+
+        assert data.select(format_utc_timestamp(pl.col('ts'))).to_series().to_list() == [
+            '2025-01-15T10:30:00Z', '2025-01-15T10:30:00.120000Z'
+        ]
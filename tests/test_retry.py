@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for upload retry and rate-limiting policies."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from ll2cz.retry import RetryPolicy, TokenBucket
+
+
+def status_error(status, headers=None):
+    request = httpx.Request('POST', 'https://api.cloudzero.com/billing_drops')
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status}", request=request, response=response)
+
+
+class TestRetryPolicy:
+    """Test retry decisions and backoff delays."""
+
+    def test_retryable_errors(self):
+        """Transient statuses and network errors are retried until the attempt budget runs out."""
+        policy = RetryPolicy(max_attempts=3)
+        request = httpx.Request('POST', 'https://api.cloudzero.com')
+
+        assert policy.should_retry(status_error(503), 'replace_hourly', 1)
+        assert policy.should_retry(httpx.ReadTimeout("timeout", request=request), 'replace_hourly', 2)
+        assert not policy.should_retry(status_error(503), 'replace_hourly', 3)
+        assert not policy.should_retry(status_error(400), 'replace_hourly', 1)
+        assert not policy.should_retry(status_error(401), 'replace_hourly', 1)
+
+    def test_sum_only_retries_unapplied_requests(self):
+        """sum drops are retried only when the request cannot have been applied."""
+        policy = RetryPolicy()
+        request = httpx.Request('POST', 'https://api.cloudzero.com')
+
+        assert policy.should_retry(status_error(429), 'sum', 1)
+        assert policy.should_retry(httpx.ConnectError("refused", request=request), 'sum', 1)
+        assert not policy.should_retry(status_error(500), 'sum', 1)
+        assert not policy.should_retry(httpx.ReadTimeout("timeout", request=request), 'sum', 1)
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Delays stay within [0, min(max_delay, base * 2^(n-1))]."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+
+        for attempt, ceiling in [(1, 0.5), (2, 1.0), (3, 2.0), (4, 4.0), (10, 4.0)]:
+            delays = [policy.delay_for(attempt) for _ in range(50)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+            assert len(set(delays)) > 1
+
+    def test_retry_after(self):
+        """Retry-After is honoured on 429/503 as seconds or an HTTP date, and capped."""
+        policy = RetryPolicy(max_retry_after=60.0)
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+
+        assert policy.delay_for(1, status_error(429, {'Retry-After': '12'})) == 12.0
+        assert 25 <= policy.delay_for(1, status_error(503, {'Retry-After': retry_at})) <= 30
+        assert policy.delay_for(1, status_error(429, {'Retry-After': '600'})) == 60.0
+        assert policy.retry_after(status_error(500, {'Retry-After': '12'})) is None
+        assert policy.retry_after(status_error(429, {'Retry-After': 'soon'})) is None
+
+    def test_invalid_max_attempts(self):
+        """At least one attempt is required."""
+        with pytest.raises(ValueError, match="Invalid max_attempts"):
+            RetryPolicy(max_attempts=0)
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Test the shared upload rate limiter."""
+
+    def test_burst_then_steady_rate(self):
+        """A full bucket allows a burst, then tokens are handed out at the refill rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+        for _ in range(4):
+            bucket.acquire()
+
+        assert clock.now == pytest.approx(1.0)
+
+    def test_pause_holds_back_all_callers(self):
+        """pause() delays the next token until the pause has passed."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, clock=clock, sleep=clock.sleep)
+
+        bucket.pause(5.0)
+        bucket.acquire()
+
+        assert clock.now >= 5.0
+
+    def test_invalid_rate(self):
+        """Rate must be positive."""
+        with pytest.raises(ValueError, match="Invalid rate"):
+            TokenBucket(rate=0)
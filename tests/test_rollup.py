@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: Copyright (c), CloudZero, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the hourly SpendLogs rollup."""
+
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+from ll2cz.data_processor import DataProcessor
+from ll2cz.rollup import rollup_spend_logs
+
+
+def spend_logs(start_times, call_types=None, models=None):
+    rows = len(start_times)
+    return pl.DataFrame({
+        'request_id': [f'req-{i}' for i in range(rows)],
+        'call_type': call_types or ['completion'] * rows,
+        'api_key': ['sk-hash'] * rows,
+        'spend': [0.25] * rows,
+        'total_tokens': [30] * rows,
+        'prompt_tokens': [10] * rows,
+        'completion_tokens': [20] * rows,
+        'start_time': start_times,
+        'model': models or ['gpt-4o'] * rows,
+        'custom_llm_provider': ['openai'] * rows,
+        'key_alias': ['team-key'] * rows,
+        'team_id': ['team-1'] * rows,
+        'api_requests': [1] * rows,
+        'successful_requests': [1] * rows,
+        'failed_requests': [0] * rows,
+        'date': [start[:10] if isinstance(start, str) else start.date() for start in start_times],
+    })
+
+
+class TestRollupSpendLogs:
+    """Test aggregating SpendLogs rows per hour and dimension."""
+
+    def test_groups_by_hour_and_dimensions(self):
+        """Rows in the same hour with the same dimensions are summed; request_id is dropped."""
+        data = spend_logs(
+            ['2025-01-15 10:05:00', '2025-01-15 10:55:00', '2025-01-15 10:30:00', '2025-01-15 11:00:00'],
+            models=['gpt-4o', 'gpt-4o', 'gpt-4o-mini', 'gpt-4o'],
+        )
+
+        rolled = rollup_spend_logs(data)
+
+        assert 'request_id' not in rolled.columns
+        assert rolled.select('start_time', 'model', 'spend', 'prompt_tokens', 'api_requests').rows() == [
+            ('2025-01-15T10:00:00Z', 'gpt-4o', 0.5, 20, 2),
+            ('2025-01-15T10:00:00Z', 'gpt-4o-mini', 0.25, 10, 1),
+            ('2025-01-15T11:00:00Z', 'gpt-4o', 0.25, 10, 1),
+        ]
+
+    def test_datetime_start_times(self):
+        """Datetime start times are truncated in place."""
+        data = spend_logs([datetime(2025, 1, 15, 10, 5), datetime(2025, 1, 15, 10, 59, 59)])
+
+        rolled = rollup_spend_logs(data)
+
+        assert rolled['start_time'].to_list() == [datetime(2025, 1, 15, 10)]
+        assert rolled['total_tokens'].to_list() == [60]
+
+    def test_unparseable_and_missing_start_times(self):
+        """Unparseable start times stay as they are; frames without start_time are unchanged."""
+        data = spend_logs(['not a date', 'not a date', '2025-01-15T10:05:00Z'])
+
+        rolled = rollup_spend_logs(data)
+
+        assert rolled.select('start_time', 'api_requests').rows() == [
+            ('not a date', 2), ('2025-01-15T10:00:00Z', 1)
+        ]
+        assert rollup_spend_logs(data.drop('start_time')).equals(data.drop('start_time'))
+
+    def test_cbf_totals_preserved(self):
+        """CBF generated from the rollup has the same cost and usage in far fewer line items."""
+        starts = [f'2025-01-15 {hour:02d}:{minute:02d}:00' for hour in range(3) for minute in range(0, 60, 5)]
+        data = spend_logs(starts, call_types=['completion', 'embedding'] * (len(starts) // 2))
+
+        raw = DataProcessor(source='logs').transform_frame(data)
+        rolled = DataProcessor(source='logs').transform_frame(rollup_spend_logs(data))
+
+        assert len(raw) == 36 and len(rolled) == 6
+        assert rolled['cost/cost'].sum() == pytest.approx(raw['cost/cost'].sum())
+        assert rolled['usage/amount'].sum() == raw['usage/amount'].sum()
+        assert set(rolled['resource/tag:czrn']) == set(raw['resource/tag:czrn'])
@@ -11,6 +11,7 @@ from pathlib import Path
 import pytest
 import polars as pl
 
+from ll2cz.cached_database import CachedLiteLLMDatabase
 from ll2cz.database import LiteLLMDatabase
 
 
@@ -130,6 +131,26 @@ class TestSQLiteSupport:
         )
         """)
         
+        cursor.execute("""
+        CREATE TABLE LiteLLM_SpendLogs (
+            request_id TEXT PRIMARY KEY,
+            call_type TEXT,
+            api_key TEXT,
+            spend DECIMAL(10, 6),
+            total_tokens INTEGER,
+            prompt_tokens INTEGER,
+            completion_tokens INTEGER,
+            startTime TIMESTAMP,
+            model TEXT,
+            model_group TEXT,
+            custom_llm_provider TEXT,
+            user TEXT,
+            team_id TEXT,
+            end_user TEXT
+        )
+        """)
+        cursor.execute("CREATE INDEX idx_spend_logs_start ON LiteLLM_SpendLogs(startTime)")
+
         # Insert test data
         cursor.execute("INSERT INTO LiteLLM_OrganizationTable VALUES ('org-1', 'Test Org')")
         cursor.execute("INSERT INTO LiteLLM_TeamTable VALUES ('team-1', 'Test Team', 'org-1')")
@@ -144,6 +165,18 @@ class TestSQLiteSupport:
                 1000, 500, 0.05, 10, 10, 0)
         """)
         
+        cursor.executemany("""
+        INSERT INTO LiteLLM_SpendLogs
+        (request_id, call_type, api_key, spend, total_tokens, prompt_tokens, completion_tokens,
+         startTime, model, custom_llm_provider, user, team_id)
+        VALUES (?, 'completion', 'sk-test', 0.01, 150, 100, 50, ?, 'gpt-4', 'openai', 'user-1', 'team-1')
+        """, [
+            ('req-1', '2025-01-14 23:59:59.999000'),
+            ('req-2', '2025-01-15 00:00:00.000000'),
+            ('req-3', '2025-01-15 23:59:59.999000'),
+            ('req-4', '2025-01-16 00:00:00.000000'),
+        ])
+        
         conn.commit()
         conn.close()
         
@@ -190,6 +223,111 @@ class TestSQLiteSupport:
         assert df['model'][0] == 'gpt-4'
         assert df['spend'][0] == 0.05
 
+    def test_sqlite_get_usage_data_date_range(self, temp_sqlite_db):
+        """Test that date bounds are applied in the query before the limit."""
+        conn = sqlite3.connect(temp_sqlite_db)
+        conn.execute("""
+        INSERT INTO LiteLLM_DailyUserSpend
+        (date, user_id, api_key, model, custom_llm_provider, prompt_tokens, completion_tokens, spend)
+        VALUES ('2025-01-16', 'user-1', 'sk-test', 'gpt-4', 'openai', 10, 5, 0.01)
+        """)
+        conn.commit()
+        conn.close()
+
+        db = LiteLLMDatabase(f'sqlite:///{temp_sqlite_db}')
+
+        df = db.get_usage_data(start_date='2025-01-15', end_date='2025-01-15')
+        assert df['date'].to_list() == ['2025-01-15']
+
+        # Limit applies to the filtered rows, not the newest rows overall
+        df = db.get_usage_data(limit=1, start_date='2025-01-15', end_date='2025-01-15')
+        assert df['date'].to_list() == ['2025-01-15']
+
+        df = db.get_usage_data(start_date='2025-01-16')
+        assert df['date'].to_list() == ['2025-01-16']
+
+        df = db.get_usage_data(start_date='2025-02-01', end_date='2025-02-28')
+        assert df.is_empty()
+
+    def test_sqlite_get_spend_logs_for_analysis_date_range(self, temp_sqlite_db):
+        """Test that SpendLogs date bounds cover whole days of startTime."""
+        db = LiteLLMDatabase(f'sqlite:///{temp_sqlite_db}')
+
+        df = db.get_spend_logs_for_analysis()
+        assert len(df) == 4
+
+        df = db.get_spend_logs_for_analysis(start_date='2025-01-15', end_date='2025-01-15')
+        assert sorted(df['request_id'].to_list()) == ['req-2', 'req-3']
+
+        df = db.get_spend_logs_for_analysis(limit=1, start_date='2025-01-15', end_date='2025-01-15')
+        assert df['request_id'].to_list() == ['req-3']
+
+        df = db.get_spend_logs_for_analysis(end_date='2025-01-14')
+        assert df['request_id'].to_list() == ['req-1']
+
+    def test_sqlite_iter_spend_logs_batches(self, temp_sqlite_db):
+        """Test streaming extraction yields bounded batches matching the eager read."""
+        db = LiteLLMDatabase(f'sqlite:///{temp_sqlite_db}')
+
+        batches = list(db.iter_spend_logs_for_analysis(batch_size=3))
+        assert [len(batch) for batch in batches] == [3, 1]
+        streamed = pl.concat(batches, how='vertical_relaxed')
+        assert streamed['request_id'].to_list() == db.get_spend_logs_for_analysis()['request_id'].to_list()
+
+        batches = list(db.iter_spend_logs_for_analysis(batch_size=3, start_date='2025-01-15', end_date='2025-01-15'))
+        assert sum(len(batch) for batch in batches) == 2
+
+        batches = list(db.iter_usage_data(batch_size=10))
+        assert len(batches) == 1
+        assert batches[0]['entity_id'][0] == 'user-1'
+
+    def test_sqlite_connectorx_engine_falls_back(self, temp_sqlite_db):
+        """Test that the connectorx engine uses the built-in driver for SQLite."""
+        db = LiteLLMDatabase(f'sqlite:///{temp_sqlite_db}', engine='connectorx')
+        assert not db._use_connectorx()
+
+        df = db.get_usage_data(start_date='2025-01-15', end_date='2025-01-15')
+        default_df = LiteLLMDatabase(f'sqlite:///{temp_sqlite_db}').get_usage_data(
+            start_date='2025-01-15', end_date='2025-01-15'
+        )
+        assert df.equals(default_df)
+
+    def test_invalid_engine(self):
+        """Test that an unknown extraction engine is rejected."""
+        with pytest.raises(ValueError, match="Invalid engine"):
+            LiteLLMDatabase('sqlite:///unused.db', engine='odbc')
+
+    def test_partitions(self, temp_sqlite_db, tmp_path):
+        """The partition count is validated and passed through the cached wrapper."""
+        with pytest.raises(ValueError, match="Invalid partitions"):
+            LiteLLMDatabase('sqlite:///unused.db', partitions=0)
+
+        cached = CachedLiteLLMDatabase(f'sqlite:///{temp_sqlite_db}', cache_dir=str(tmp_path), engine='connectorx',
+                                       partitions=8)
+        assert cached.database.partitions == 8
+
+    def test_split_date_range(self):
+        """Test date-range partitioning for parallel reads."""
+        ranges = LiteLLMDatabase._split_date_range('2025-01-01', '2025-01-10', 4)
+        assert ranges == [
+            ('2025-01-09', '2025-01-10'),
+            ('2025-01-07', '2025-01-08'),
+            ('2025-01-04', '2025-01-06'),
+            ('2025-01-01', '2025-01-03'),
+        ]
+
+        # Never more partitions than days
+        assert LiteLLMDatabase._split_date_range('2025-01-01', '2025-01-02', 8) == [
+            ('2025-01-02', '2025-01-02'),
+            ('2025-01-01', '2025-01-01'),
+        ]
+
+    def test_inline_params(self):
+        """Test literal substitution of query placeholders for connectorx."""
+        query = LiteLLMDatabase._inline_params("SELECT * FROM t WHERE d BETWEEN %s AND %s",
+                                               ['2025-01-01', "o'brien"])
+        assert query == "SELECT * FROM t WHERE d BETWEEN '2025-01-01' AND 'o''brien'"
+
     def test_sqlite_get_table_info(self, temp_sqlite_db):
         """Test getting table info from SQLite."""
         db = LiteLLMDatabase(f'sqlite:///{temp_sqlite_db}')
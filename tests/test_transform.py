@@ -3,10 +3,34 @@
 
 """Tests for CBF transformation logic."""
 
+from datetime import date, datetime, timedelta, timezone
 
 import polars as pl
+import pytest
 
 from ll2cz.transform import CBFTransformer
+from ll2cz.transformations import normalize_date, normalize_dates, parse_date
+
+# Strings both date normalizers must treat alike: canonical ISO-8601 shapes, other forms
+# fromisoformat() or parse_date() accept, and invalid values
+DATE_STRINGS = [
+    ('2024-01-15', '2024-01-15T00:00:00Z'),
+    ('20240115', '2024-01-15T00:00:00Z'),
+    ('2024-W03-1', '2024-01-15T00:00:00Z'),
+    ('2024-1-15', '2024-01-15T00:00:00Z'),
+    ('2024/01/15', '2024-01-15T00:00:00Z'),
+    ('2024-01-15T10:30', '2024-01-15T10:30:00Z'),
+    ('2024-01-15 10:30:00', '2024-01-15T10:30:00Z'),
+    ('2024-01-15T10:30:00.5Z', '2024-01-15T10:30:00.500000Z'),
+    ('2024-01-15T10:30:00.1234567', '2024-01-15T10:30:00.123456Z'),
+    ('2024-01-15T10:30:00+05:30', '2024-01-15T05:00:00Z'),
+    ('2024-01-15T10:30:00+0530', '2024-01-15T05:00:00Z'),
+    ('2024-01-15T10:30:00-00:00', '2024-01-15T10:30:00Z'),
+    ('2024-02-30', None),
+    ('not a date', None),
+    ('', None),
+    (None, None),
+]
 
 
 class TestCBFTransformer:
@@ -57,7 +81,7 @@ class TestCBFTransformer:
         assert record['usage/units'] == 'tokens'
         assert record['resource/tag:prompt_tokens'] == '100'
         assert record['resource/tag:completion_tokens'] == '50'
-        assert record['time/usage_start'] == '2024-01-01T00:00:00+00:00'  # ISO format with timezone
+        assert record['time/usage_start'] == '2024-01-01T00:00:00Z'  # ISO format in UTC
         assert record['lineitem/type'] == 'Usage'
 
         # Check resource tags (dimensions are now stored as resource/tag: fields)
@@ -131,7 +155,7 @@ class TestCBFTransformer:
         record = result.row(0, named=True)
 
         # Should parse to midnight UTC with timezone
-        assert record['time/usage_start'] == '2024-12-25T00:00:00+00:00'
+        assert record['time/usage_start'] == '2024-12-25T00:00:00Z'
 
     def test_none_values_excluded_from_tags(self):
         """Test that None values are excluded from resource tags."""
@@ -173,3 +197,59 @@ class TestCBFTransformer:
         # Check that valid values are included
         assert record['resource/tag:user_email'] == 'test@example.com'
 
+
+class TestNormalizeDates:
+    """Test column-level date normalization."""
+
+    def test_daily_dates_with_iso_fallback(self):
+        """YYYY-MM-DD parses to midnight UTC; other rows fall back to ISO-8601 parsing."""
+        values = pl.Series('date', [
+            '2024-12-25', '2024-01-15T10:30:00Z', '2024-01-15T10:30:00+02:00',
+            '2024-01-15 10:00:00.123456', 'not a date', None
+        ])
+
+        assert normalize_dates(values).to_list() == [
+            '2024-12-25T00:00:00Z', '2024-01-15T10:30:00Z', '2024-01-15T08:30:00Z',
+            '2024-01-15T10:00:00.123456Z', None, None
+        ]
+
+    def test_matches_parse_date(self):
+        """Strings parse to the same instants as parse_date()."""
+        values = ['2024-12-25', '2024-01-15T10:30:00Z']
+
+        expected = [parse_date(value).strftime('%Y-%m-%dT%H:%M:%SZ') for value in values]
+        assert normalize_dates(pl.Series(values)).to_list() == expected
+
+    def test_temporal_columns(self):
+        """Naive datetimes are taken as UTC, aware ones converted, dates become midnight."""
+        naive = pl.Series('start_time', [datetime(2024, 1, 15, 10, 30), datetime(2024, 1, 15, 10, 30, 0, 500)])
+        aware = naive.dt.replace_time_zone('America/New_York')
+
+        assert normalize_dates(naive).to_list() == ['2024-01-15T10:30:00Z', '2024-01-15T10:30:00.000500Z']
+        assert normalize_dates(aware).to_list() == ['2024-01-15T15:30:00Z', '2024-01-15T15:30:00.000500Z']
+        assert normalize_dates(pl.Series([date(2024, 1, 15)])).to_list() == ['2024-01-15T00:00:00Z']
+        assert normalize_dates(pl.Series([None, None])).to_list() == [None, None]
+
+    @pytest.mark.parametrize('value,expected', DATE_STRINGS)
+    def test_scalar_and_column_accept_same_strings(self, value, expected):
+        """normalize_date() and normalize_dates() parse each string alike, alone or in a mixed column."""
+        mixed = pl.Series([value] + [other for other, _ in DATE_STRINGS], dtype=pl.Utf8)
+
+        assert normalize_date(value) == expected
+        assert normalize_dates(pl.Series([value], dtype=pl.Utf8)).item() == expected
+        assert normalize_dates(mixed)[0] == expected
+
+    def test_scalar_matches_column(self):
+        """normalize_date() gives the same string as normalize_dates() for each value."""
+        values = [
+            '2024-12-25', '2024-01-15T10:30:00Z', '2024-01-15T10:30:00+02:00', '2024-01-15 10:00:00.123456',
+            '2024-01-15T10:30:00.5Z', 'not a date', None,
+        ]
+        temporal = [datetime(2024, 1, 15, 10, 30, 0, 500), date(2024, 1, 15)]
+
+        assert [normalize_date(value) for value in values] == normalize_dates(pl.Series(values)).to_list()
+        assert [normalize_date(value) for value in temporal] == [
+            normalize_dates(pl.Series([value])).item() for value in temporal
+        ]
+        aware = datetime(2024, 1, 15, 10, 30, tzinfo=timezone(timedelta(hours=-5)))
+        assert normalize_date(aware) == '2024-01-15T15:30:00Z'
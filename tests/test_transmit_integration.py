@@ -71,7 +71,7 @@ class TestTransmitIntegration:
         # Get the call arguments
         call_args = mock_http_client.post.call_args
         url = call_args[0][0]
-        payload = call_args[1]['json']  # httpx uses 'json' parameter, not 'content'
+        payload = json.loads(call_args[1]['content'])
         
         # Verify URL structure
         assert 'connections/billing/anycost/test-connection-id/billing_drops' in url
@@ -115,7 +115,7 @@ class TestTransmitIntegration:
 
         # Check if data was sent
         if mock_http_client.post.called:
-            payload = mock_http_client.post.call_args[1]['json']
+            payload = json.loads(mock_http_client.post.call_args[1]['content'])
             # All records should be for the specified date
             for record in payload['data']:
                 # API uses CBF field names directly
@@ -209,7 +209,7 @@ class TestTransmitIntegration:
         )
         
         if mock_http_client.post.called:
-            payload = mock_http_client.post.call_args[1]['json']
+            payload = json.loads(mock_http_client.post.call_args[1]['content'])
             assert payload['operation'] == 'replace_hourly'
         
         # Reset mock
@@ -225,7 +225,7 @@ class TestTransmitIntegration:
         )
         
         if mock_http_client.post.called:
-            payload = mock_http_client.post.call_args[1]['json']
+            payload = json.loads(mock_http_client.post.call_args[1]['content'])
             assert payload['operation'] == 'sum'
 
     def test_no_data_handling(self, transmitter, mock_http_client):
@@ -345,7 +345,7 @@ class TestTransmitIntegration:
         )
         
         if mock_http_client.post.called:
-            payload = mock_http_client.post.call_args[1]['json']
+            payload = json.loads(mock_http_client.post.call_args[1]['content'])
             # All timestamps should be in UTC format
             for record in payload['data']:
                 # API uses CBF field names directly
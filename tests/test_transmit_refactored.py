@@ -9,6 +9,8 @@ This test suite demonstrates how the refactoring addresses:
 3. Separation of Concerns: Business logic, I/O, and presentation tested separately
 """
 
+import queue
+
 import pytest
 import polars as pl
 from unittest.mock import Mock, MagicMock, patch
@@ -21,12 +23,15 @@ from ll2cz.transmit_refactored import (
     DataLoader,
     DataTransformer,
     BatchAnalyzer,
+    DailyBatchAssembler,
     TransmitOrchestrator,
+    StreamingTransmitOrchestrator,
     NullOutput,
     CollectingOutput,
     MockTransmitter,
     DataTransmitterV2
 )
+from ll2cz.data_processor import DataProcessor
 
 
 class TestDataModels:
@@ -190,18 +195,19 @@ class TestDataTransformer:
         result = transformer.transform(empty_df, 'usertable')
         assert result.is_empty()
     
+    def test_invalid_workers(self):
+        """At least one worker is required."""
+        with pytest.raises(ValueError, match="Invalid workers"):
+            DataTransformer(workers=0)
+
     def test_transform_with_custom_processor(self):
         """Test transformation with custom processor factory."""
         # Mock processor
         mock_processor = Mock()
-        mock_processor.process_dataframe.return_value = (
-            None,
-            [
-                {'time/usage_start': '2025-01-01T00:00:00Z', 'cost/cost': 0.1},
-                {'time/usage_start': '2025-01-01T01:00:00Z', 'cost/cost': 0.2}
-            ],
-            {}
-        )
+        mock_processor.transform_frame.return_value = pl.DataFrame({
+            'time/usage_start': ['2025-01-01T00:00:00Z', '2025-01-01T01:00:00Z'],
+            'cost/cost': [0.1, 0.2],
+        })
         
         # Custom factory
         processor_factory = Mock(return_value=mock_processor)
@@ -214,8 +220,49 @@ class TestDataTransformer:
         # Verify
         assert len(result) == 2
         processor_factory.assert_called_once_with('custom_source')
-        mock_processor.process_dataframe.assert_called_once()
+        mock_processor.transform_frame.assert_called_once()
     
+    def test_rollup_applies_to_logs_only(self):
+        """With rollup, SpendLogs rows are aggregated per hour before reaching the processor."""
+        mock_processor = Mock()
+        mock_processor.transform_frame.return_value = pl.DataFrame({'cost/cost': [0.3]})
+        transformer = DataTransformer(processor_factory=Mock(return_value=mock_processor), rollup=True)
+        data = pl.DataFrame({
+            'request_id': ['a', 'b'],
+            'start_time': ['2025-01-01 10:05:00', '2025-01-01 10:35:00'],
+            'call_type': ['completion', 'completion'],
+            'spend': [0.1, 0.2],
+        })
+
+        transformer.transform(data, 'logs')
+        rolled = mock_processor.transform_frame.call_args[0][0]
+        assert rolled.rows() == [('2025-01-01T10:00:00Z', 'completion', pytest.approx(0.3))]
+
+        transformer.transform(data, 'usertable')
+        assert mock_processor.transform_frame.call_args[0][0].equals(data)
+
+    def test_direct_transform_matches_row_path(self):
+        """Small datasets go through transform_frame() and give the row path's records and tags."""
+        data = pl.DataFrame({
+            'date': ['2025-01-15', '2025-01-16'],
+            'entity_id': ['user-1', 'user-2'],
+            'entity_type': ['user', 'user'],
+            'model': ['gpt-4o', 'claude-3-haiku'],
+            'custom_llm_provider': ['openai', None],
+            'key_alias': ['team', None],
+            'api_key': ['sk-1', 'sk-2'],
+            'spend': [0.5, 0.25],
+            'prompt_tokens': [10, 20],
+            'completion_tokens': [5, None],
+            'team_id': [None, None],
+        })
+        _, records, _ = DataProcessor(source='usertable').process_dataframe(data)
+
+        result = DataTransformer().transform(data, 'usertable')
+
+        assert 'resource/tag:team_id' not in result.columns
+        assert DataProcessor.records_from_frame(result) == records
+
     def test_chunking_threshold(self):
         """Test that chunking is used for large datasets."""
         # Create transformer with low threshold
@@ -471,6 +518,185 @@ class TestTransmitOrchestrator:
         assert not result.is_successful()
 
 
+class TestDailyBatchAssembler:
+    """Test assembling streamed CBF batches into daily batches."""
+
+    @staticmethod
+    def cbf(*dates):
+        return pl.DataFrame({
+            'time/usage_start': [f'{d}T00:00:00Z' for d in dates],
+            'cost/cost': [0.1] * len(dates)
+        })
+
+    def test_days_complete_when_a_batch_moves_past_them(self):
+        """The day a batch ends on stays open until a later batch or flush."""
+        assembler = DailyBatchAssembler()
+
+        completed = assembler.add(self.cbf('2025-01-03', '2025-01-02', '2025-01-02'))
+        assert [(d, len(df), cont) for d, df, cont in completed] == [('2025-01-03', 1, False)]
+
+        completed = assembler.add(self.cbf('2025-01-02', '2025-01-01'))
+        assert [(d, len(df), cont) for d, df, cont in completed] == [('2025-01-02', 3, False)]
+        assert 'time/usage_start' in completed[0][1].columns
+        assert '__batch_date' not in completed[0][1].columns
+
+        assert [(d, len(df), cont) for d, df, cont in assembler.flush()] == [('2025-01-01', 1, False)]
+        assert assembler.flush() == []
+
+    def test_late_rows_for_emitted_day_are_continuations(self):
+        """Rows arriving for a day that was already returned are flagged as continuations."""
+        assembler = DailyBatchAssembler()
+        assembler.add(self.cbf('2025-01-02', '2025-01-01'))
+
+        completed = assembler.add(self.cbf('2025-01-02', '2025-01-01'))
+
+        assert [(d, cont) for d, _, cont in completed] == [('2025-01-02', True)]
+
+    def test_ignores_rows_without_usage_start(self):
+        """Empty frames and rows without time/usage_start produce no batches."""
+        assembler = DailyBatchAssembler()
+        assert assembler.add(pl.DataFrame()) == []
+        assert assembler.add(pl.DataFrame({'time/usage_start': [None]}, schema={'time/usage_start': pl.Utf8})) == []
+        assert assembler.flush() == []
+
+
+class TestStreamingTransmitOrchestrator:
+    """Test streaming extraction, transformation and upload."""
+
+    @staticmethod
+    def make_orchestrator(batches, transmitter=None, queue_size=1, upload_concurrency=1):
+        loader = Mock()
+        loader.get_date_description.return_value = None
+        loader.iter_data.return_value = iter(batches)
+
+        transformer = Mock()
+        transformer.transform.side_effect = lambda data, source: data
+
+        return StreamingTransmitOrchestrator(
+            RequestValidator(),
+            loader,
+            transformer,
+            BatchAnalyzer(),
+            transmitter or MockTransmitter(),
+            CollectingOutput(),
+            batch_size=2,
+            queue_size=queue_size,
+            upload_concurrency=upload_concurrency
+        )
+
+    def test_transmits_one_batch_per_day(self):
+        """Each day is transmitted once, with all of its rows, in stream order."""
+        batches = [
+            TestDailyBatchAssembler.cbf('2025-01-03', '2025-01-02'),
+            TestDailyBatchAssembler.cbf('2025-01-02', '2025-01-01'),
+            TestDailyBatchAssembler.cbf('2025-01-01'),
+        ]
+        orchestrator = self.make_orchestrator(batches)
+
+        result = orchestrator.execute(TransmitRequest(mode='all'))
+
+        assert result.status == 'success'
+        assert result.records == 5
+        assert result.batches == 3
+        transmitter = orchestrator.transmitter
+        assert [df['time/usage_start'][0][:10] for df in transmitter.transmitted_data] == [
+            '2025-01-03', '2025-01-02', '2025-01-01'
+        ]
+        assert [len(df) for df in transmitter.transmitted_data] == [1, 2, 2]
+        assert transmitter.operations == ['replace_hourly'] * 3
+        orchestrator.data_loader.iter_data.assert_called_once()
+        assert orchestrator.data_loader.iter_data.call_args[0][1] == 2
+
+    def test_continuation_rows_are_summed(self):
+        """A day that reappears after being sent is appended rather than replaced."""
+        batches = [
+            TestDailyBatchAssembler.cbf('2025-01-02', '2025-01-01'),
+            TestDailyBatchAssembler.cbf('2025-01-02'),
+        ]
+        orchestrator = self.make_orchestrator(batches)
+
+        orchestrator.execute(TransmitRequest(mode='all'))
+
+        assert orchestrator.transmitter.operations == ['replace_hourly', 'replace_hourly', 'sum']
+
+    def test_no_data(self):
+        """An empty stream reports no_data without transmitting."""
+        orchestrator = self.make_orchestrator([pl.DataFrame()])
+
+        result = orchestrator.execute(TransmitRequest(mode='all'))
+
+        assert result.status == 'no_data'
+        assert orchestrator.transmitter.call_count == 0
+
+    def test_transmit_error_stops_producer(self):
+        """A failed upload stops the producer and is reported as an error."""
+        transmitter = Mock()
+        transmitter.transmit.side_effect = RuntimeError("upload failed")
+        batches = [TestDailyBatchAssembler.cbf(f'2025-01-{day:02d}') for day in range(30, 0, -1)]
+        orchestrator = self.make_orchestrator(batches, transmitter=transmitter)
+
+        result = orchestrator.execute(TransmitRequest(mode='all'))
+
+        assert result.status == 'error'
+        assert result.error == "upload failed"
+        assert transmitter.transmit.call_count == 1
+
+    def test_extraction_error_is_reported(self):
+        """Errors raised while extracting are surfaced after the queue drains."""
+        def failing_batches():
+            yield TestDailyBatchAssembler.cbf('2025-01-02', '2025-01-01')
+            raise RuntimeError("connection lost")
+
+        orchestrator = self.make_orchestrator(failing_batches())
+
+        result = orchestrator.execute(TransmitRequest(mode='all'))
+
+        assert result.status == 'error'
+        assert result.error == "connection lost"
+        assert orchestrator.transmitter.call_count == 1
+
+    def test_test_mode_uses_regular_flow(self):
+        """Test mode previews the loaded data instead of streaming it."""
+        orchestrator = self.make_orchestrator([])
+        orchestrator.data_loader.load_data.return_value = TestDailyBatchAssembler.cbf('2025-01-01')
+
+        result = orchestrator.execute(TransmitRequest(mode='all', test=True))
+
+        assert result.status == 'test'
+        orchestrator.data_loader.iter_data.assert_not_called()
+
+    def test_invalid_queue_size(self):
+        """Queue size must be positive."""
+        with pytest.raises(ValueError, match="Invalid queue_size"):
+            self.make_orchestrator([], queue_size=0)
+
+    def test_invalid_upload_concurrency(self):
+        """Upload concurrency must be positive."""
+        with pytest.raises(ValueError, match="Invalid upload_concurrency"):
+            self.make_orchestrator([], upload_concurrency=0)
+
+    def test_ready_days_are_transmitted_together(self):
+        """Days already waiting are handed over together, up to upload_concurrency, split by operation."""
+        orchestrator = self.make_orchestrator([], upload_concurrency=3)
+        assert orchestrator.queue_size == 3
+
+        day_queue = queue.Queue()
+        for batch_date, is_continuation in [('2025-01-03', False), ('2025-01-02', False),
+                                            ('2025-01-03', True), ('2025-01-01', False)]:
+            day_queue.put((batch_date, TestDailyBatchAssembler.cbf(batch_date), is_continuation))
+        day_queue.put(orchestrator._END)
+
+        days, finished = orchestrator._take_ready_days(day_queue)
+        assert [day[0] for day in days] == ['2025-01-03', '2025-01-02', '2025-01-03']
+        assert not finished
+        groups = orchestrator._group_by_operation(days, 'replace_hourly')
+        assert [(operation, len(group)) for operation, group in groups] == [('replace_hourly', 2), ('sum', 1)]
+
+        days, finished = orchestrator._take_ready_days(day_queue)
+        assert [day[0] for day in days] == ['2025-01-01']
+        assert finished
+
+
 class TestDataTransmitterV2:
     """Test the main API class."""
     
@@ -531,6 +757,20 @@ class TestDataTransmitterV2:
         assert transmitter.orchestrator.transmitter is custom_transmitter
 
 
+    def test_max_drop_bytes_passed_through(self):
+        """The default transmitter keeps the streamer's default, None (no limit) and rejects 0."""
+        from ll2cz.output import CloudZeroStreamer
+
+        def streamer(**kwargs):
+            return DataTransmitterV2(database=Mock(), cz_api_key='test-key', cz_connection_id='test-id',
+                                     **kwargs).transmitter.streamer
+
+        assert streamer().max_drop_bytes == CloudZeroStreamer.DEFAULT_MAX_DROP_BYTES
+        assert streamer(max_drop_bytes=None).max_drop_bytes is None
+        assert streamer(max_drop_bytes=1024).max_drop_bytes == 1024
+        with pytest.raises(ValueError, match="Invalid max_drop_bytes"):
+            streamer(max_drop_bytes=0)
+
 class TestRefactoringBenefits:
     """Tests that demonstrate the benefits of the refactoring."""
     
@@ -3,6 +3,7 @@
 
 """Tests for transmit functionality with SQLite database and mocked HTTP calls."""
 
+import json
 import os
 from unittest.mock import Mock, patch
 
@@ -12,6 +13,7 @@ import pytest
 from ll2cz.database import LiteLLMDatabase
 from ll2cz.output import CloudZeroStreamer
 from ll2cz.transmit import DataTransmitter
+from ll2cz.transmit_refactored import DataTransmitterV2, NullOutput
 
 
 class TestTransmitWithSQLite:
@@ -75,7 +77,7 @@ class TestTransmitWithSQLite:
             # Get the call arguments
             call_args = mock_http_client.post.call_args
             url = call_args[0][0]
-            payload = call_args[1]['json']
+            payload = json.loads(call_args[1]['content'])
             
             # Verify URL structure
             assert 'connections/billing/anycost/test-connection-id/billing_drops' in url
@@ -208,7 +210,7 @@ class TestTransmitWithSQLite:
         )
         
         if result['status'] == 'success' and mock_http_client.post.called:
-            payload = mock_http_client.post.call_args[1]['json']
+            payload = json.loads(mock_http_client.post.call_args[1]['content'])
             assert payload['operation'] == 'replace_hourly'
         
         # Reset mock
@@ -224,9 +226,33 @@ class TestTransmitWithSQLite:
         )
         
         if result['status'] == 'success' and mock_http_client.post.called:
-            payload = mock_http_client.post.call_args[1]['json']
+            payload = json.loads(mock_http_client.post.call_args[1]['content'])
             assert payload['operation'] == 'sum'
 
+    def test_streaming_matches_batch_transmit(self, sqlite_db, mock_http_client):
+        """Streaming mode sends the same daily batches as loading everything up front."""
+        def sent_batches():
+            batches = {}
+            for call in mock_http_client.post.call_args_list:
+                data = json.loads(call[1]['content'])['data']
+                batches[data[0]['time/usage_start'][:10]] = sorted(
+                    (record['resource/tag:czrn'], record['cost/cost']) for record in data
+                )
+            return batches
+
+        DataTransmitterV2(database=sqlite_db, cz_api_key='test-api-key', cz_connection_id='test-connection-id',
+                          output=NullOutput()).transmit(mode='all', limit=200)
+        expected = sent_batches()
+        mock_http_client.reset_mock()
+
+        result = DataTransmitterV2(database=sqlite_db, cz_api_key='test-api-key', cz_connection_id='test-connection-id',
+                                   output=NullOutput(), stream=True, batch_size=7).transmit(mode='all', limit=200)
+
+        assert result['status'] == 'success'
+        assert result['records'] == sum(len(batch) for batch in expected.values())
+        assert sent_batches() == expected
+        assert {json.loads(call[1]['content'])['operation'] for call in mock_http_client.post.call_args_list} == {'replace_hourly'}
+
     def test_no_data_handling(self, transmitter, mock_http_client):
         """Test handling when no data is available."""
         # Mock empty data response
@@ -308,7 +334,7 @@ class TestTransmitWithSQLite:
         )
         
         if result['status'] == 'success' and mock_http_client.post.called:
-            payload = mock_http_client.post.call_args[1]['json']
+            payload = json.loads(mock_http_client.post.call_args[1]['content'])
             # All timestamps should be in UTC format
             for record in payload['data']:
                 timestamp = record['time/usage_start']